@@ -0,0 +1,107 @@
+"""Benchmark: tool result serialization for a large full-statements response.
+
+Compares the previous path (``msgspec.to_builtins`` → FastMCP text + structured content)
+with ``deps.to_result`` (one msgspec encode straight from the Structs), in
+both row and columnar formats.
+
+    uv run python benchmarks/bench_serialization.py [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import msgspec
+import pydantic_core
+from mcp.types import CallToolResult, TextContent
+from opendart_fss.models.financial import FinancialAccount
+
+from opendart_fss_mcp import deps
+from opendart_fss_mcp.deps import to_result
+
+deps._inline_max_bytes = sys.maxsize  # measure inline encoding, not result handles
+
+_SJ = [("BS", "재무상태표"), ("IS", "손익계산서"), ("CIS", "포괄손익계산서"),
+       ("CF", "현금흐름표"), ("SCE", "자본변동표")]  # fmt: skip
+
+
+def make_rows(n: int) -> list[FinancialAccount]:
+    rows = []
+    for i in range(n):
+        sj_div, sj_nm = _SJ[i % len(_SJ)]
+        rows.append(
+            FinancialAccount(
+                rcept_no="20250311001085",
+                reprt_code="11011",
+                bsns_year="2024",
+                corp_code="00126380",
+                sj_div=sj_div,
+                sj_nm=sj_nm,
+                account_id=f"ifrs-full_Account{i}",
+                account_nm=f"계정과목 {i}",
+                account_detail="-",
+                thstrm_nm="제 56 기",
+                thstrm_amount=f"{i * 1_234_567:,}".replace(",", ""),
+                frmtrm_nm="제 55 기",
+                frmtrm_amount=f"{i * 1_111_111}",
+                bfefrmtrm_nm="제 54 기",
+                bfefrmtrm_amount=f"{i * 999_999}",
+                ord=str(i),
+                currency="KRW",
+            )
+        )
+    return rows
+
+
+def legacy(rows: list[FinancialAccount]) -> str:
+    result = msgspec.to_builtins(rows)
+    text = pydantic_core.to_json(result, fallback=str).decode()
+    structured = pydantic_core.to_jsonable_python({"result": result})
+    return CallToolResult(
+        content=[TextContent(type="text", text=text)], structuredContent=structured
+    ).model_dump_json(by_alias=True, exclude_none=True)
+
+
+def fast(rows: list[FinancialAccount]) -> str:
+    return CallToolResult(content=to_result(rows).content).model_dump_json(
+        by_alias=True, exclude_none=True
+    )
+
+
+def columnar(rows: list[FinancialAccount]) -> str:
+    return CallToolResult(
+        content=to_result(rows, format="columnar").content
+    ).model_dump_json(by_alias=True, exclude_none=True)
+
+
+def measure(fn: Callable[[list], str], rows: list, repeat: int = 20) -> dict:
+    fn(rows)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        payload = fn(rows)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    fn(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ms": elapsed * 1000, "peak_kib": peak / 1024, "bytes": len(payload)}
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    rows = make_rows(n)
+    print(f"rows={n}")
+    for name, fn in (("legacy", legacy), ("to_result", fast), ("columnar", columnar)):
+        r = measure(fn, rows)
+        print(
+            f"{name:>10}: {r['ms']:8.2f} ms  peak {r['peak_kib']:10.1f} KiB  "
+            f"message {r['bytes']:,} bytes"
+        )
+
+
+if __name__ == "__main__":
+    main()
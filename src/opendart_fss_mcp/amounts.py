@@ -0,0 +1,39 @@
+"""Parsing of OpenDART amount strings ("1,234", "-", "(1,234)") to numbers."""
+
+from __future__ import annotations
+
+_MISSING = frozenset({"", "-", "–", "—"})
+
+
+def parse_amount(value: str | None) -> int | float | None:
+    """Convert an OpenDART amount string to a number, or None if absent.
+
+    Thousands separators are dropped and accounting-style parentheses mean
+    a negative amount. Values with a fractional part are returned as float.
+
+    Examples:
+        >>> parse_amount("1,234,567")
+        1234567
+        >>> parse_amount("(1,000)")
+        -1000
+        >>> parse_amount("12.5")
+        12.5
+        >>> parse_amount("-") is None
+        True
+    """
+    if value is None:
+        return None
+    text = value.strip().replace(",", "")
+    if text in _MISSING:
+        return None
+    negative = text.startswith("(") and text.endswith(")")
+    if negative:
+        text = text[1:-1]
+    try:
+        number: int | float = int(text)
+    except ValueError:
+        try:
+            number = float(text)
+        except ValueError:
+            return None
+    return -number if negative else number
@@ -0,0 +1,135 @@
+"""Circuit breaker that fails fast while OpenDART is degraded."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from enum import StrEnum
+
+_DEFAULT_ERROR_RATE = 0.5
+_DEFAULT_COOLDOWN_SECONDS = 30.0
+_DEFAULT_WINDOW_SECONDS = 60.0
+_DEFAULT_MIN_CALLS = 10
+
+
+class BreakerState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class Permit:
+    """Handed out by ``allow()`` and passed back with the call's outcome."""
+
+    __slots__ = ()
+
+
+_PASS = Permit()  # shared by all calls made while the breaker is closed
+
+
+class CircuitBreaker:
+    """Error-rate circuit breaker over a sliding time window.
+
+    - closed: calls pass; opens once at least ``min_calls`` outcomes in the
+      window have an error rate >= ``error_rate``.
+    - open: calls are rejected until ``cooldown`` seconds have passed.
+    - half_open: a single probe call is let through; its success closes the
+      breaker, its failure re-opens it. Outcomes of calls started before
+      the breaker opened are ignored.
+    """
+
+    def __init__(
+        self,
+        *,
+        error_rate: float = _DEFAULT_ERROR_RATE,
+        cooldown: float = _DEFAULT_COOLDOWN_SECONDS,
+        window: float = _DEFAULT_WINDOW_SECONDS,
+        min_calls: int = _DEFAULT_MIN_CALLS,
+    ) -> None:
+        self.error_rate = error_rate
+        self.cooldown = cooldown
+        self.window = window
+        self.min_calls = min_calls
+        self._state = BreakerState.CLOSED
+        self._outcomes: deque[tuple[float, bool]] = deque()  # (timestamp, ok)
+        self._opened_at = 0.0
+        self._probe: Permit | None = None
+        self._probe_started = 0.0
+
+    @property
+    def state(self) -> BreakerState:
+        if (
+            self._state == BreakerState.OPEN
+            and time.monotonic() - self._opened_at >= self.cooldown
+        ):
+            self._state = BreakerState.HALF_OPEN
+            self._probe = None
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until the breaker will let a probe through."""
+        if self.state != BreakerState.OPEN:
+            return 0.0
+        return max(self.cooldown - (time.monotonic() - self._opened_at), 0.0)
+
+    def allow(self) -> Permit | None:
+        """Return a permit if a call may be issued now, else None."""
+        state = self.state
+        if state == BreakerState.CLOSED:
+            return _PASS
+        if state == BreakerState.HALF_OPEN:
+            now = time.monotonic()
+            # a probe that never reported back (e.g. cancelled) does not block forever
+            if self._probe is None or now - self._probe_started >= self.cooldown:
+                self._probe = Permit()
+                self._probe_started = now
+                return self._probe
+        return None
+
+    def record_success(self, permit: Permit | None = None) -> None:
+        if self._state == BreakerState.HALF_OPEN:
+            if permit is not None and permit is self._probe:
+                self._state = BreakerState.CLOSED
+                self._outcomes.clear()
+                self._probe = None
+            return
+        self._record(ok=True)
+
+    def record_failure(self, permit: Permit | None = None) -> None:
+        if self._state == BreakerState.HALF_OPEN:
+            if permit is not None and permit is self._probe:
+                self._trip()
+            return
+        self._record(ok=False)
+        if self._state == BreakerState.CLOSED and self._should_trip():
+            self._trip()
+
+    def _record(self, *, ok: bool) -> None:
+        now = time.monotonic()
+        self._outcomes.append((now, ok))
+        cutoff = now - self.window
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
+
+    def _should_trip(self) -> bool:
+        total = len(self._outcomes)
+        if total < self.min_calls:
+            return False
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        return failures / total >= self.error_rate
+
+    def _trip(self) -> None:
+        self._state = BreakerState.OPEN
+        self._opened_at = time.monotonic()
+        self._probe = None
+        self._outcomes.clear()
+
+    def snapshot(self) -> dict:
+        total = len(self._outcomes)
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        return {
+            "state": self.state.value,
+            "error_rate": round(failures / total, 3) if total else 0.0,
+            "calls_in_window": total,
+            "retry_after": round(self.retry_after(), 1),
+        }
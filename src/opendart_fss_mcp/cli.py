@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from enum import StrEnum
+from pathlib import Path
 
 import typer
 from dotenv import load_dotenv
@@ -24,6 +26,7 @@ class Transport(StrEnum):
 
 @app.callback()
 def serve(
+    ctx: typer.Context,
     transport: Transport = typer.Option(
         Transport.STDIO,
         envvar="OPENDART_MCP_TRANSPORT",
@@ -34,17 +37,70 @@ def serve(
     ),
     port: int = typer.Option(8000, envvar="OPENDART_MCP_PORT", help="HTTP port"),
     api_key: str | None = typer.Option(
-        None, envvar="OPENDART_API_KEY", help="OpenDART API key"
+        None, envvar="OPENDART_API_KEY", help="OpenDART API key(s), comma-separated"
     ),
     log_level: str = typer.Option(
         "INFO", envvar="OPENDART_MCP_LOG_LEVEL", help="Log level"
     ),
+    breaker_error_rate: float = typer.Option(
+        0.5,
+        envvar="OPENDART_MCP_BREAKER_ERROR_RATE",
+        help="Upstream error rate (0-1) that opens the circuit breaker",
+    ),
+    breaker_cooldown: float = typer.Option(
+        30.0,
+        envvar="OPENDART_MCP_BREAKER_COOLDOWN",
+        help="Seconds the circuit breaker stays open before probing",
+    ),
+    negative_cache_ttl: float = typer.Option(
+        600.0,
+        envvar="OPENDART_MCP_NEGATIVE_CACHE_TTL",
+        help="Seconds to remember 'no data' results (0 disables)",
+    ),
+    hedge: bool = typer.Option(
+        False,
+        envvar="OPENDART_MCP_HEDGE",
+        help="Re-issue slow read calls once and take the first response",
+    ),
+    hedge_percentile: float = typer.Option(
+        95.0,
+        envvar="OPENDART_MCP_HEDGE_PERCENTILE",
+        help="Latency percentile after which a hedged request is sent",
+    ),
+    max_concurrency: int = typer.Option(
+        64,
+        envvar="OPENDART_MCP_MAX_CONCURRENCY",
+        help="Upper bound for the adaptive in-flight upstream call limit",
+    ),
+    inline_max_bytes: int = typer.Option(
+        100_000,
+        envvar="OPENDART_MCP_INLINE_MAX_BYTES",
+        help="List results larger than this are stored and returned as a paged handle",
+    ),
+    data_dir: str | None = typer.Option(
+        None,
+        envvar="OPENDART_MCP_DATA_DIR",
+        help="Directory for locally stored data (disclosure index, document archive)",
+    ),
 ) -> None:
     """OpenDART MCP 서버를 시작합니다."""
-    from opendart_fss_mcp import deps
-    from opendart_fss_mcp.server import mcp
+    from opendart_fss_mcp import deps, storage
 
-    deps.configure(api_key)
+    deps.configure(
+        api_key,
+        breaker_error_rate=breaker_error_rate,
+        breaker_cooldown=breaker_cooldown,
+        negative_cache_ttl=negative_cache_ttl,
+        hedge=hedge,
+        hedge_percentile=hedge_percentile,
+        max_concurrency=max_concurrency,
+        inline_max_bytes=inline_max_bytes,
+    )
+    storage.configure(data_dir)
+    if ctx.invoked_subcommand is not None:
+        return  # the options above are shared with subcommands such as export
+
+    from opendart_fss_mcp.server import mcp
 
     kwargs: dict = {"transport": transport.value, "log_level": log_level}
     if transport == Transport.HTTP:
@@ -52,3 +108,79 @@ def serve(
         kwargs["port"] = port
 
     mcp.run(**kwargs)
+
+
+@app.command()
+def export(
+    output: Path = typer.Argument(..., help="Output directory"),
+    bgn_year: int = typer.Option(..., help="First business year"),
+    end_year: int | None = typer.Option(
+        None, help="Last business year (default: bgn-year)"
+    ),
+    corp_codes: str | None = typer.Option(
+        None, help="Comma-separated corp codes (default: every listed company)"
+    ),
+    reprt_code: str = typer.Option(
+        "11011", help="Report code: 11011 annual, 11012 half, 11013 Q1, 11014 Q3"
+    ),
+    fs_div: str = typer.Option("CFS", help="CFS consolidated | OFS separate"),
+    format: str = typer.Option("parquet", help="Output format: parquet | arrow"),
+    batch_size: int = typer.Option(
+        100, min=1, help="Companies per part file and checkpoint"
+    ),
+    concurrency: int = typer.Option(8, min=1, help="Concurrent OpenDART requests"),
+) -> None:
+    """Export full financial statements to Parquet/Arrow files (resumable)."""
+    from fastmcp.exceptions import ToolError
+
+    from opendart_fss_mcp.deps import get_client
+    from opendart_fss_mcp.export import (
+        ExportFormat,
+        export_statements,
+        require_pyarrow,
+    )
+    from opendart_fss_mcp.tools.financial import split_corp_codes
+
+    try:
+        export_format = ExportFormat(format)
+    except ValueError:
+        raise typer.BadParameter(
+            "must be parquet or arrow", param_hint="--format"
+        ) from None
+    years = [str(y) for y in range(bgn_year, (end_year or bgn_year) + 1)]
+    if not years:
+        raise typer.BadParameter(
+            "must not be after --end-year", param_hint="--bgn-year"
+        )
+
+    async def run() -> None:
+        summary = await export_statements(
+            get_client(),
+            split_corp_codes(corp_codes) if corp_codes else None,
+            years,
+            output,
+            reprt_code=reprt_code,
+            fs_div=fs_div,
+            format=export_format,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            progress=typer.echo,
+        )
+        typer.echo(
+            f"Done: {summary.rows} rows in {summary.batches} batches "
+            f"({summary.skipped} already exported, {len(summary.empty)} without data)"
+        )
+        if summary.failed:
+            typer.echo(
+                f"{len(summary.failed)} requests failed; run again to retry:", err=True
+            )
+            for line in summary.failed:
+                typer.echo(f"  {line}", err=True)
+            raise typer.Exit(1)
+
+    try:
+        require_pyarrow()
+        asyncio.run(run())
+    except (ImportError, ToolError) as e:
+        typer.echo(str(e), err=True)
+        raise typer.Exit(1) from None
@@ -0,0 +1,316 @@
+"""API key pool: one OpenDartClient per key, quota-aware routing and failover."""
+
+from __future__ import annotations
+
+import io
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+from collections.abc import Callable, Generator
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from opendart_fss import OpenDartClient
+from opendart_fss.constants import StatusCode
+from opendart_fss.exceptions import (
+    APIError,
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    ValidationError,
+    raise_for_status,
+)
+
+from opendart_fss_mcp.concurrency import AdaptiveLimiter
+
+KST = ZoneInfo("Asia/Seoul")
+
+_DAILY_QUOTA = 20_000  # OpenDART daily request limit per key
+_TEMPORARY_BLOCK_SECONDS = 60.0  # cool-down after a per-minute "020"
+_DAILY_BLOCK_THRESHOLD = 0.9  # a "020" this close to the quota means the day is spent
+
+# OpenDART status codes (개발가이드 "메시지 설명") that the SDK files under a
+# different exception class than their documented meaning.
+_STATUS_ERRORS: dict[str, type[APIError]] = {
+    "013": NotFoundError,  # 조회된 데이타가 없습니다
+    "014": NotFoundError,  # 파일이 존재하지 않습니다
+    "020": RateLimitError,  # 요청 제한을 초과하였습니다
+    "100": ValidationError,  # 필드의 부적절한 값입니다
+}
+
+_SECTIONS = (
+    "disclosure",
+    "report",
+    "financial",
+    "shareholder",
+    "major_event",
+    "registration",
+)
+
+
+def parse_api_keys(raw: str | None) -> list[str]:
+    """Split a comma/whitespace separated key list, dropping blanks and duplicates."""
+    if not raw:
+        return []
+    keys: list[str] = []
+    for part in raw.replace(",", " ").split():
+        if part not in keys:
+            keys.append(part)
+    return keys
+
+
+def reclassify(e: APIError) -> APIError:
+    """Re-type an SDK error according to OpenDART's documented status codes."""
+    error_class = _STATUS_ERRORS.get(e.status or "")
+    if error_class is None or type(e) is error_class:
+        return e
+    return error_class(e.status, e.message)
+
+
+def check_download(data: bytes) -> None:
+    """Raise the error a download reply carries instead of the expected ZIP.
+
+    The SDK returns download bodies unchecked; on failure OpenDART answers
+    with a small ``<result><status>…</status><message>…</message></result>``
+    document in place of the file.
+    """
+    if zipfile.is_zipfile(io.BytesIO(data)):
+        return
+    try:
+        root = ET.fromstring(data)
+    except ET.ParseError:
+        root = None
+    if root is not None and (status := root.findtext("status")):
+        raise_for_status(status, root.findtext("message"))
+    raise ServerError("900", "ZIP 파일 대신 알 수 없는 응답을 받았습니다")
+
+
+def _seconds_until_kst_midnight() -> float:
+    now = datetime.now(KST)
+    tomorrow = (now + timedelta(days=1)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    return (tomorrow - now).total_seconds()
+
+
+@dataclass(slots=True)
+class KeySlot:
+    api_key: str
+    client: Any  # OpenDartClient (or a test double)
+    daily_quota: int
+    used: int = 0
+    quota_day: date = field(default_factory=lambda: datetime.now(KST).date())
+    blocked_until: float = 0.0  # time.monotonic() deadline
+    disabled: bool = False  # AuthenticationError: key is unusable
+
+    @property
+    def remaining(self) -> int:
+        return max(self.daily_quota - self.used, 0)
+
+    def roll_day(self, today: date) -> None:
+        """Reset the daily counter when the KST date changes."""
+        if today != self.quota_day:
+            self.quota_day = today
+            self.used = 0
+            self.blocked_until = 0.0
+
+    def is_available(self, now: float) -> bool:
+        return not self.disabled and now >= self.blocked_until and self.remaining > 0
+
+    def block(self, status: str | None) -> None:
+        # "020" covers both the per-minute burst limit and the daily quota
+        if status == "020" and self.used < self.daily_quota * _DAILY_BLOCK_THRESHOLD:
+            seconds = _TEMPORARY_BLOCK_SECONDS
+        else:
+            seconds = _seconds_until_kst_midnight()
+        self.blocked_until = time.monotonic() + seconds
+
+
+def _freeze(value: Any) -> Any:
+    """Make a ``params={...}`` style keyword argument hashable."""
+    if isinstance(value, dict):
+        return tuple(sorted(value.items()))
+    return value
+
+
+class ApiCall:
+    """A deferred SDK call (``client.<section>.<method>(...)``) that can be re-issued.
+
+    Awaiting it runs the call through the owning pool, so existing
+    ``await client.disclosure.search(...)`` call sites keep working.
+    """
+
+    __slots__ = ("_pool", "args", "kwargs", "method", "section")
+
+    def __init__(
+        self, pool: ClientPool, section: str, method: str, /, *args: Any, **kwargs: Any
+    ) -> None:
+        self._pool = pool
+        self.section = section
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+
+    @property
+    def pool(self) -> ClientPool:
+        return self._pool
+
+    @property
+    def endpoint(self) -> str:
+        return f"{self.section}.{self.method}"
+
+    @property
+    def key(self) -> tuple:
+        """Hashable identity of endpoint + arguments, for result caching."""
+        return (
+            self.endpoint,
+            self.args,
+            tuple(sorted((k, _freeze(v)) for k, v in self.kwargs.items())),
+        )
+
+    def bind(self, client: Any) -> Any:
+        """Create the coroutine for *client*."""
+        section = getattr(client, self.section)
+        return getattr(section, self.method)(*self.args, **self.kwargs)
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        return self._pool.execute(self).__await__()
+
+    def __repr__(self) -> str:
+        return f"ApiCall({self.endpoint}, kwargs={self.kwargs!r})"
+
+
+class _Section:
+    __slots__ = ("_name", "_pool")
+
+    def __init__(self, pool: ClientPool, name: str) -> None:
+        self._pool = pool
+        self._name = name
+
+    def __getattr__(self, method: str) -> Callable[..., ApiCall]:
+        pool, section = self._pool, self._name
+
+        def make_call(*args: Any, **kwargs: Any) -> ApiCall:
+            return ApiCall(pool, section, method, *args, **kwargs)
+
+        return make_call
+
+
+class PooledClient:
+    """Drop-in stand-in for OpenDartClient whose calls are routed by a ClientPool."""
+
+    def __init__(self, pool: ClientPool) -> None:
+        self.pool = pool
+        for name in _SECTIONS:
+            setattr(self, name, _Section(pool, name))
+
+
+class ClientPool:
+    """Routes each call to the key with the most remaining daily quota.
+
+    Keys that raise ``RateLimitError`` are parked until their limit resets and
+    keys that raise ``AuthenticationError`` are disabled; in both cases the
+    call fails over to the next best key. Every SDK call runs inside a slot
+    of the shared adaptive concurrency *limiter*, when one is given. A
+    download that returns a status reply instead of a ZIP raises that status.
+    """
+
+    def __init__(
+        self,
+        api_keys: list[str],
+        *,
+        daily_quota: int = _DAILY_QUOTA,
+        client_factory: Callable[[str], Any] = OpenDartClient,
+        limiter: AdaptiveLimiter | None = None,
+    ) -> None:
+        if not api_keys:
+            raise ValueError(
+                "API key is required. "
+                "Provide api_key parameter or set OPENDART_API_KEY environment variable."
+            )
+        self._slots = [
+            KeySlot(api_key=key, client=client_factory(key), daily_quota=daily_quota)
+            for key in api_keys
+        ]
+        self._limiter = limiter
+
+    @property
+    def slots(self) -> list[KeySlot]:
+        return self._slots
+
+    def remaining_quota(self) -> int:
+        """Total remaining quota across currently usable keys."""
+        now = time.monotonic()
+        today = datetime.now(KST).date()
+        total = 0
+        for slot in self._slots:
+            slot.roll_day(today)
+            if slot.is_available(now):
+                total += slot.remaining
+        return total
+
+    def _pick(self, tried: set[str]) -> KeySlot | None:
+        now = time.monotonic()
+        today = datetime.now(KST).date()
+        best: KeySlot | None = None
+        for slot in self._slots:
+            slot.roll_day(today)
+            if slot.api_key in tried or not slot.is_available(now):
+                continue
+            if best is None or slot.remaining > best.remaining:
+                best = slot
+        return best
+
+    async def execute(self, call: ApiCall) -> Any:
+        tried: set[str] = set()
+        last_error: Exception | None = None
+        while (slot := self._pick(tried)) is not None:
+            tried.add(slot.api_key)
+            slot.used += 1
+            try:
+                if self._limiter is None:
+                    result = await call.bind(slot.client)
+                else:
+                    result = await self._limiter.run(partial(call.bind, slot.client))
+                if isinstance(result, bytes):  # every SDK download is a ZIP
+                    check_download(result)
+                return result
+            except APIError as e:
+                error = reclassify(e)
+                if isinstance(error, AuthenticationError):
+                    slot.disabled = True
+                elif isinstance(error, RateLimitError):
+                    slot.block(error.status)
+                elif error is e:
+                    raise
+                else:
+                    raise error from e
+                last_error = error
+        if last_error is not None:
+            raise last_error
+        if all(slot.disabled for slot in self._slots):
+            raise AuthenticationError(
+                StatusCode.INVALID_KEY, "사용 가능한 API 키가 없습니다"
+            )
+        raise RateLimitError(
+            "020",
+            "모든 API 키의 요청 한도가 소진되었습니다",
+        )
+
+    def stats(self) -> list[dict]:
+        """Per-key usage, with keys masked for display."""
+        now = time.monotonic()
+        return [
+            {
+                "key": f"{slot.api_key[:4]}…",
+                "used": slot.used,
+                "remaining": slot.remaining,
+                "available": slot.is_available(now),
+                "disabled": slot.disabled,
+            }
+            for slot in self._slots
+        ]
@@ -0,0 +1,122 @@
+"""AIMD adaptive concurrency limit for upstream SDK calls."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+from opendart_fss.exceptions import ServerError
+
+_INITIAL_LIMIT = 8.0
+_MIN_LIMIT = 1.0
+_MAX_LIMIT = 64.0
+_BACKOFF = 0.5  # multiplicative decrease factor
+_LATENCY_TOLERANCE = 2.0  # "flat" = within 2x of the best recent latency
+_BASELINE_SAMPLES = 100
+_DECREASE_COOLDOWN_SECONDS = 1.0  # one decrease per burst of failures
+
+
+def _is_overload(e: BaseException) -> bool:
+    return isinstance(e, (ServerError, httpx.TimeoutException))
+
+
+class AdaptiveLimiter:
+    """Additive-increase / multiplicative-decrease limit on in-flight calls.
+
+    The limit grows by ~1 per round of successful calls whose latency stays
+    within ``_LATENCY_TOLERANCE`` of the recent minimum, and is halved on
+    timeouts or ``ServerError``.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: float = _INITIAL_LIMIT,
+        min_limit: float = _MIN_LIMIT,
+        max_limit: float = _MAX_LIMIT,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._limit = min(max(initial, min_limit), max_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._latencies: deque[float] = deque(maxlen=_BASELINE_SAMPLES)
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                self._wake()  # pass on a wake-up this waiter can no longer use
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self._in_flight += 1
+
+    def release(self, latency: float | None, *, overloaded: bool = False) -> None:
+        self._in_flight -= 1
+        if overloaded:
+            self._decrease()
+        elif latency is not None:
+            self._on_success(latency)
+        self._wake()
+
+    def _on_success(self, latency: float) -> None:
+        self._latencies.append(latency)
+        baseline = min(self._latencies)
+        # only grow when the current limit is actually being used
+        if (
+            latency <= baseline * _LATENCY_TOLERANCE
+            and self._in_flight + 1 >= self._limit / 2
+        ):
+            self._limit = min(self._limit + 1 / self._limit, self.max_limit)
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < _DECREASE_COOLDOWN_SECONDS:
+            return
+        self._last_decrease = now
+        self._limit = max(self._limit * _BACKOFF, self.min_limit)
+
+    def _wake(self) -> None:
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    async def run(self, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Create and await ``factory()`` inside a concurrency slot."""
+        await self.acquire()
+        start = time.monotonic()
+        try:
+            result = await factory()
+        except BaseException as e:
+            self.release(None, overloaded=_is_overload(e))
+            raise
+        self.release(time.monotonic() - start)
+        return result
+
+    def snapshot(self) -> dict:
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+        }
@@ -161,6 +161,11 @@ class CorpCodeCache:
 
         return results[:max_results]
 
+    async def listed(self, client: OpenDartClient) -> list[CorpCodeEntry]:
+        """Every company with a stock code, in corp code file order."""
+        await self._ensure_loaded(client)
+        return list(self._by_stock_code.values())
+
     async def summary(self, client: OpenDartClient) -> dict:
         await self._ensure_loaded(client)
         total = len(self._entries)
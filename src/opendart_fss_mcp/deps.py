@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+from collections.abc import Iterable
 from typing import Any
 
+import httpx
 import msgspec
 from fastmcp.exceptions import ToolError
-from opendart_fss import OpenDartClient
+from fastmcp.tools.tool import ToolResult
+from mcp.types import TextContent
 from opendart_fss.exceptions import (
     AuthenticationError,
     NotFoundError,
@@ -15,31 +20,112 @@ from opendart_fss.exceptions import (
     ValidationError,
 )
 
-_client: OpenDartClient | None = None
+from opendart_fss_mcp.circuit_breaker import BreakerState, CircuitBreaker
+from opendart_fss_mcp.client_pool import (
+    ApiCall,
+    ClientPool,
+    PooledClient,
+    parse_api_keys,
+)
+from opendart_fss_mcp.concurrency import AdaptiveLimiter
+from opendart_fss_mcp.hedging import Hedger
+from opendart_fss_mcp.projection import shape_rows, to_columnar
+from opendart_fss_mcp.response_cache import ResponseCache
+from opendart_fss_mcp.result_store import envelope_size, get_store
+
+_STALE_CACHE_SIZE = 512  # last good results kept for serving while the breaker is open
+_STALE_MAX_ROWS = 100  # longer list results (full statements, all pages) are not kept
+_NEGATIVE_CACHE_SIZE = 4096
+_NEGATIVE_CACHE_TTL_SECONDS = 10 * 60  # 10 minutes
+_INLINE_MAX_BYTES = 100_000  # larger list results are stored and returned as a handle
+_FANOUT_CONCURRENCY = 8  # per-tool cap on calls issued by gather_calls
+
+_client: PooledClient | None = None
 _api_key: str | None = None
+_breaker = CircuitBreaker()
+_stale = ResponseCache(_STALE_CACHE_SIZE)
+_not_found = ResponseCache(_NEGATIVE_CACHE_SIZE, ttl=_NEGATIVE_CACHE_TTL_SECONDS)
+_hedger = Hedger()
+_limiter = AdaptiveLimiter()
+_inline_max_bytes = _INLINE_MAX_BYTES
 
 
-def configure(api_key: str | None) -> None:
-    """Set the API key before server startup."""
-    global _api_key
+def configure(
+    api_key: str | None,
+    *,
+    breaker_error_rate: float | None = None,
+    breaker_cooldown: float | None = None,
+    negative_cache_ttl: float | None = None,
+    hedge: bool = False,
+    hedge_percentile: float | None = None,
+    max_concurrency: int | None = None,
+    inline_max_bytes: int | None = None,
+) -> None:
+    """Set the API key(s) and resilience settings before server startup.
+
+    Several keys may be given comma-separated; each gets its own client.
+    A ``negative_cache_ttl`` of 0 disables caching of "no data" results.
+    With ``hedge`` enabled, read calls slower than the endpoint's
+    ``hedge_percentile`` latency are re-issued once. ``max_concurrency``
+    caps the adaptive limit on in-flight upstream calls. List results
+    encoding to more than ``inline_max_bytes`` are returned as a handle.
+    """
+    global _api_key, _breaker, _not_found, _limiter, _inline_max_bytes
     _api_key = api_key
+    _breaker = CircuitBreaker(
+        error_rate=breaker_error_rate or _breaker.error_rate,
+        cooldown=breaker_cooldown or _breaker.cooldown,
+    )
+    if negative_cache_ttl is not None:
+        _not_found = ResponseCache(_NEGATIVE_CACHE_SIZE, ttl=negative_cache_ttl)
+    _hedger.enabled = hedge
+    if hedge_percentile is not None:
+        _hedger.percentile = hedge_percentile
+    if max_concurrency is not None:
+        _limiter = AdaptiveLimiter(max_limit=max_concurrency)
+    if inline_max_bytes is not None:
+        _inline_max_bytes = inline_max_bytes
 
 
-def get_client() -> OpenDartClient:
+def get_client() -> PooledClient:
     """Dependency for tool functions. Injected via Depends().
 
-    Lazily creates a singleton OpenDartClient on first use.
+    Lazily creates a singleton client backed by a key pool on first use.
     """
     global _client
     if _client is None:
-        _client = OpenDartClient(api_key=_api_key)
+        keys = parse_api_keys(_api_key or os.environ.get("OPENDART_API_KEY"))
+        _client = PooledClient(ClientPool(keys, limiter=_limiter))
     return _client
 
 
-async def call_api(coro):  # noqa: ANN001
+def get_breaker() -> CircuitBreaker:
+    return _breaker
+
+
+def health() -> dict:
+    """Upstream-facing health details reported on /health."""
+    breaker = _breaker.snapshot()
+    return {
+        "status": "ok" if breaker["state"] == BreakerState.CLOSED else "degraded",
+        "circuit_breaker": breaker,
+        "hedging": _hedger.snapshot(),
+        "concurrency": _limiter.snapshot(),
+        "api_keys": _client.pool.stats() if _client is not None else [],
+    }
+
+
+def _is_outage(e: BaseException) -> bool:
+    """Errors that indicate OpenDART itself is unhealthy (counted by the breaker)."""
+    if isinstance(e, (ServerError, httpx.TransportError)):
+        return True
+    return isinstance(e, httpx.HTTPStatusError) and e.response.status_code >= 500
+
+
+async def call_api(call: ApiCall) -> Any:
     """Wrap SDK calls and convert exceptions to ToolError."""
     try:
-        return await coro
+        return await _execute(call)
     except AuthenticationError as e:
         raise ToolError(f"인증 실패: API Key를 확인하세요. ({e})") from e
     except RateLimitError as e:
@@ -50,8 +136,133 @@ async def call_api(coro):  # noqa: ANN001
         raise ToolError(f"데이터 없음: {e}") from e
     except ServerError as e:
         raise ToolError(f"OpenDART 서버 오류: {e}") from e
+    except httpx.HTTPError as e:
+        raise ToolError(f"OpenDART 연결 오류: {e}") from e
+
+
+async def gather_calls(
+    calls: Iterable[ApiCall],
+    *,
+    concurrency: int = _FANOUT_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Run several calls through ``call_api`` concurrently, results in input order.
+
+    At most *concurrency* of them are in flight at once, so a single tool's
+    fan-out cannot take every slot of the shared limiter. With
+    *return_exceptions* each failure (a ``ToolError``) is returned in place
+    of its result instead of cancelling the rest.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(call: ApiCall) -> Any:
+        async with semaphore:
+            return await call_api(call)
+
+    tasks = [asyncio.ensure_future(run(call)) for call in calls]
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    finally:
+        for task in tasks:
+            task.cancel()
 
 
-def to_dict(obj: object) -> Any:
-    """Convert msgspec.Struct responses to JSON-serializable dicts."""
-    return msgspec.to_builtins(obj)
+def is_no_data(result: object) -> bool:
+    """Whether *result* is the ``ToolError`` of an OpenDART "no data" reply."""
+    return isinstance(result, ToolError) and isinstance(result.__cause__, NotFoundError)
+
+
+async def _execute(call: ApiCall) -> Any:
+    """Issue *call* unless its outcome is already known or the breaker is open.
+
+    - A recent ``NotFoundError`` for the same endpoint and arguments is
+      replayed without touching the upstream quota.
+    - While the breaker is open, the last good result is served if cached;
+      otherwise the call fails fast.
+    """
+    if _not_found.ttl and (miss := _not_found.get(call.key)) is not None:
+        raise NotFoundError(*miss)
+    breaker = _breaker
+    permit = breaker.allow()
+    if permit is None:
+        stale = _stale.get(call.key)
+        if stale is not None:
+            return stale
+        raise ToolError(
+            "OpenDART 서버 장애로 요청을 일시 차단했습니다. "
+            f"{breaker.retry_after():.0f}초 후 재시도하세요."
+        )
+    try:
+        result = await _hedger.run(call, is_transient=_is_outage)
+    except NotFoundError as e:
+        breaker.record_success(permit)
+        if _not_found.ttl:
+            _not_found.set(call.key, (e.status, e.message))
+        raise
+    except Exception as e:
+        if _is_outage(e):
+            breaker.record_failure(permit)
+        else:
+            breaker.record_success(permit)
+        raise
+    breaker.record_success(permit)
+    if _keep_stale(result):
+        _stale.set(call.key, result)
+    return result
+
+
+def _keep_stale(result: Any) -> bool:
+    """Whether *result* is small enough to keep for serving while open.
+
+    Downloads are kept by their own archives, and long lists would pin
+    megabytes per entry for the life of the process.
+    """
+    if isinstance(result, bytes):
+        return False
+    return not isinstance(result, list) or len(result) <= _STALE_MAX_ROWS
+
+
+_encoder = msgspec.json.Encoder()
+
+
+def to_result(
+    obj: object,
+    *,
+    fields: list[str] | None = None,
+    limit: int | None = None,
+    filters: dict[str, str | list[str]] | None = None,
+    format: str = "rows",
+) -> ToolResult:
+    """Encode msgspec.Struct responses straight to a JSON text tool result.
+
+    Skips the intermediate dict/list tree (``msgspec.to_builtins``) that FastMCP
+    would serialize again; tools returning this declare ``-> ToolResult`` so
+    no output schema (and no duplicate structured copy) is produced.
+    List results are filtered, truncated and projected first when asked, and
+    ``format="columnar"`` turns them into a header plus value arrays. If the
+    encoded list is still larger than the inline limit, the rows are kept in
+    the result store and only a summary with a paged resource handle is sent.
+    """
+    if not isinstance(obj, list):
+        text = _encoder.encode(obj).decode()
+        return ToolResult(content=[TextContent(type="text", text=text)])
+
+    rows = shape_rows(obj, fields=fields, limit=limit, filters=filters)
+    if format == "columnar":
+        table = to_columnar(rows)
+        data = _encoder.encode(table)
+        # the header (column names, constants) is repeated on every page
+        overhead = len(_encoder.encode({**table, "rows": []}))
+    else:
+        data = _encoder.encode(rows)
+        overhead = 2  # "[]"
+    if len(data) > _inline_max_bytes and len(rows) > 1:
+        # size pages so that each one, wrapped in the page envelope, fits
+        # within the inline budget
+        budget = max(_inline_max_bytes - overhead - envelope_size(len(rows)), 0)
+        page_size = max(len(rows) * budget // (len(data) - overhead), 1)
+        store = get_store()
+        stored = store.put(rows, format=format, page_size=page_size)
+        data = _encoder.encode(store.summary(stored))
+    text = data.decode()
+    return ToolResult(content=[TextContent(type="text", text=text)])
@@ -0,0 +1,210 @@
+"""Local SQLite index of disclosure filings, synced by date window."""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import time
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from opendart_fss.models.disclosure import Disclosure
+
+from opendart_fss_mcp.storage import data_dir
+
+PUBLICATION_TYPES = tuple("ABCDEFGHIJ")  # pblntf_ty: 정기공시 ~ 공정위공시
+
+_DB_NAME = "disclosures.sqlite3"
+_DATE_FORMAT = "%Y%m%d"
+_DAY_PATTERN = re.compile(r"[0-9]{8}")
+
+_COLUMNS = (
+    "rcept_no",
+    "corp_code",
+    "corp_name",
+    "stock_code",
+    "corp_cls",
+    "report_nm",
+    "flr_nm",
+    "rcept_dt",
+    "rm",
+)
+_SORT_COLUMNS = {"date": "rcept_dt", "crp": "corp_name", "rpt": "report_nm"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS disclosures (
+    rcept_no TEXT PRIMARY KEY,
+    corp_code TEXT NOT NULL,
+    corp_name TEXT NOT NULL,
+    stock_code TEXT,
+    corp_cls TEXT,
+    report_nm TEXT,
+    flr_nm TEXT,
+    rcept_dt TEXT NOT NULL,
+    rm TEXT,
+    pblntf_ty TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_disclosures_corp ON disclosures (corp_code, rcept_dt);
+CREATE INDEX IF NOT EXISTS ix_disclosures_date ON disclosures (rcept_dt);
+CREATE INDEX IF NOT EXISTS ix_disclosures_type ON disclosures (pblntf_ty, rcept_dt);
+CREATE INDEX IF NOT EXISTS ix_disclosures_cls ON disclosures (corp_cls, rcept_dt);
+CREATE TABLE IF NOT EXISTS synced_days (
+    day TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+def parse_day(value: str) -> date:
+    return datetime.strptime(value, _DATE_FORMAT).date()
+
+
+def is_day(value: str) -> bool:
+    """Whether *value* is a valid date in ``YYYYMMDD`` form."""
+    if not _DAY_PATTERN.fullmatch(value):
+        return False
+    try:
+        parse_day(value)
+    except ValueError:
+        return False
+    return True
+
+
+def format_day(value: date) -> str:
+    return value.strftime(_DATE_FORMAT)
+
+
+def iter_days(bgn_de: str, end_de: str) -> Iterable[str]:
+    day, end = parse_day(bgn_de), parse_day(end_de)
+    while day <= end:
+        yield format_day(day)
+        day += timedelta(days=1)
+
+
+class DisclosureIndex:
+    """Filings from ``disclosure.search`` keyed by ``rcept_no``.
+
+    A day counts as synced only once every publication type has been fully
+    fetched for it, so a synced window can be answered without OpenDART.
+    The list API does not report ``pblntf_ty`` per filing; it is recorded
+    from the type each sync query was issued for.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        # also read from worker threads (see tools/disclosure.search_documents)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def add(self, pblntf_ty: str, rows: Iterable[Disclosure]) -> int:
+        """Insert or refresh filings of publication type *pblntf_ty*."""
+        values = [
+            (*(getattr(row, column) for column in _COLUMNS), pblntf_ty) for row in rows
+        ]
+        with self._db:
+            self._db.executemany(
+                f"INSERT OR REPLACE INTO disclosures ({', '.join(_COLUMNS)}, "
+                f"pblntf_ty) VALUES ({', '.join('?' * (len(_COLUMNS) + 1))})",
+                values,
+            )
+        return len(values)
+
+    def get(self, rcept_no: str) -> Disclosure | None:
+        row = self._db.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM disclosures WHERE rcept_no = ?",
+            (rcept_no,),
+        ).fetchone()
+        return None if row is None else Disclosure(**dict(zip(_COLUMNS, row)))
+
+    def mark_synced(self, bgn_de: str, end_de: str) -> None:
+        now = time.time()
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO synced_days (day, synced_at) VALUES (?, ?)",
+                [(day, now) for day in iter_days(bgn_de, end_de)],
+            )
+
+    def last_synced_day(self) -> str | None:
+        return self._db.execute("SELECT max(day) FROM synced_days").fetchone()[0]
+
+    def covers(self, bgn_de: str, end_de: str) -> bool:
+        """True if every day from *bgn_de* to *end_de* has been synced."""
+        if bgn_de > end_de:
+            return False
+        (synced,) = self._db.execute(
+            "SELECT count(*) FROM synced_days WHERE day BETWEEN ? AND ?",
+            (bgn_de, end_de),
+        ).fetchone()
+        return synced == sum(1 for _ in iter_days(bgn_de, end_de))
+
+    def search(
+        self,
+        *,
+        bgn_de: str,
+        end_de: str,
+        corp_code: str | None = None,
+        pblntf_ty: str | None = None,
+        corp_cls: str | None = None,
+        sort: str | None = None,
+        sort_mth: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[Disclosure]:
+        """Query like ``disclosure.search`` (default order: newest first)."""
+        where = ["rcept_dt BETWEEN ? AND ?"]
+        params: list[object] = [bgn_de, end_de]
+        for column, value in (
+            ("corp_code", corp_code),
+            ("pblntf_ty", pblntf_ty),
+            ("corp_cls", corp_cls),
+        ):
+            if value:
+                where.append(f"{column} = ?")
+                params.append(value)
+        order_column = _SORT_COLUMNS.get(sort or "date", "rcept_dt")
+        direction = "ASC" if sort_mth == "asc" else "DESC"
+        params.extend([-1 if limit is None else limit, offset])
+        cursor = self._db.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM disclosures "
+            f"WHERE {' AND '.join(where)} "
+            f"ORDER BY {order_column} {direction}, rcept_no {direction} "
+            "LIMIT ? OFFSET ?",
+            params,
+        )
+        return [Disclosure(**dict(zip(_COLUMNS, row))) for row in cursor]
+
+    def corp_classes(self) -> dict[str, str]:
+        """Market (``corp_cls``) of each company, from its latest indexed filing."""
+        # SQLite takes bare columns from the row holding the max()
+        cursor = self._db.execute(
+            "SELECT corp_code, corp_cls, max(rcept_dt) FROM disclosures "
+            "WHERE corp_cls IS NOT NULL AND corp_cls != '' GROUP BY corp_code"
+        )
+        return {corp_code: corp_cls for corp_code, corp_cls, _ in cursor}
+
+    def stats(self) -> dict:
+        (filings,) = self._db.execute("SELECT count(*) FROM disclosures").fetchone()
+        first, last, days = self._db.execute(
+            "SELECT min(day), max(day), count(*) FROM synced_days"
+        ).fetchone()
+        return {
+            "filings": filings,
+            "synced_days": days,
+            "first_synced_day": first,
+            "last_synced_day": last,
+        }
+
+
+_index: DisclosureIndex | None = None
+
+
+def get_index() -> DisclosureIndex:
+    """Return the shared index stored in the data directory."""
+    global _index
+    if _index is None:
+        _index = DisclosureIndex(data_dir() / _DB_NAME)
+    return _index
@@ -0,0 +1,143 @@
+"""Per-year dividend and treasury stock figures normalized to numbers.
+
+The dividend section of a periodic report is a list of labelled rows
+("주당 현금배당금(원)", "(연결)현금배당성향(%)", ...) with text amounts, and
+the treasury stock section lists share movements per acquisition method.
+Both are reduced to one flat record per business year. Records of closed
+years are kept on disk so a history is fetched from OpenDART only once.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from pathlib import Path
+
+import msgspec
+from opendart_fss.models.report import DividendInfo, TreasuryStock
+
+from opendart_fss_mcp.amounts import parse_amount
+from opendart_fss_mcp.client_pool import KST
+from opendart_fss_mcp.response_cache import ResponseCache
+from opendart_fss_mcp.storage import check_code, data_dir, write_atomic
+
+_DIVIDEND_DIR = "dividends"
+_LOADED_COMPANIES = 64
+
+# space-stripped dividend row label suffix → field; split by share class
+_PER_SHARE_LABELS = {
+    "주당현금배당금(원)": "dps",
+    "현금배당수익률(%)": "yield",
+}
+# the first (consolidated) row wins when both (연결) and (별도) are reported
+_LABELS = {
+    "현금배당성향(%)": "payout_ratio",
+    "현금배당금총액(백만원)": "cash_dividends",
+    "당기순이익(백만원)": "net_income",
+    "주당순이익(원)": "eps",
+}
+
+HISTORY_FIELDS = (
+    "dps_common",
+    "dps_preferred",
+    "yield_common",
+    "yield_preferred",
+    "payout_ratio",
+    "cash_dividends",
+    "net_income",
+    "eps",
+    "treasury_acquired",
+    "treasury_disposed",
+    "treasury_retired",
+    "treasury_shares",
+)
+
+
+def _share_class(stock_knd: str | None) -> str:
+    return "preferred" if stock_knd and "우선" in stock_knd else "common"
+
+
+def normalize_year(
+    dividends: Sequence[DividendInfo], treasury: Sequence[TreasuryStock]
+) -> dict[str, int | float | None]:
+    """One year's figures from its dividend and treasury stock rows.
+
+    Values are those of the current term (``thstrm``). Treasury share
+    movements are taken from the common-stock "총계" row.
+    """
+    record: dict[str, int | float | None] = dict.fromkeys(HISTORY_FIELDS)
+    for row in dividends:
+        label = "".join((row.se or "").split())
+        value = parse_amount(row.thstrm)
+        for suffix, name in _PER_SHARE_LABELS.items():
+            if label.endswith(suffix):
+                key = f"{name}_{_share_class(row.stock_knd)}"
+                if record[key] is None:
+                    record[key] = value
+        for suffix, name in _LABELS.items():
+            if label.endswith(suffix) and record[name] is None:
+                record[name] = value
+    for row in treasury:
+        if (row.acqs_mth1 or "").strip() != "총계":
+            continue
+        if _share_class(row.stock_knd) != "common":
+            continue
+        record["treasury_acquired"] = parse_amount(row.change_qy_acqs)
+        record["treasury_disposed"] = parse_amount(row.change_qy_dsps)
+        record["treasury_retired"] = parse_amount(row.change_qy_incnr)
+        record["treasury_shares"] = parse_amount(row.trmend_qy)
+        break
+    return record
+
+
+def is_closed(bsns_year: str) -> bool:
+    """Whether reports for *bsns_year* are final (the year has ended)."""
+    return int(bsns_year) < datetime.now(KST).year
+
+
+class DividendStore:
+    """Per-company records of closed years in ``<corp_code>.<reprt_code>.json``.
+
+    Only years whose report was filed are stored; a year that is still open
+    or has no report yet is always fetched again.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._loaded = ResponseCache(_LOADED_COMPANIES)
+
+    def _path(self, corp_code: str, reprt_code: str) -> Path:
+        corp_code = check_code(corp_code, 8, "corp_code")
+        reprt_code = check_code(reprt_code, 5, "reprt_code")
+        return self.root / f"{corp_code}.{reprt_code}.json"
+
+    def get(self, corp_code: str, reprt_code: str) -> dict[str, dict]:
+        """Stored records of *corp_code* by business year."""
+        key = (corp_code, reprt_code)
+        records = self._loaded.get(key)
+        if records is None:
+            path = self._path(corp_code, reprt_code)
+            try:
+                records = msgspec.json.decode(path.read_bytes(), type=dict[str, dict])
+            except (FileNotFoundError, msgspec.DecodeError):
+                records = {}
+            self._loaded.set(key, records)
+        return records
+
+    def put(self, corp_code: str, reprt_code: str, records: dict[str, dict]) -> None:
+        """Add *records* (by business year) to the stored ones."""
+        merged = {**self.get(corp_code, reprt_code), **records}
+        write_atomic(self._path(corp_code, reprt_code), [msgspec.json.encode(merged)])
+        self._loaded.set((corp_code, reprt_code), merged)
+
+
+_store: DividendStore | None = None
+
+
+def get_dividend_store() -> DividendStore:
+    """Return the shared dividend store kept in the data directory."""
+    global _store
+    if _store is None:
+        _store = DividendStore(data_dir() / _DIVIDEND_DIR)
+    return _store
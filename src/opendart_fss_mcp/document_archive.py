@@ -0,0 +1,114 @@
+"""Content-addressed on-disk archive of filing document ZIPs."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from opendart_fss_mcp.storage import data_dir, write_atomic
+
+_ARCHIVE_DIR = "documents"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    rcept_no TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL
+);
+"""
+
+
+@dataclass(slots=True)
+class ArchivedDocument:
+    rcept_no: str
+    sha256: str
+    size: int
+    path: Path
+    stored_at: float
+
+    def members(self) -> list[dict]:
+        """Name and uncompressed size of each file in the ZIP."""
+        with zipfile.ZipFile(self.path) as zf:
+            return [
+                {"name": info.filename, "size": info.file_size}
+                for info in zf.infolist()
+                if not info.is_dir()
+            ]
+
+    def metadata(self) -> dict:
+        return {
+            "rcept_no": self.rcept_no,
+            "sha256": self.sha256,
+            "size": self.size,
+            "members": self.members(),
+        }
+
+
+class DocumentArchive:
+    """Document ZIPs stored once per content hash, indexed by ``rcept_no``.
+
+    Filings are immutable once received, so an archived document never
+    needs to be downloaded again. Files live at ``objects/ab/<sha256>.zip``.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self._objects = self.root / "objects"
+        self._objects.mkdir(parents=True, exist_ok=True)
+        # put() runs in a worker thread (see tools/disclosure.document)
+        self._db = sqlite3.connect(self.root / "index.sqlite3", check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def _object_path(self, sha256: str) -> Path:
+        return self._objects / sha256[:2] / f"{sha256}.zip"
+
+    def get(self, rcept_no: str) -> ArchivedDocument | None:
+        row = self._db.execute(
+            "SELECT sha256, size, stored_at FROM documents WHERE rcept_no = ?",
+            (rcept_no,),
+        ).fetchone()
+        if row is None:
+            return None
+        sha256, size, stored_at = row
+        path = self._object_path(sha256)
+        if not path.exists():  # object removed out from under the index
+            return None
+        return ArchivedDocument(rcept_no, sha256, size, path, stored_at)
+
+    def rcept_nos(self) -> set[str]:
+        return {row[0] for row in self._db.execute("SELECT rcept_no FROM documents")}
+
+    def put(self, rcept_no: str, data: bytes) -> ArchivedDocument:
+        """Store *data* (written atomically, skipped if the content exists)."""
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self._object_path(sha256)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            write_atomic(path, [data])
+        stored_at = time.time()
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO documents (rcept_no, sha256, size, stored_at) "
+                "VALUES (?, ?, ?, ?)",
+                (rcept_no, sha256, len(data), stored_at),
+            )
+        return ArchivedDocument(rcept_no, sha256, len(data), path, stored_at)
+
+
+_archive: DocumentArchive | None = None
+
+
+def get_archive() -> DocumentArchive:
+    """Return the shared archive stored in the data directory."""
+    global _archive
+    if _archive is None:
+        _archive = DocumentArchive(data_dir() / _ARCHIVE_DIR)
+    return _archive
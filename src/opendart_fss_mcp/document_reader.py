@@ -0,0 +1,219 @@
+"""Lazy text extraction from archived filing ZIPs via a memory map."""
+
+from __future__ import annotations
+
+import codecs
+import mmap
+import re
+import zipfile
+from collections.abc import Iterator
+from html.parser import HTMLParser
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+_CHUNK_BYTES = 64 * 1024
+_ENCODING_RE = re.compile(rb"""encoding\s*=\s*["']([A-Za-z0-9._-]+)["']""")
+_SPACE_RE = re.compile(r"\s+")
+
+# tags that end a line of text (DART XML and HTML attachments)
+_BLOCK_TAGS = frozenset(
+    {
+        "br",
+        "div",
+        "h1",
+        "h2",
+        "h3",
+        "li",
+        "p",
+        "pgbrk",
+        "section-1",
+        "section-2",
+        "section-3",
+        "table",
+        "title",
+        "tr",
+    }
+)
+_CELL_TAGS = frozenset({"td", "te", "th", "tu"})
+
+
+class TextExtractor(HTMLParser):
+    """Incremental markup stripper: feed markup, drain plain text.
+
+    Blank lines are collapsed as text is produced, so ``position`` (UTF-8
+    bytes drained so far plus pending) matches the text exactly. The
+    ``<TITLE>`` of each DART ``<SECTION-n>`` is recorded in ``titles`` as
+    ``(byte offset, level, title)``.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._parts: list[str] = []
+        self._trailing_newlines = 2  # no blank lines at the start
+        self._level = 0
+        self._title: list[str] | None = None
+        self._title_start = 0
+        self.position = 0
+        self.titles: list[tuple[int, int, str]] = []
+
+    def _emit(self, text: str) -> None:
+        self._parts.append(text)
+        self.position += len(text.encode("utf-8"))
+
+    def _newline(self) -> None:
+        if self._trailing_newlines < 2:
+            self._emit("\n")
+            self._trailing_newlines += 1
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag.startswith("section-") and tag[8:].isdigit():
+            self._level = int(tag[8:])
+        if tag in _BLOCK_TAGS:
+            self._newline()
+        if tag == "title":
+            self._title = []
+            self._title_start = self.position
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title" and self._title is not None:
+            title = " ".join("".join(self._title).split())
+            if title:
+                self.titles.append((self._title_start, self._level, title))
+            self._title = None
+        if tag in _BLOCK_TAGS:
+            self._newline()
+        elif tag in _CELL_TAGS:
+            self._emit("\t")
+
+    def handle_data(self, data: str) -> None:
+        collapsed = _SPACE_RE.sub(" ", data)
+        if not collapsed.strip():
+            return
+        if self._trailing_newlines:
+            collapsed = collapsed.lstrip(" ")
+        self._emit(collapsed)
+        self._trailing_newlines = 0
+        if self._title is not None:
+            self._title.append(collapsed)
+
+    def drain(self) -> str:
+        text = "".join(self._parts)
+        self._parts.clear()
+        return text
+
+
+def _detect_encoding(head: bytes) -> str:
+    match = _ENCODING_RE.search(head[:256])
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode("ascii")).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+def strip_markup(
+    chunks: Iterator[bytes], parser: TextExtractor | None = None
+) -> Iterator[str]:
+    """Decode and strip tags from a stream of markup bytes, chunk by chunk."""
+    parser = parser or TextExtractor()
+    decoder = None
+    for chunk in chunks:
+        if decoder is None:
+            decoder = codecs.getincrementaldecoder(_detect_encoding(chunk))("replace")
+        parser.feed(decoder.decode(chunk))
+        if text := parser.drain():
+            yield text
+    if decoder is not None:
+        parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    if text := parser.drain():
+        yield text
+
+
+class DocumentReader:
+    """Read members of a ZIP through ``mmap`` without loading it whole.
+
+    Only the central directory is parsed on open; a member is decompressed
+    in ``_CHUNK_BYTES`` pieces as its text is consumed.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        # the map keeps its own handle, so the file need not stay open
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._zip = zipfile.ZipFile(self._map)  # type: ignore[arg-type]
+        except BaseException:
+            self._map.close()
+            raise
+
+    def close(self) -> None:
+        self._zip.close()
+        self._map.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def members(self) -> list[dict]:
+        return [
+            {
+                "name": info.filename,
+                "size": info.file_size,
+                "compressed_size": info.compress_size,
+            }
+            for info in self._zip.infolist()
+            if not info.is_dir()
+        ]
+
+    def main_member(self, rcept_no: str) -> str:
+        """The filing body (``<rcept_no>.xml``), else the first member."""
+        names = [m["name"] for m in self.members()]
+        if not names:
+            raise KeyError("빈 문서입니다")
+        preferred = f"{rcept_no}.xml"
+        return preferred if preferred in names else names[0]
+
+    def iter_bytes(self, member: str) -> Iterator[bytes]:
+        with self._zip.open(member) as f:
+            while chunk := f.read(_CHUNK_BYTES):
+                yield chunk
+
+    def iter_text(self, member: str) -> Iterator[str]:
+        return strip_markup(self.iter_bytes(member))
+
+    def read_text(self, member: str, *, offset: int = 0, max_chars: int) -> dict:
+        """Return up to *max_chars* of plain text starting at character *offset*.
+
+        Decompression stops as soon as the window (plus one character, to
+        know whether more follows) has been produced.
+        """
+        window: list[str] = []
+        wanted = max_chars + 1
+        position = 0
+        for piece in self.iter_text(member):
+            end = position + len(piece)
+            if end > offset:
+                window.append(piece[max(offset - position, 0) :])
+                wanted -= len(window[-1])
+                if wanted <= 0:
+                    break
+            position = end
+        text = "".join(window)
+        more = len(text) > max_chars
+        text = text[:max_chars]
+        return {
+            "member": member,
+            "offset": offset,
+            "text": text,
+            "next_offset": offset + len(text) if more else None,
+        }
@@ -0,0 +1,186 @@
+"""Full-text search (SQLite FTS5) over archived filing text."""
+
+from __future__ import annotations
+
+import itertools
+import sqlite3
+import time
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+
+from opendart_fss_mcp.document_archive import ArchivedDocument, DocumentArchive
+from opendart_fss_mcp.document_sections import (
+    DocumentSections,
+    load_sections,
+    text_path_for,
+)
+from opendart_fss_mcp.korean import bigram_terms, bigram_tokens, is_hangul_run
+from opendart_fss_mcp.storage import data_dir
+
+_DB_NAME = "fulltext.sqlite3"
+_PASSAGE_CHARS = 2_000  # long sections are split so snippets stay local
+_SNIPPET_CONTEXT = 80
+
+# Korean has no whitespace-delimited words to index, so text is tokenized
+# into syllable bigrams in Python and FTS5 only splits on spaces.
+_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS passages USING fts5(
+    tokens,
+    rcept_no UNINDEXED,
+    title UNINDEXED,
+    byte_start UNINDEXED,
+    byte_end UNINDEXED,
+    tokenize = "unicode61"
+);
+CREATE TABLE IF NOT EXISTS indexed (
+    rcept_no TEXT PRIMARY KEY,
+    passages INTEGER NOT NULL,
+    indexed_at REAL NOT NULL
+);
+"""
+
+
+def _passages(sections: DocumentSections) -> Iterator[tuple[str, int, int, str]]:
+    """Yield ``(title, start, end, text)`` passages covering the whole text.
+
+    Passages run between consecutive titles regardless of level (so nested
+    sections are not indexed twice) and are cut to ``_PASSAGE_CHARS``.
+    """
+    bounds = [(0, "")] + [(s.start, s.title) for s in sections.index.sections]
+    bounds.append((sections.index.text_size, ""))
+    with open(sections.text_path, "rb") as f:
+        for (start, title), (end, _) in itertools.pairwise(bounds):
+            if end <= start:
+                continue
+            f.seek(start)
+            text = f.read(end - start).decode("utf-8", "replace")
+            position = start
+            for i in range(0, len(text), _PASSAGE_CHARS):
+                piece = text[i : i + _PASSAGE_CHARS]
+                size = len(piece.encode("utf-8"))
+                yield title, position, position + size, piece
+                position += size
+
+
+def _match_expression(query: str) -> str:
+    """FTS5 query: every term must match, Hangul terms as bigram phrases."""
+    parts = []
+    for term in bigram_terms(query):
+        if len(term) == 1 and is_hangul_run(term[0]) and len(term[0]) == 1:
+            parts.append(f'"{term[0]}"*')  # one syllable: prefix of a bigram
+        else:
+            parts.append('"' + " ".join(term) + '"')
+    return " AND ".join(parts)
+
+
+def _snippet(text: str, query: str) -> str:
+    lowered = text.lower()
+    hits = [i for term in query.lower().split() if (i := lowered.find(term)) >= 0]
+    center = min(hits) if hits else 0
+    start = max(center - _SNIPPET_CONTEXT, 0)
+    end = min(center + _SNIPPET_CONTEXT * 2, len(text))
+    snippet = " ".join(text[start:end].split())
+    return ("…" if start else "") + snippet + ("…" if end < len(text) else "")
+
+
+class FullTextIndex:
+    """Inverted index of archived filings, one row per text passage."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        # documents are indexed from a worker thread (see tools/disclosure)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def indexed(self) -> set[str]:
+        return {row[0] for row in self._db.execute("SELECT rcept_no FROM indexed")}
+
+    def add(self, archived: ArchivedDocument) -> int:
+        """Index *archived* unless already done; returns the passage count.
+
+        Unreadable documents are recorded with no passages so they are not
+        retried on every search.
+        """
+        if self._db.execute(
+            "SELECT 1 FROM indexed WHERE rcept_no = ?", (archived.rcept_no,)
+        ).fetchone():
+            return 0
+        try:
+            sections = load_sections(archived)
+            rows = [
+                (bigram_tokens(f"{title} {text}"), archived.rcept_no, title, s, e)
+                for title, s, e, text in _passages(sections)
+            ]
+        except (zipfile.BadZipFile, KeyError):
+            rows = []
+        with self._db:
+            self._db.executemany(
+                "INSERT INTO passages (tokens, rcept_no, title, byte_start, byte_end) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._db.execute(
+                "INSERT INTO indexed (rcept_no, passages, indexed_at) VALUES (?, ?, ?)",
+                (archived.rcept_no, len(rows), time.time()),
+            )
+        return len(rows)
+
+    def search(
+        self,
+        query: str,
+        archive: DocumentArchive,
+        *,
+        limit: int,
+        rcept_nos: list[str] | None = None,
+    ) -> list[dict]:
+        """Best-ranked passages (BM25) matching every term of *query*.
+
+        Snippets are read back from the extracted text in *archive*.
+        """
+        expression = _match_expression(query)
+        if not expression:
+            return []
+        sql = (
+            "SELECT rcept_no, title, byte_start, byte_end, bm25(passages) "
+            "FROM passages "
+            "WHERE passages MATCH ?"
+        )
+        params: list[object] = [expression]
+        if rcept_nos:
+            sql += f" AND rcept_no IN ({', '.join('?' * len(rcept_nos))})"
+            params.extend(rcept_nos)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        results = []
+        for rcept_no, title, start, end, score in self._db.execute(sql, params):
+            snippet = ""
+            archived = archive.get(rcept_no)
+            if archived is not None and (path := text_path_for(archived)).exists():
+                with open(path, "rb") as f:
+                    f.seek(start)
+                    text = f.read(end - start).decode("utf-8", "replace")
+                snippet = _snippet(text, query)
+            results.append(
+                {
+                    "rcept_no": rcept_no,
+                    "section": title,
+                    "snippet": snippet,
+                    "score": round(-score, 3),
+                }
+            )
+        return results
+
+
+_fulltext: FullTextIndex | None = None
+
+
+def get_fulltext() -> FullTextIndex:
+    """Return the shared full-text index stored in the data directory."""
+    global _fulltext
+    if _fulltext is None:
+        _fulltext = FullTextIndex(data_dir() / _DB_NAME)
+    return _fulltext
@@ -0,0 +1,95 @@
+"""Section index over archived filings: title → byte range of extracted text."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import msgspec
+
+from opendart_fss_mcp.document_archive import ArchivedDocument
+from opendart_fss_mcp.document_reader import DocumentReader, TextExtractor, strip_markup
+from opendart_fss_mcp.storage import write_atomic
+
+
+class Section(msgspec.Struct):
+    title: str
+    level: int
+    start: int  # byte offset into the extracted text
+    end: int
+
+
+class SectionIndex(msgspec.Struct):
+    member: str
+    text_size: int
+    sections: list[Section]
+
+
+def _normalize(title: str) -> str:
+    return "".join(title.split()).lower()
+
+
+@dataclass(slots=True)
+class DocumentSections:
+    """Extracted plain text of a filing plus its section index.
+
+    Both files sit beside the archived ZIP (``<sha256>.txt`` and
+    ``<sha256>.sections.json``) and are written once, on first use, so a
+    section read is a single seek + read of that section's bytes.
+    """
+
+    text_path: Path
+    index: SectionIndex
+
+    def find(self, title: str) -> list[Section]:
+        """Sections whose title equals *title*, else contains it (ignoring spaces)."""
+        wanted = _normalize(title)
+        exact = [s for s in self.index.sections if _normalize(s.title) == wanted]
+        if exact:
+            return exact
+        return [s for s in self.index.sections if wanted in _normalize(s.title)]
+
+    def read(self, section: Section) -> str:
+        with open(self.text_path, "rb") as f:
+            f.seek(section.start)
+            return f.read(section.end - section.start).decode("utf-8", "replace")
+
+
+def _build(
+    archived: ArchivedDocument, text_path: Path, index_path: Path
+) -> SectionIndex:
+    parser = TextExtractor()
+    with DocumentReader(archived.path) as reader:
+        member = reader.main_member(archived.rcept_no)
+        text = (
+            piece.encode("utf-8")
+            for piece in strip_markup(reader.iter_bytes(member), parser)
+        )
+        write_atomic(text_path, text)
+    size = parser.position
+    sections: list[Section] = []
+    for i, (start, level, title) in enumerate(parser.titles):
+        # a section runs until the next title at the same or a higher level
+        end = next(
+            (s for s, lv, _ in parser.titles[i + 1 :] if lv <= level or not level),
+            size,
+        )
+        sections.append(Section(title, level, start, end))
+    index = SectionIndex(member=member, text_size=size, sections=sections)
+    write_atomic(index_path, [msgspec.json.encode(index)])
+    return index
+
+
+def text_path_for(archived: ArchivedDocument) -> Path:
+    return archived.path.with_suffix(".txt")
+
+
+def load_sections(archived: ArchivedDocument) -> DocumentSections:
+    """Section index for *archived*, extracting and indexing it on first use."""
+    text_path = text_path_for(archived)
+    index_path = archived.path.with_suffix(".sections.json")
+    if text_path.exists() and index_path.exists():
+        index = msgspec.json.decode(index_path.read_bytes(), type=SectionIndex)
+    else:
+        index = _build(archived, text_path, index_path)
+    return DocumentSections(text_path, index)
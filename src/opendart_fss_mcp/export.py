@@ -0,0 +1,206 @@
+"""Bulk export of full financial statements to Parquet or Arrow IPC files.
+
+Work is split into batches of companies per business year. Each finished
+batch is written as its own part file and recorded in a checkpoint, so an
+interrupted export resumes with the first unfinished batch. The checkpoint
+keeps the resolved company list: the listed companies may change between
+runs, and a resumed export must cut its batches from the same list.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+import msgspec
+from opendart_fss.models.financial import FinancialAccount
+
+from opendart_fss_mcp.amounts import parse_amount
+from opendart_fss_mcp.client_pool import PooledClient
+from opendart_fss_mcp.corp_code_cache import get_cache
+from opendart_fss_mcp.deps import gather_calls, is_no_data
+from opendart_fss_mcp.storage import write_atomic
+
+CHECKPOINT_NAME = ".export-checkpoint.json"
+_AMOUNT_COLUMNS = frozenset(
+    name for name in FinancialAccount.__struct_fields__ if name.endswith("_amount")
+)
+
+
+class ExportFormat(StrEnum):
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+
+@dataclass(slots=True)
+class ExportSummary:
+    batches: int = 0
+    skipped: int = 0  # already done in an earlier run
+    rows: int = 0
+    empty: list[str] = field(default_factory=list)  # "corp_code/year" without data
+    failed: list[str] = field(default_factory=list)
+
+
+def require_pyarrow() -> Any:
+    """Import pyarrow, which is only installed with the ``export`` extra."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "export requires pyarrow: pip install 'opendart-fss-mcp[export]'"
+        ) from None
+    return pyarrow
+
+
+def to_table(rows: Sequence[FinancialAccount]) -> Any:
+    """Arrow table of *rows*; amount columns are parsed to float64."""
+    pa = require_pyarrow()
+    columns = {}
+    for name in FinancialAccount.__struct_fields__:
+        values = [getattr(row, name) for row in rows]
+        if name in _AMOUNT_COLUMNS:
+            columns[name] = pa.array(
+                [parse_amount(v) for v in values], type=pa.float64()
+            )
+        else:
+            columns[name] = pa.array(values, type=pa.string())
+    return pa.table(columns)
+
+
+def write_table(table: Any, path: Path, format: ExportFormat) -> None:
+    require_pyarrow()
+    tmp = path.with_name(path.name + ".tmp")
+    if format == ExportFormat.PARQUET:
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, tmp)
+    else:
+        from pyarrow import feather
+
+        feather.write_feather(table, tmp)
+    tmp.replace(path)
+
+
+class Checkpoint(msgspec.Struct):
+    job: str  # fingerprint of the export arguments
+    corp_codes: list[str] = []  # as resolved by the first run
+    done: list[str] = []
+
+
+def _job_id(
+    corp_codes: Sequence[str] | None,
+    years: Sequence[str],
+    reprt_code: str,
+    fs_div: str,
+    batch_size: int,
+    format: ExportFormat,
+) -> str:
+    """Fingerprint of the arguments; ``None`` (every listed company) as given."""
+    codes = None if corp_codes is None else list(corp_codes)
+    spec = json.dumps([codes, list(years), reprt_code, fs_div, batch_size, format])
+    return hashlib.sha256(spec.encode()).hexdigest()[:16]
+
+
+def _load_checkpoint(path: Path, job: str) -> Checkpoint | None:
+    try:
+        checkpoint = msgspec.json.decode(path.read_bytes(), type=Checkpoint)
+    except (FileNotFoundError, msgspec.DecodeError):
+        return None
+    return checkpoint if checkpoint.job == job else None
+
+
+def _clear_parts(output: Path, years: Sequence[str]) -> None:
+    """Remove part files of an earlier job from the years about to be written."""
+    for year in years:
+        for path in (output / year).glob("part-*"):
+            path.unlink()
+
+
+async def export_statements(
+    client: PooledClient,
+    corp_codes: Sequence[str] | None,
+    years: Sequence[str],
+    output: Path,
+    *,
+    reprt_code: str = "11011",
+    fs_div: str = "CFS",
+    format: ExportFormat = ExportFormat.PARQUET,
+    batch_size: int = 100,
+    concurrency: int = 8,
+    progress: Callable[[str], None] = lambda _: None,
+) -> ExportSummary:
+    """Fetch full statements for every company and year into *output*.
+
+    *corp_codes* of ``None`` exports every listed company. Files are written
+    as ``<year>/part-<n>.<format>``. A batch with a failed company (other than
+    "no data") is not written and not checkpointed, so the next run with the
+    same arguments retries it; other arguments start over and replace the
+    part files of those years. Requests go through *client*'s key pool and
+    its rate limiter.
+    """
+    require_pyarrow()
+    output.mkdir(parents=True, exist_ok=True)
+    checkpoint_path = output / CHECKPOINT_NAME
+    job = _job_id(corp_codes, years, reprt_code, fs_div, batch_size, format)
+    checkpoint = _load_checkpoint(checkpoint_path, job)
+    if checkpoint is None:
+        if corp_codes is None:
+            corp_codes = [e.corp_code for e in await get_cache().listed(client)]
+        checkpoint = Checkpoint(job, list(corp_codes))
+        _clear_parts(output, years)
+        write_atomic(checkpoint_path, [msgspec.json.encode(checkpoint)])
+    corp_codes = checkpoint.corp_codes
+    done = set(checkpoint.done)
+    summary = ExportSummary()
+    progress(f"Exporting {len(corp_codes)} companies x {len(years)} years to {output}")
+
+    for year in years:
+        for n, start in enumerate(range(0, len(corp_codes), batch_size)):
+            batch_id = f"{year}/{n:05d}"
+            if batch_id in done:
+                summary.skipped += 1
+                continue
+            batch = corp_codes[start : start + batch_size]
+            results = await gather_calls(
+                (
+                    client.financial.get_full_statements(
+                        corp_code=code,
+                        bsns_year=year,
+                        reprt_code=reprt_code,
+                        fs_div=fs_div,
+                    )
+                    for code in batch
+                ),
+                concurrency=concurrency,
+                return_exceptions=True,
+            )
+            rows: list[FinancialAccount] = []
+            failed = []
+            for code, result in zip(batch, results):
+                if is_no_data(result):
+                    summary.empty.append(f"{code}/{year}")
+                elif isinstance(result, BaseException):
+                    failed.append(f"{code}/{year}: {result}")
+                else:
+                    rows.extend(result)
+            if failed:
+                summary.failed.extend(failed)
+                progress(f"{batch_id}: {len(failed)} failed, will retry on resume")
+                continue
+            if rows:
+                directory = output / year
+                directory.mkdir(exist_ok=True)
+                path = directory / f"part-{n:05d}.{format.value}"
+                write_table(to_table(rows), path, format)
+            done.add(batch_id)
+            checkpoint.done.append(batch_id)
+            write_atomic(checkpoint_path, [msgspec.json.encode(checkpoint)])
+            summary.batches += 1
+            summary.rows += len(rows)
+            progress(f"{batch_id}: {len(rows)} rows")
+    return summary
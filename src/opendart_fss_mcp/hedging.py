@@ -0,0 +1,135 @@
+"""Hedged requests: re-issue slow idempotent calls and take the first response."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable
+from typing import Any
+
+from opendart_fss_mcp.client_pool import ApiCall
+
+_DEFAULT_PERCENTILE = 95.0
+_SAMPLE_SIZE = 200  # latencies kept per endpoint
+_MIN_SAMPLES = 20  # no hedging until the percentile is meaningful
+_MIN_DELAY_SECONDS = 0.05
+_BUDGET_RATIO = 0.1  # at most ~10% extra upstream requests
+_BUDGET_MAX_TOKENS = 10.0
+
+
+def is_hedgeable(call: ApiCall) -> bool:
+    """Idempotent JSON reads only; file downloads are too large to duplicate."""
+    return not call.method.startswith("download_")
+
+
+class LatencyTracker:
+    """Rolling per-endpoint latency samples."""
+
+    def __init__(self, sample_size: int = _SAMPLE_SIZE) -> None:
+        self._samples: defaultdict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=sample_size)
+        )
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        self._samples[endpoint].append(seconds)
+
+    def percentile(
+        self, endpoint: str, pct: float, *, min_samples: int = _MIN_SAMPLES
+    ) -> float | None:
+        samples = self._samples.get(endpoint)
+        if not samples or len(samples) < min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(math.ceil(pct / 100 * len(ordered)) - 1, len(ordered) - 1)
+        return ordered[max(index, 0)]
+
+
+class Hedger:
+    """Issue a second request when the first is slower than the endpoint's pXX.
+
+    Hedges draw from a token budget refilled by ``budget_ratio`` per call and
+    are only sent while the key pool still has quota to spare.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = False,
+        percentile: float = _DEFAULT_PERCENTILE,
+        budget_ratio: float = _BUDGET_RATIO,
+    ) -> None:
+        self.enabled = enabled
+        self.percentile = percentile
+        self.budget_ratio = budget_ratio
+        self.latency = LatencyTracker()
+        self._tokens = 0.0
+        self.hedges_sent = 0
+        self.hedges_won = 0
+
+    def delay_for(self, call: ApiCall) -> float | None:
+        if not self.enabled or not is_hedgeable(call):
+            return None
+        p = self.latency.percentile(call.endpoint, self.percentile)
+        return None if p is None else max(p, _MIN_DELAY_SECONDS)
+
+    def _take_budget(self, call: ApiCall) -> bool:
+        if self._tokens < 1.0 or call.pool.remaining_quota() <= 1:
+            return False
+        self._tokens -= 1.0
+        return True
+
+    async def _timed(self, call: ApiCall) -> Any:
+        start = time.monotonic()
+        result = await call
+        self.latency.record(call.endpoint, time.monotonic() - start)
+        return result
+
+    async def run(
+        self, call: ApiCall, *, is_transient: Callable[[BaseException], bool]
+    ) -> Any:
+        """Await *call*, hedging it if it outlives the latency percentile.
+
+        The first successful response wins; a failure only defers to the
+        other in-flight request when *is_transient* says it may be worth it.
+        """
+        self._tokens = min(self._tokens + self.budget_ratio, _BUDGET_MAX_TOKENS)
+        delay = self.delay_for(call)
+        if delay is None:
+            return await self._timed(call)
+
+        primary = asyncio.ensure_future(self._timed(call))
+        pending: set[asyncio.Future] = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done and self._take_budget(call):
+                pending.add(asyncio.ensure_future(self._timed(call)))
+                self.hedges_sent += 1
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    exc = task.exception()
+                    if exc is None:
+                        if task is not primary:
+                            self.hedges_won += 1
+                        return task.result()
+                    error = error or exc
+                    if not is_transient(exc):
+                        raise exc
+            assert error is not None
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def snapshot(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "percentile": self.percentile,
+            "hedges_sent": self.hedges_sent,
+            "hedges_won": self.hedges_won,
+        }
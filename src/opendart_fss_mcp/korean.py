@@ -1,7 +1,9 @@
-"""Korean text utilities: chosung extraction and query helpers."""
+"""Korean text utilities: chosung extraction, query helpers and bigrams."""
 
 from __future__ import annotations
 
+import re
+
 # 19 Korean initial consonants (chosung) in Unicode order
 _CHOSUNG = (
     "ㄱ",
@@ -33,6 +35,9 @@ _HANGUL_END = 0xD7A3
 _JUNGSUNG_COUNT = 21
 _JONGSUNG_COUNT = 28
 
+# runs of Hangul syllables, or of other letters/digits
+_TERM_RE = re.compile(r"[\uac00-\ud7a3]+|[^\W_\uac00-\ud7a3]+")
+
 
 def extract_chosung(text: str) -> str:
     """Extract initial consonants from Korean syllables; lowercase non-Hangul.
@@ -76,3 +81,31 @@ def normalize_mixed_query(query: str) -> str:
         'ㅅㅅsdi'
     """
     return "".join(ch if ch in _CHOSUNG_SET else ch.lower() for ch in query)
+
+
+def is_hangul_run(term: str) -> bool:
+    return bool(term) and all(_HANGUL_BASE <= ord(ch) <= _HANGUL_END for ch in term)
+
+
+def bigram_terms(text: str) -> list[list[str]]:
+    """Split *text* into terms, each as its list of index tokens.
+
+    Hangul runs become overlapping syllable bigrams (so "유상증자" is found
+    inside "제3자배정유상증자"); other words are lowercased whole.
+
+    Examples:
+        >>> bigram_terms("유상증자 목적 R&D")
+        [['유상', '상증', '증자'], ['목적'], ['r'], ['d']]
+    """
+    terms: list[list[str]] = []
+    for term in _TERM_RE.findall(text):
+        if is_hangul_run(term) and len(term) > 1:
+            terms.append([term[i : i + 2] for i in range(len(term) - 1)])
+        else:
+            terms.append([term.lower()])
+    return terms
+
+
+def bigram_tokens(text: str) -> str:
+    """Space-joined bigram tokens of *text*, for a whitespace tokenizer."""
+    return " ".join(token for term in bigram_terms(text) for token in term)
@@ -0,0 +1,127 @@
+"""Row filtering, limiting and field projection for list-returning tools."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Annotated, Any, Literal
+
+import msgspec
+from fastmcp.exceptions import ToolError
+from pydantic import Field
+
+FIELDS = Annotated[
+    list[str] | None,
+    Field(
+        description="반환할 필드 목록 (생략 시 전체). 예: ['account_nm', 'thstrm_amount']"
+    ),
+]
+LIMIT = Annotated[int | None, Field(description="최대 반환 행 수", ge=1)]
+FILTERS = Annotated[
+    dict[str, str | list[str]] | None,
+    Field(
+        description=(
+            "행 필터: {필드: 값 또는 값 목록} 일치하는 행만 반환. 예: {'sj_div': 'BS'}. "
+            "목록 필드는 원소 중 하나가 일치하면 포함"
+        )
+    ),
+]
+
+FORMAT = Annotated[
+    Literal["rows", "columnar"],
+    Field(
+        description=(
+            "응답 형식. rows: 행별 객체 목록, "
+            "columnar: columns(열 이름) + rows(값 배열), 모든 행이 같은 열은 constants로 분리"
+        )
+    ),
+]
+
+
+def _field_names(row: msgspec.Struct) -> dict[str, str]:
+    """Map JSON field name → attribute name for a Struct instance."""
+    return {f.encode_name: f.name for f in msgspec.structs.fields(row)}
+
+
+def _check_fields(requested: Sequence[str], available: dict[str, str]) -> None:
+    unknown = [f for f in requested if f not in available]
+    if unknown:
+        raise ToolError(
+            f"알 수 없는 필드: {', '.join(unknown)} (사용 가능: {', '.join(available)})"
+        )
+
+
+def _matches(value: Any, wanted: set[str]) -> bool:
+    # list fields (e.g. Fact.dimensions) match when any element is wanted
+    if isinstance(value, list | tuple):
+        return any(item in wanted for item in value)
+    return value in wanted
+
+
+def shape_rows(
+    rows: Sequence[Any],
+    *,
+    fields: Sequence[str] | None = None,
+    limit: int | None = None,
+    filters: dict[str, str | list[str]] | None = None,
+) -> Sequence[Any]:
+    """Apply *filters*, then *limit*, then *fields* to a list of Structs.
+
+    Rows are returned untouched (still Structs) when no projection is asked,
+    so they can be encoded directly; projected rows become plain dicts.
+    """
+    if not rows or not isinstance(rows[0], msgspec.Struct):
+        return rows if limit is None else rows[:limit]
+    names = _field_names(rows[0])
+
+    if filters:
+        _check_fields(list(filters), names)
+        wanted = {
+            names[key]: {value} if isinstance(value, str) else set(value)
+            for key, value in filters.items()
+        }
+        rows = [
+            row
+            for row in rows
+            if all(
+                _matches(getattr(row, attr), values) for attr, values in wanted.items()
+            )
+        ]
+    if limit is not None:
+        rows = rows[:limit]
+    if fields:
+        _check_fields(fields, names)
+        pairs = [(key, names[key]) for key in fields]
+        rows = [{key: getattr(row, attr) for key, attr in pairs} for row in rows]
+    return rows
+
+
+def to_columnar(rows: Sequence[Any]) -> dict:
+    """Convert rows (Structs or dicts) to a column header plus value arrays.
+
+    Columns whose value is identical on every row (``rcept_no``,
+    ``corp_code``, ``bsns_year`` ...) are hoisted into ``constants``.
+    """
+    if not rows:
+        return {"columns": [], "constants": {}, "rows": []}
+    first = rows[0]
+    if isinstance(first, msgspec.Struct):
+        names = [f.encode_name for f in msgspec.structs.fields(first)]
+        tuples = [msgspec.structs.astuple(row) for row in rows]
+    else:
+        names = list(first)
+        tuples = [tuple(row.values()) for row in rows]
+    columns = list(zip(*tuples))
+
+    constants: dict[str, Any] = {}
+    varying: list[int] = []
+    for i, column in enumerate(columns):
+        head = column[0]
+        if len(rows) > 1 and all(value == head for value in column):
+            constants[names[i]] = head
+        else:
+            varying.append(i)
+    return {
+        "columns": [names[i] for i in varying],
+        "constants": constants,
+        "rows": list(zip(*(columns[i] for i in varying))) if varying else [],
+    }
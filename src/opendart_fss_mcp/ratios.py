@@ -0,0 +1,165 @@
+"""Vectorized financial ratios over full-statement rows (``fnlttSinglAcntAll``)."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+
+import numpy as np
+from opendart_fss.models.financial import FinancialAccount
+
+from opendart_fss_mcp.amounts import parse_amount
+
+# standard account → (statement kinds searched in order, account IDs, names)
+ACCOUNTS: dict[str, tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]] = {
+    "revenue": (
+        ("IS", "CIS"),
+        ("ifrs-full_Revenue", "ifrs_Revenue"),
+        ("매출액", "수익(매출액)", "영업수익"),
+    ),
+    "gross_profit": (("IS", "CIS"), ("ifrs-full_GrossProfit",), ("매출총이익",)),
+    "operating_income": (
+        ("IS", "CIS"),
+        ("dart_OperatingIncomeLoss",),
+        ("영업이익", "영업이익(손실)"),
+    ),
+    "net_income": (
+        ("IS", "CIS"),
+        ("ifrs-full_ProfitLoss", "ifrs_ProfitLoss"),
+        ("당기순이익", "당기순이익(손실)"),
+    ),
+    "total_assets": (("BS",), ("ifrs-full_Assets",), ("자산총계",)),
+    "current_assets": (("BS",), ("ifrs-full_CurrentAssets",), ("유동자산",)),
+    "total_liabilities": (("BS",), ("ifrs-full_Liabilities",), ("부채총계",)),
+    "current_liabilities": (
+        ("BS",),
+        ("ifrs-full_CurrentLiabilities",),
+        ("유동부채",),
+    ),
+    "total_equity": (("BS",), ("ifrs-full_Equity",), ("자본총계",)),
+    "operating_cash_flow": (
+        ("CF",),
+        ("ifrs-full_CashFlowsFromUsedInOperatingActivities",),
+        ("영업활동현금흐름", "영업활동으로인한현금흐름"),
+    ),
+}
+_INDEX = {name: i for i, name in enumerate(ACCOUNTS)}
+_FLOW_STATEMENTS = {"IS", "CIS", "CF"}
+
+RATIOS = (
+    "roe",
+    "roa",
+    "gross_margin",
+    "operating_margin",
+    "net_margin",
+    "debt_ratio",
+    "equity_ratio",
+    "current_ratio",
+    "asset_turnover",
+    "operating_cash_flow_margin",
+    "revenue_growth",
+    "operating_income_growth",
+    "net_income_growth",
+)
+
+
+def _amounts(row: FinancialAccount) -> tuple[str | None, str | None]:
+    """(current, prior) amount; flows use cumulative figures when reported."""
+    if row.sj_div in _FLOW_STATEMENTS:
+        return (
+            row.thstrm_add_amount or row.thstrm_amount,
+            row.frmtrm_add_amount or row.frmtrm_amount,
+        )
+    return row.thstrm_amount, row.frmtrm_amount
+
+
+def _match(rows: Sequence[FinancialAccount]) -> dict[str, FinancialAccount]:
+    by_id: dict[tuple[str | None, str], FinancialAccount] = {}
+    by_name: dict[tuple[str | None, str], FinancialAccount] = {}
+    for row in rows:
+        if row.account_id:
+            by_id.setdefault((row.sj_div, row.account_id), row)
+        if row.account_nm:
+            by_name.setdefault((row.sj_div, "".join(row.account_nm.split())), row)
+    matched = {}
+    for name, (kinds, ids, names) in ACCOUNTS.items():
+        for kind in kinds:
+            row = next(
+                (by_id[kind, i] for i in ids if (kind, i) in by_id),
+                None,
+            ) or next((by_name[kind, n] for n in names if (kind, n) in by_name), None)
+            if row is not None:
+                matched[name] = row
+                break
+    return matched
+
+
+def pivot(statements: Sequence[Sequence[FinancialAccount]]) -> np.ndarray:
+    """Stack each company's statements into a ``(company, account, period)`` array.
+
+    The period axis holds the current and the prior period; accounts follow
+    ``ACCOUNTS``. Missing amounts are NaN.
+    """
+    values = np.full((len(statements), len(ACCOUNTS), 2), np.nan)
+    for i, rows in enumerate(statements):
+        for name, row in _match(rows).items():
+            for period, amount in enumerate(_amounts(row)):
+                number = parse_amount(amount)
+                if number is not None:
+                    values[i, _INDEX[name], period] = number
+    return values
+
+
+def compute(values: np.ndarray) -> dict[str, np.ndarray]:
+    """Standard ratios (in percent, or times for turnover/current ratio).
+
+    Returns and turnover use the average of opening and closing balances
+    when the prior balance is known, else the closing balance.
+    """
+
+    def cur(name: str) -> np.ndarray:
+        return values[:, _INDEX[name], 0]
+
+    def prior(name: str) -> np.ndarray:
+        return values[:, _INDEX[name], 1]
+
+    def average(name: str) -> np.ndarray:
+        return np.where(np.isnan(prior(name)), cur(name), (cur(name) + prior(name)) / 2)
+
+    def growth(name: str) -> np.ndarray:
+        # growth from a negative base is not meaningful
+        base = prior(name)
+        return np.where(base > 0, (cur(name) / base - 1) * 100, np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        revenue = cur("revenue")
+        return {
+            "roe": cur("net_income") / average("total_equity") * 100,
+            "roa": cur("net_income") / average("total_assets") * 100,
+            "gross_margin": cur("gross_profit") / revenue * 100,
+            "operating_margin": cur("operating_income") / revenue * 100,
+            "net_margin": cur("net_income") / revenue * 100,
+            "debt_ratio": cur("total_liabilities") / cur("total_equity") * 100,
+            "equity_ratio": cur("total_equity") / cur("total_assets") * 100,
+            "current_ratio": cur("current_assets") / cur("current_liabilities"),
+            "asset_turnover": revenue / average("total_assets"),
+            "operating_cash_flow_margin": cur("operating_cash_flow") / revenue * 100,
+            "revenue_growth": growth("revenue"),
+            "operating_income_growth": growth("operating_income"),
+            "net_income_growth": growth("net_income"),
+        }
+
+
+def ratio_rows(
+    corp_codes: Sequence[str], statements: Sequence[Sequence[FinancialAccount]]
+) -> list[dict]:
+    """One row per company: ``corp_code`` plus every ratio, rounded; NaN → None."""
+    ratios = compute(pivot(statements))
+    table = np.round(np.column_stack([ratios[name] for name in RATIOS]), 2)
+    rows = []
+    for corp_code, values in zip(corp_codes, table.tolist()):
+        row: dict = {"corp_code": corp_code}
+        for name, value in zip(RATIOS, values):
+            row[name] = value if math.isfinite(value) else None
+        rows.append(row)
+    return rows
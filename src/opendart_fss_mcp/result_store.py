@@ -0,0 +1,131 @@
+"""Server-side storage of large tool results, read back page by page."""
+
+from __future__ import annotations
+
+import math
+import secrets
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import msgspec
+from fastmcp.exceptions import ResourceError
+
+from opendart_fss_mcp.projection import to_columnar
+from opendart_fss_mcp.response_cache import ResponseCache
+
+_MAX_RESULTS = 64
+_TTL_SECONDS = 30 * 60  # 30 minutes
+_PAGE_SIZE = 200
+_PREVIEW_ROWS = 5
+_RESULT_ID_BYTES = 8
+
+RESULT_URI = "opendart://results/{result_id}/{page}"
+
+
+@dataclass(slots=True)
+class StoredResult:
+    result_id: str
+    rows: Sequence[Any]
+    format: str
+    page_size: int
+
+    @property
+    def page_count(self) -> int:
+        return max(math.ceil(len(self.rows) / self.page_size), 1)
+
+
+def _render(rows: Sequence[Any], format: str) -> Any:
+    return to_columnar(rows) if format == "columnar" else rows
+
+
+def _envelope(
+    result_id: str, page: int, page_count: int, total_rows: int, data: Any
+) -> dict:
+    next_page = (
+        RESULT_URI.format(result_id=result_id, page=page + 1)
+        if page < page_count
+        else None
+    )
+    return {
+        "result_id": result_id,
+        "page": page,
+        "page_count": page_count,
+        "total_rows": total_rows,
+        "next": next_page,
+        "data": data,
+    }
+
+
+def envelope_size(total_rows: int) -> int:
+    """Upper bound on the bytes ``page()`` adds around a page's data."""
+    # no page number exceeds the row count; the widest page has a next link
+    result_id = "x" * len(secrets.token_urlsafe(_RESULT_ID_BYTES))
+    widest = _envelope(result_id, total_rows, total_rows + 1, total_rows, None)
+    return len(msgspec.json.encode(widest)) - len(b"null")
+
+
+class ResultStore:
+    """LRU + TTL store of result rows, addressed by a random handle."""
+
+    def __init__(
+        self, *, max_results: int = _MAX_RESULTS, ttl: float = _TTL_SECONDS
+    ) -> None:
+        self._results = ResponseCache(max_results, ttl=ttl)
+
+    def put(
+        self, rows: Sequence[Any], *, format: str = "rows", page_size: int = _PAGE_SIZE
+    ) -> StoredResult:
+        result_id = secrets.token_urlsafe(_RESULT_ID_BYTES)
+        stored = StoredResult(result_id, rows, format, page_size)
+        self._results.set(result_id, stored)
+        return stored
+
+    def get(self, result_id: str) -> StoredResult:
+        stored = self._results.get(result_id)
+        if stored is None:
+            raise ResourceError(
+                f"결과를 찾을 수 없습니다 (만료되었을 수 있음): {result_id}"
+            )
+        return stored
+
+    def summary(self, stored: StoredResult) -> dict:
+        """Small inline payload returned by the tool instead of the full result."""
+        return {
+            "result_id": stored.result_id,
+            "total_rows": len(stored.rows),
+            "page_size": stored.page_size,
+            "page_count": stored.page_count,
+            "first_page": RESULT_URI.format(result_id=stored.result_id, page=1),
+            "preview": _render(stored.rows[:_PREVIEW_ROWS], stored.format),
+            "message": (
+                "결과가 커서 서버에 저장했습니다. first_page 리소스(또는 "
+                "utility_result_page 도구)로 필요한 페이지만 읽으세요."
+            ),
+        }
+
+    def page(self, result_id: str, page: int) -> bytes:
+        """Encode page *page* (1-based) of a stored result as JSON."""
+        stored = self.get(result_id)
+        if not 1 <= page <= stored.page_count:
+            raise ResourceError(
+                f"페이지 범위를 벗어났습니다: {page} (1-{stored.page_count})"
+            )
+        start = (page - 1) * stored.page_size
+        rows = stored.rows[start : start + stored.page_size]
+        return msgspec.json.encode(
+            _envelope(
+                result_id,
+                page,
+                stored.page_count,
+                len(stored.rows),
+                _render(rows, stored.format),
+            )
+        )
+
+
+_store = ResultStore()
+
+
+def get_store() -> ResultStore:
+    return _store
@@ -0,0 +1,289 @@
+"""Cross-sectional screening store: one metric matrix per (year, report, fs_div)."""
+
+from __future__ import annotations
+
+import math
+import re
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+import numpy as np
+from fastmcp.exceptions import ToolError
+from opendart_fss.models.financial import FinancialAccount, FinancialIndicator
+
+from opendart_fss_mcp.amounts import parse_amount
+from opendart_fss_mcp.ratios import ACCOUNTS, compute, pivot
+from opendart_fss_mcp.storage import check_code, data_dir
+
+_SCREENING_DIR = "screening"
+
+# what the multi-company account API (fnlttMultiAcnt) reports
+AMOUNT_COLUMNS = (
+    "revenue",
+    "operating_income",
+    "net_income",
+    "total_assets",
+    "total_liabilities",
+    "total_equity",
+)
+RATIO_COLUMNS = (
+    "roe",
+    "roa",
+    "operating_margin",
+    "net_margin",
+    "debt_ratio",
+    "equity_ratio",
+    "current_ratio",
+    "asset_turnover",
+    "revenue_growth",
+    "operating_income_growth",
+    "net_income_growth",
+)
+_ACCOUNT_INDEX = {name: i for i, name in enumerate(ACCOUNTS)}
+_FS_DIVS = ("CFS", "OFS")
+_KEY_RE = re.compile(r"[0-9]{4}_[0-9]{5}_(CFS|OFS)")
+_CONDITION_RE = re.compile(r"^\s*(>=|<=|!=|==|=|>|<)\s*(-?[\d,]*\.?\d+)\s*$")
+_OPERATORS = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "=": np.equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+
+
+class Company(Protocol):
+    corp_code: str
+    corp_name: str
+    stock_code: str | None
+
+
+def dataset_key(bsns_year: str, reprt_code: str, fs_div: str) -> str:
+    """Name of the period's dataset; raises ValueError for malformed parts."""
+    check_code(bsns_year, 4, "bsns_year")
+    check_code(reprt_code, 5, "reprt_code")
+    if fs_div not in _FS_DIVS:
+        raise ValueError(f"fs_div는 CFS 또는 OFS여야 합니다: {fs_div!r}")
+    return f"{bsns_year}_{reprt_code}_{fs_div}"
+
+
+def _condition(expression: str) -> tuple[np.ufunc, float]:
+    match = _CONDITION_RE.match(expression)
+    if match is None:
+        raise ToolError(f"조건 형식 오류: {expression!r} (예: '>15', '<=50', '!=0')")
+    operator, number = match.groups()
+    return _OPERATORS[operator], float(number.replace(",", ""))
+
+
+@dataclass(slots=True)
+class Dataset:
+    """Metrics of every company for one period, as parallel arrays.
+
+    Row *i* of ``values`` belongs to ``corp_codes[i]``; column *j* is
+    ``columns[j]``. Missing values are NaN, so they fail every condition.
+    """
+
+    key: str
+    corp_codes: np.ndarray
+    corp_names: np.ndarray
+    stock_codes: np.ndarray
+    corp_cls: np.ndarray  # "" where the market is unknown
+    columns: list[str]
+    values: np.ndarray
+    built_at: float
+
+    def summary(self) -> dict:
+        known = int(np.count_nonzero(self.corp_cls))
+        return {
+            "dataset": self.key,
+            "companies": len(self.corp_codes),
+            "with_market": known,
+            "columns": self.columns,
+            "built_at": time.strftime(
+                "%Y-%m-%dT%H:%M:%S", time.localtime(self.built_at)
+            ),
+        }
+
+    def screen(
+        self,
+        conditions: Mapping[str, str | Sequence[str]],
+        *,
+        corp_cls: str | None = None,
+        sort_by: str | None = None,
+        descending: bool = True,
+        limit: int = 50,
+        columns: Sequence[str] | None = None,
+    ) -> list[dict]:
+        """Companies meeting every condition, ranked by *sort_by*.
+
+        Each condition is a comparison such as ``">15"``; a column may be
+        given a list of them (e.g. ``[">=10", "<30"]``).
+        """
+        position = {name: j for j, name in enumerate(self.columns)}
+        wanted = list(
+            dict.fromkeys(
+                [*conditions, *([sort_by] if sort_by else []), *(columns or [])]
+            )
+        )
+        unknown = [name for name in wanted if name not in position]
+        if unknown:
+            raise ToolError(
+                f"알 수 없는 지표: {', '.join(unknown)} "
+                f"(사용 가능: {', '.join(self.columns)})"
+            )
+        mask = np.ones(len(self.corp_codes), dtype=bool)
+        if corp_cls:
+            mask &= self.corp_cls == corp_cls
+        for name, expressions in conditions.items():
+            column = self.values[:, position[name]]
+            if isinstance(expressions, str):
+                expressions = [expressions]
+            for expression in expressions:
+                operator, number = _condition(expression)
+                with np.errstate(invalid="ignore"):
+                    mask &= operator(column, number)
+        (hits,) = np.nonzero(mask)
+        if sort_by:
+            keys = self.values[hits, position[sort_by]]
+            # NaN sorts last in either direction
+            order = np.argsort(-keys if descending else keys, kind="stable")
+            hits = hits[order]
+        shown = list(columns) if columns else [*AMOUNT_COLUMNS, *RATIO_COLUMNS]
+        for name in wanted:
+            if name not in shown:
+                shown.append(name)
+        rows = []
+        for i in hits[:limit].tolist():
+            row = {
+                "corp_code": str(self.corp_codes[i]),
+                "corp_name": str(self.corp_names[i]),
+                "stock_code": str(self.stock_codes[i]),
+                "corp_cls": str(self.corp_cls[i]) or None,
+            }
+            for name in shown:
+                value = float(self.values[i, position[name]])
+                row[name] = round(value, 2) if math.isfinite(value) else None
+            rows.append(row)
+        return rows
+
+
+def build_dataset(
+    key: str,
+    companies: Sequence[Company],
+    accounts: Sequence[FinancialAccount],
+    indicators: Sequence[FinancialIndicator] = (),
+    *,
+    fs_div: str,
+    corp_classes: Mapping[str, str] | None = None,
+) -> Dataset:
+    """Pivot bulk ``multi_account`` (and optional ``indicators``) rows.
+
+    Only companies with account rows for *fs_div* are kept. Each indicator
+    (``idx_nm``) becomes an extra column.
+    """
+    by_corp: dict[str, list[FinancialAccount]] = {}
+    for row in accounts:
+        if row.corp_code and row.fs_div in (None, fs_div):
+            by_corp.setdefault(row.corp_code, []).append(row)
+    kept = [c for c in companies if c.corp_code in by_corp]
+    raw = pivot([by_corp[c.corp_code] for c in kept])
+    ratios = compute(raw)
+    columns = [
+        *(raw[:, _ACCOUNT_INDEX[name], 0] for name in AMOUNT_COLUMNS),
+        *(ratios[name] for name in RATIO_COLUMNS),
+    ]
+    names = [*AMOUNT_COLUMNS, *RATIO_COLUMNS]
+
+    row_of = {c.corp_code: i for i, c in enumerate(kept)}
+    indicator_values: dict[str, np.ndarray] = {}
+    for item in indicators:
+        i = row_of.get(item.corp_code or "")
+        number = parse_amount(item.idx_val)
+        if i is None or not item.idx_nm or number is None:
+            continue
+        column = indicator_values.get(item.idx_nm)
+        if column is None:
+            column = indicator_values[item.idx_nm] = np.full(len(kept), np.nan)
+        column[i] = number
+    columns.extend(indicator_values.values())
+    names.extend(indicator_values)
+
+    classes = corp_classes or {}
+    return Dataset(
+        key=key,
+        corp_codes=np.array([c.corp_code for c in kept], dtype=str),
+        corp_names=np.array([c.corp_name for c in kept], dtype=str),
+        stock_codes=np.array([c.stock_code or "" for c in kept], dtype=str),
+        corp_cls=np.array([classes.get(c.corp_code, "") for c in kept], dtype=str),
+        columns=names,
+        values=np.column_stack(columns) if kept else np.empty((0, len(names))),
+        built_at=time.time(),
+    )
+
+
+class ScreeningStore:
+    """Datasets saved as ``<key>.npz`` and kept in memory once loaded."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._loaded: dict[str, Dataset] = {}
+
+    def _path(self, key: str) -> Path:
+        # keys become file names; only those made by dataset_key() are accepted
+        if not _KEY_RE.fullmatch(key):
+            raise ValueError(f"잘못된 데이터셋 키: {key!r}")
+        return self.root / f"{key}.npz"
+
+    def keys(self) -> list[str]:
+        return sorted(
+            path.stem for path in self.root.glob("*.npz") if ".tmp" not in path.name
+        )
+
+    def get(self, key: str) -> Dataset | None:
+        dataset = self._loaded.get(key)
+        if dataset is None and self._path(key).exists():
+            with np.load(self._path(key), allow_pickle=False) as data:
+                dataset = Dataset(
+                    key=key,
+                    corp_codes=data["corp_codes"],
+                    corp_names=data["corp_names"],
+                    stock_codes=data["stock_codes"],
+                    corp_cls=data["corp_cls"],
+                    columns=data["columns"].tolist(),
+                    values=data["values"],
+                    built_at=float(data["built_at"]),
+                )
+            self._loaded[key] = dataset
+        return dataset
+
+    def put(self, dataset: Dataset) -> None:
+        tmp = self._path(dataset.key).with_suffix(".tmp.npz")
+        np.savez_compressed(
+            tmp,
+            corp_codes=dataset.corp_codes,
+            corp_names=dataset.corp_names,
+            stock_codes=dataset.stock_codes,
+            corp_cls=dataset.corp_cls,
+            columns=np.array(dataset.columns, dtype=str),
+            values=dataset.values,
+            built_at=np.array(dataset.built_at),
+        )
+        tmp.replace(self._path(dataset.key))
+        self._loaded[dataset.key] = dataset
+
+
+_store: ScreeningStore | None = None
+
+
+def get_screening_store() -> ScreeningStore:
+    """Return the shared screening store kept in the data directory."""
+    global _store
+    if _store is None:
+        _store = ScreeningStore(data_dir() / _SCREENING_DIR)
+    return _store
@@ -7,6 +7,8 @@ import asyncio
 from fastmcp import FastMCP
 from starlette.responses import JSONResponse
 
+from opendart_fss_mcp import deps
+from opendart_fss_mcp.result_store import RESULT_URI, get_store
 from opendart_fss_mcp.tools import (
     disclosure,
     financial,
@@ -45,10 +47,16 @@ mcp = FastMCP(
 @mcp.custom_route("/health", methods=["GET"])
 async def health(request: object) -> JSONResponse:
     return JSONResponse(
-        {"status": "ok", "service": "opendart-mcp", "version": __version__}
+        {"service": "opendart-mcp", "version": __version__, **deps.health()}
     )
 
 
+@mcp.resource(RESULT_URI, mime_type="application/json")
+def result_page(result_id: str, page: int) -> str:
+    """서버에 저장된 대용량 결과의 한 페이지를 반환합니다."""
+    return get_store().page(result_id, page).decode()
+
+
 _SERVERS = [
     (disclosure.mcp, "disclosure"),
     (financial.mcp, "financial"),
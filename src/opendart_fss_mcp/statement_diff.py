@@ -0,0 +1,95 @@
+"""Line-by-line comparison of two periods of full financial statements."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+from opendart_fss.models.financial import FinancialAccount
+
+from opendart_fss_mcp.amounts import parse_amount
+
+# account_id DART reports for company-specific (non-taxonomy) lines
+_NON_STANDARD_ID = "-표준계정코드 미사용-"
+
+
+def _keyed(rows: Iterable[FinancialAccount]) -> dict[tuple, FinancialAccount]:
+    """Rows by (statement, account, detail); repeats get an ordinal suffix.
+
+    Taxonomy lines are matched by ``account_id``; company-specific lines,
+    whose ID is a placeholder, by their space-insensitive name.
+    """
+    keyed: dict[tuple, FinancialAccount] = {}
+    for row in rows:
+        account = row.account_id
+        if not account or account == _NON_STANDARD_ID:
+            account = "".join((row.account_nm or "").split())
+        base = (row.sj_div, account, row.account_detail or "")
+        key, n = base + (0,), 0
+        while key in keyed:
+            n += 1
+            key = base + (n,)
+        keyed[key] = row
+    return keyed
+
+
+def diff_statements(
+    before: Sequence[FinancialAccount],
+    after: Sequence[FinancialAccount],
+    *,
+    min_change_pct: float = 0.0,
+) -> tuple[list[dict], int]:
+    """Changed, added and removed lines of *after* relative to *before*.
+
+    A line whose relative change is below *min_change_pct* (in percent) is
+    counted as unchanged. Returns the lines in *after*'s order followed by
+    removed lines, and the number of unchanged lines.
+    """
+    old = _keyed(before)
+    new = _keyed(after)
+    lines: list[dict] = []
+    unchanged = 0
+    for key, row in new.items():
+        value = parse_amount(row.thstrm_amount)
+        previous = old.get(key)
+        if previous is None:
+            if value is not None:
+                lines.append(_line(row, None, value, "added"))
+            continue
+        prior = parse_amount(previous.thstrm_amount)
+        if value == prior:
+            unchanged += 1
+            continue
+        line = _line(row, prior, value, "changed")
+        pct = line["change_pct"]
+        if pct is not None and abs(pct) < min_change_pct:
+            unchanged += 1
+            continue
+        lines.append(line)
+    for key, row in old.items():
+        if key not in new and (value := parse_amount(row.thstrm_amount)) is not None:
+            lines.append(_line(row, value, None, "removed"))
+    return lines, unchanged
+
+
+def _line(
+    row: FinancialAccount,
+    before: float | None,
+    after: float | None,
+    status: str,
+) -> dict:
+    change = pct = None
+    if before is not None and after is not None:
+        change = after - before
+        if before:
+            pct = round(change / abs(before) * 100, 2)
+    return {
+        "sj_div": row.sj_div,
+        "account_id": row.account_id,
+        "account_nm": row.account_nm,
+        "account_detail": row.account_detail,
+        "before": before,
+        "after": after,
+        "change": change,
+        "change_pct": pct,
+        "status": status,
+    }
@@ -0,0 +1,60 @@
+"""Location of on-disk data (disclosure index, document archive, caches)."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+
+_APP_DIR = "opendart-fss-mcp"
+
+_data_dir: Path | None = None
+
+
+def configure(data_dir: str | os.PathLike[str] | None) -> None:
+    """Override the data directory before server startup."""
+    global _data_dir
+    _data_dir = Path(data_dir).expanduser() if data_dir else None
+
+
+def data_dir() -> Path:
+    """Return the data directory, creating it on first use.
+
+    Defaults to ``$OPENDART_MCP_DATA_DIR``, else ``$XDG_CACHE_HOME`` or
+    ``~/.cache``, under an ``opendart-fss-mcp`` subdirectory.
+    """
+    path = _data_dir
+    if path is None:
+        env = os.environ.get("OPENDART_MCP_DATA_DIR")
+        if env:
+            path = Path(env).expanduser()
+        else:
+            cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+            path = Path(cache_home) / _APP_DIR
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def check_code(value: str, digits: int, name: str) -> str:
+    """Return *value* if it is exactly *digits* ASCII digits, else raise.
+
+    Codes from tool arguments (``rcept_no``, ``corp_code``) become file
+    names, so anything else (``../`` in particular) is rejected.
+    """
+    if len(value) != digits or not (value.isascii() and value.isdigit()):
+        raise ValueError(f"{name}는 {digits}자리 숫자여야 합니다: {value!r}")
+    return value
+
+
+def write_atomic(path: Path, chunks: Iterable[bytes]) -> None:
+    """Write *chunks* to a temp file beside *path*, then rename it into place."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
@@ -0,0 +1,165 @@
+"""XBRL taxonomy cache: every statement type, persisted on disk, indexed in memory."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import msgspec
+from fastmcp.exceptions import ToolError
+from opendart_fss.models.financial import XbrlTaxonomy
+
+from opendart_fss_mcp.client_pool import PooledClient
+from opendart_fss_mcp.deps import gather_calls
+from opendart_fss_mcp.storage import data_dir, write_atomic
+
+SJ_DIVS = ("BS", "IS", "CIS", "CF", "SCE")
+_FILE_NAME = "taxonomy.json"
+_TTL_SECONDS = 30 * 24 * 60 * 60  # the taxonomy is revised at most yearly
+
+
+class _Snapshot(msgspec.Struct):
+    fetched_at: float  # epoch seconds, so the TTL survives restarts
+    items: dict[str, list[XbrlTaxonomy]]
+
+
+def _normalize(text: str | None) -> str:
+    return "".join(text.split()).lower() if text else ""
+
+
+@dataclass(slots=True)
+class _Entry:
+    sj_div: str
+    item: XbrlTaxonomy
+    keys: tuple[str, ...]  # normalized account ID, Korean/English label, name
+
+
+class TaxonomyCache:
+    """Lazy-loaded taxonomy of all five ``sj_div`` values.
+
+    The five lists are fetched together, written to ``taxonomy.json`` in the
+    data directory and reused across restarts for 30 days. If a refresh
+    fails, the expired copy keeps being served.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self._path = Path(path) if path else None
+        self._items: dict[str, list[XbrlTaxonomy]] = {}
+        self._entries: list[_Entry] = []
+        self._by_account_id: dict[str, list[XbrlTaxonomy]] = {}
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path or data_dir() / _FILE_NAME
+
+    def _is_expired(self) -> bool:
+        return time.time() - self._fetched_at > _TTL_SECONDS
+
+    def _index(self, snapshot: _Snapshot) -> None:
+        entries: list[_Entry] = []
+        by_id: dict[str, list[XbrlTaxonomy]] = {}
+        for sj_div, items in snapshot.items.items():
+            for item in items:
+                keys = (
+                    _normalize(item.account_id),
+                    _normalize(item.label_kor),
+                    _normalize(item.label_eng),
+                    _normalize(item.account_nm),
+                )
+                entries.append(_Entry(sj_div, item, keys))
+                if item.account_id:
+                    by_id.setdefault(item.account_id, []).append(item)
+        self._items = snapshot.items
+        self._entries = entries
+        self._by_account_id = by_id
+        self._fetched_at = snapshot.fetched_at
+
+    def _read(self) -> _Snapshot | None:
+        try:
+            return msgspec.json.decode(self.path.read_bytes(), type=_Snapshot)
+        except (FileNotFoundError, msgspec.DecodeError):
+            return None
+
+    async def _ensure_loaded(self, client: PooledClient) -> None:
+        if self._items and not self._is_expired():
+            return
+        async with self._lock:
+            if self._items and not self._is_expired():
+                return
+            if not self._items:
+                snapshot = await asyncio.to_thread(self._read)
+                if snapshot is not None:
+                    self._index(snapshot)
+                    if not self._is_expired():
+                        return
+            await self._refresh(client)
+
+    async def _refresh(self, client: PooledClient) -> None:
+        try:
+            results = await gather_calls(
+                client.financial.get_xbrl_taxonomy(sj_div=sj_div) for sj_div in SJ_DIVS
+            )
+        except ToolError:
+            if self._items:
+                return  # keep serving the expired copy
+            raise
+        snapshot = _Snapshot(time.time(), dict(zip(SJ_DIVS, results)))
+        await asyncio.to_thread(
+            write_atomic, self.path, [msgspec.json.encode(snapshot)]
+        )
+        self._index(snapshot)
+
+    async def items(self, client: PooledClient, sj_div: str) -> list[XbrlTaxonomy]:
+        await self._ensure_loaded(client)
+        try:
+            return self._items[sj_div.upper()]
+        except KeyError:
+            raise ToolError(
+                f"입력값 오류: sj_div는 {', '.join(SJ_DIVS)} 중 하나입니다"
+            ) from None
+
+    async def lookup(self, client: PooledClient, account_id: str) -> list[XbrlTaxonomy]:
+        """Every statement entry of *account_id* (e.g. ``ifrs-full_Revenue``)."""
+        await self._ensure_loaded(client)
+        return self._by_account_id.get(account_id, [])
+
+    async def search(
+        self,
+        client: PooledClient,
+        query: str,
+        *,
+        sj_div: str | None = None,
+        max_results: int = 20,
+    ) -> list[XbrlTaxonomy]:
+        """Match *query* against account IDs and labels, ignoring case and spaces.
+
+        Exact matches come first, then prefix, then substring matches.
+        """
+        await self._ensure_loaded(client)
+        wanted = _normalize(query)
+        if not wanted:
+            return []
+        exact: list[XbrlTaxonomy] = []
+        prefix: list[XbrlTaxonomy] = []
+        substring: list[XbrlTaxonomy] = []
+        for entry in self._entries:
+            if sj_div and entry.sj_div != sj_div.upper():
+                continue
+            if wanted in entry.keys:
+                exact.append(entry.item)
+            elif any(key.startswith(wanted) for key in entry.keys):
+                prefix.append(entry.item)
+            elif any(wanted in key for key in entry.keys):
+                substring.append(entry.item)
+        return (exact + prefix + substring)[:max_results]
+
+
+_cache = TaxonomyCache()
+
+
+def get_taxonomy_cache() -> TaxonomyCache:
+    return _cache
@@ -1,19 +1,148 @@
 """공시정보 (DS001) - Disclosure Information tools."""
 
-from typing import Annotated
+import asyncio
+import math
+from datetime import date, datetime, timedelta
+from typing import Annotated, Any
 
 from fastmcp import FastMCP
 from fastmcp.dependencies import Depends
+from fastmcp.exceptions import ToolError
+from fastmcp.tools.tool import ToolResult
+from opendart_fss.models.disclosure import Disclosure, DisclosureListResponse
 from pydantic import Field
 
+from opendart_fss_mcp.client_pool import KST, PooledClient
 from opendart_fss_mcp.corp_code_cache import get_cache
-from opendart_fss_mcp.deps import call_api, get_client, to_dict
+from opendart_fss_mcp.deps import (
+    call_api,
+    gather_calls,
+    get_client,
+    is_no_data,
+    to_result,
+)
+from opendart_fss_mcp.disclosure_index import (
+    PUBLICATION_TYPES,
+    DisclosureIndex,
+    format_day,
+    get_index,
+    is_day,
+    parse_day,
+)
+from opendart_fss_mcp.document_archive import ArchivedDocument, get_archive
+from opendart_fss_mcp.document_reader import DocumentReader
+from opendart_fss_mcp.document_search import get_fulltext
+from opendart_fss_mcp.document_sections import load_sections
+from opendart_fss_mcp.projection import FIELDS, FILTERS, FORMAT, LIMIT
 
 mcp = FastMCP(name="Disclosure")
 
 TOOL_ANNOTATIONS = {"readOnlyHint": True, "openWorldHint": True}
+SYNC_ANNOTATIONS = {
+    "readOnlyHint": False,
+    "idempotentHint": True,
+    "openWorldHint": True,
+}
 TAGS = {"disclosure"}
 
+_LIST_PAGE_SIZE = 100  # OpenDART maximum page_count for list.json
+_DEFAULT_PAGE_COUNT = 10  # OpenDART default page_count
+_DEFAULT_MAX_ROWS = 1_000
+_MAX_ROWS = 10_000
+_DEFAULT_SYNC_DAYS = 7
+_SYNC_WINDOW_DAYS = 31  # list.json allows at most 3 months without corp_code
+_DEFAULT_TEXT_CHARS = 20_000
+_MAX_TEXT_CHARS = 100_000
+
+
+def _list_page(client: PooledClient, params: dict[str, Any], page_no: int) -> Any:
+    # disclosure.search() drops total_page, so request the full response model
+    return client.disclosure._get(
+        "/api/list.json",
+        DisclosureListResponse,
+        params={**params, "page_no": page_no, "page_count": _LIST_PAGE_SIZE},
+    )
+
+
+async def search_all_pages(
+    client: PooledClient, params: dict[str, Any], *, max_rows: int | None
+) -> list[Disclosure]:
+    """Fetch page 1, then the remaining pages (up to *max_rows*) concurrently."""
+    first = await call_api(_list_page(client, params, 1))
+    page_total = first.total_page or 1
+    if max_rows is not None:
+        page_total = min(page_total, math.ceil(max_rows / _LIST_PAGE_SIZE))
+    rest = await gather_calls(
+        _list_page(client, params, page_no) for page_no in range(2, page_total + 1)
+    )
+    rows = list(first.items)
+    for page in rest:
+        rows.extend(page.items)
+    return rows[:max_rows]
+
+
+def _search_local(
+    index: DisclosureIndex,
+    params: dict[str, Any],
+    *,
+    offset: int,
+    limit: int,
+) -> list[Disclosure] | None:
+    """Answer from the local index, or None if the query needs OpenDART."""
+    bgn_de, end_de = params["bgn_de"], params["end_de"]
+    if (
+        not bgn_de
+        or not end_de
+        or params["last_reprt_at"] == "Y"
+        or params["pblntf_detail_ty"]
+        # left to OpenDART, which reports malformed dates as a parameter error
+        or not (is_day(bgn_de) and is_day(end_de))
+        or not index.covers(bgn_de, end_de)
+    ):
+        return None
+    return index.search(
+        bgn_de=bgn_de,
+        end_de=end_de,
+        corp_code=params["corp_code"],
+        pblntf_ty=params["pblntf_ty"],
+        corp_cls=params["corp_cls"],
+        sort=params["sort"],
+        sort_mth=params["sort_mth"],
+        offset=offset,
+        limit=limit,
+    )
+
+
+async def _fetch_type(
+    client: PooledClient, bgn_de: str, end_de: str, pblntf_ty: str
+) -> list[Disclosure]:
+    params = {"bgn_de": bgn_de, "end_de": end_de, "pblntf_ty": pblntf_ty}
+    try:
+        return await search_all_pages(client, params, max_rows=None)
+    except ToolError as e:
+        if is_no_data(e):
+            return []  # no filings of this type in the window
+        raise
+
+
+async def sync_window(
+    client: PooledClient, index: DisclosureIndex, bgn_de: str, end_de: str
+) -> int:
+    """Fetch every filing in the window into *index*; returns the row count."""
+    added = 0
+    day, end = parse_day(bgn_de), parse_day(end_de)
+    while day <= end:
+        window_end = min(day + timedelta(days=_SYNC_WINDOW_DAYS - 1), end)
+        bgn, last = format_day(day), format_day(window_end)
+        results = await asyncio.gather(
+            *(_fetch_type(client, bgn, last, ty) for ty in PUBLICATION_TYPES)
+        )
+        for ty, rows in zip(PUBLICATION_TYPES, results):
+            added += await asyncio.to_thread(index.add, ty, rows)
+        await asyncio.to_thread(index.mark_synced, bgn, last)
+        day = window_end + timedelta(days=1)
+    return added
+
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
 async def search_company(
@@ -60,45 +189,273 @@ async def search(
     sort_mth: Annotated[str | None, Field(description="정렬방법 (asc, desc)")] = None,
     page_no: Annotated[int | None, Field(description="페이지 번호")] = None,
     page_count: Annotated[int | None, Field(description="페이지 당 건수")] = None,
+    all_pages: Annotated[
+        bool,
+        Field(
+            description=(
+                "전체 페이지 조회 여부. true이면 page_no/page_count를 무시하고 "
+                "모든 페이지를 동시에 가져와 하나의 결과로 합칩니다"
+            )
+        ),
+    ] = False,
+    max_rows: Annotated[
+        int,
+        Field(description="all_pages 사용 시 최대 조회 건수", ge=1, le=_MAX_ROWS),
+    ] = _DEFAULT_MAX_ROWS,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
-    """공시 정보를 검색합니다."""
-    result = await call_api(
-        client.disclosure.search(
-            corp_code=corp_code,
-            bgn_de=bgn_de,
-            end_de=end_de,
-            last_reprt_at=last_reprt_at,
-            pblntf_ty=pblntf_ty,
-            pblntf_detail_ty=pblntf_detail_ty,
-            corp_cls=corp_cls,
-            sort=sort,
-            sort_mth=sort_mth,
-            page_no=page_no,
-            page_count=page_count,
-        )
+) -> ToolResult:
+    """공시 정보를 검색합니다.
+
+    기간 내 공시 전체가 필요하면 all_pages=true로 한 번에 조회하세요.
+    결과가 크면 페이지 단위로 읽을 수 있는 결과 핸들이 반환됩니다.
+    disclosure_sync_index로 동기화된 기간은 로컬 색인에서 응답합니다
+    (공시상세유형 또는 최종보고서 검색은 제외).
+    """
+    params = {
+        "corp_code": corp_code,
+        "bgn_de": bgn_de,
+        "end_de": end_de,
+        "last_reprt_at": last_reprt_at,
+        "pblntf_ty": pblntf_ty,
+        "pblntf_detail_ty": pblntf_detail_ty,
+        "corp_cls": corp_cls,
+        "sort": sort,
+        "sort_mth": sort_mth,
+    }
+    if all_pages:
+        offset, rows = 0, max_rows
+    else:
+        rows = page_count or _DEFAULT_PAGE_COUNT
+        offset = ((page_no or 1) - 1) * rows
+    result = await asyncio.to_thread(
+        _search_local, get_index(), params, offset=offset, limit=rows
     )
-    return to_dict(result)
+    if result is None and all_pages:
+        result = await search_all_pages(client, params, max_rows=max_rows)
+    elif result is None:
+        result = await call_api(
+            client.disclosure.search(**params, page_no=page_no, page_count=page_count)
+        )
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
+
+
+def _parse_day(value: str, name: str) -> date:
+    try:
+        return parse_day(value)
+    except ValueError:
+        raise ToolError(
+            f"{name}는 YYYYMMDD 형식의 날짜여야 합니다: {value!r}"
+        ) from None
+
+
+@mcp.tool(tags=TAGS, annotations=SYNC_ANNOTATIONS)
+async def sync_index(
+    bgn_de: Annotated[
+        str | None,
+        Field(description="시작일 (YYYYMMDD). 생략 시 마지막 동기화 다음 날"),
+    ] = None,
+    end_de: Annotated[
+        str | None, Field(description="종료일 (YYYYMMDD). 생략 시 어제")
+    ] = None,
+    client=Depends(get_client),
+) -> dict:
+    """공시 검색용 로컬 색인을 기간 단위로 동기화합니다.
+
+    동기화된 기간의 disclosure_search 요청은 OpenDART 호출 없이 로컬 색인에서
+    응답합니다. 공시가 계속 추가되는 오늘 날짜는 동기화하지 않습니다.
+    """
+    index = get_index()
+    yesterday = datetime.now(KST).date() - timedelta(days=1)
+    end = min(_parse_day(end_de, "end_de"), yesterday) if end_de else yesterday
+    if bgn_de:
+        bgn = _parse_day(bgn_de, "bgn_de")
+    elif (last := index.last_synced_day()) is not None:
+        bgn = parse_day(last) + timedelta(days=1)
+    else:
+        bgn = end - timedelta(days=_DEFAULT_SYNC_DAYS - 1)
+    if bgn > end:
+        return {"added": 0, "message": "이미 최신 상태입니다", **index.stats()}
+    added = await sync_window(client, index, format_day(bgn), format_day(end))
+    return {
+        "bgn_de": format_day(bgn),
+        "end_de": format_day(end),
+        "added": added,
+        **index.stats(),
+    }
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
 async def company(
     corp_code: Annotated[str, Field(description="고유번호 (8자리)")],
     client=Depends(get_client),
-) -> dict:
+) -> ToolResult:
     """기업 개황 정보를 조회합니다."""
     result = await call_api(client.disclosure.get_company(corp_code=corp_code))
-    return to_dict(result)
+    return to_result(result)
+
+
+async def _archived_document(
+    client: PooledClient, rcept_no: str
+) -> tuple[ArchivedDocument, bool]:
+    """Archived copy of the filing, downloading it first if needed."""
+    archive = get_archive()
+    archived = await asyncio.to_thread(archive.get, rcept_no)
+    if archived is not None:
+        return archived, True
+    data = await call_api(client.disclosure.download_document(rcept_no=rcept_no))
+    archived = await asyncio.to_thread(archive.put, rcept_no, data)
+    await asyncio.to_thread(get_fulltext().add, archived)
+    return archived, False
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
 async def document(
     rcept_no: Annotated[str, Field(description="접수번호 (14자리)")],
     client=Depends(get_client),
-) -> str:
-    """공시 원문 문서를 다운로드합니다. ZIP 파일의 바이트를 반환합니다."""
-    result = await call_api(client.disclosure.download_document(rcept_no=rcept_no))
-    return f"ZIP 파일 다운로드 완료 ({len(result)} bytes)"
+) -> dict:
+    """공시 원문 문서(ZIP)를 로컬 보관소에 저장하고 메타데이터를 반환합니다.
+
+    접수번호(rcept_no)가 문서 핸들입니다. 이미 보관된 문서는 다시 내려받지
+    않습니다 (cached=true).
+    """
+    archived, cached = await _archived_document(client, rcept_no)
+    return {**await asyncio.to_thread(archived.metadata), "cached": cached}
+
+
+def _read_text(
+    archived: ArchivedDocument, member: str | None, offset: int, max_chars: int
+) -> dict:
+    with DocumentReader(archived.path) as reader:
+        name = member or reader.main_member(archived.rcept_no)
+        try:
+            return reader.read_text(name, offset=offset, max_chars=max_chars)
+        except KeyError as e:
+            members = ", ".join(m["name"] for m in reader.members())
+            raise ToolError(f"문서에 없는 파일: {name} (파일 목록: {members})") from e
+
+
+@mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
+async def document_text(
+    rcept_no: Annotated[str, Field(description="접수번호 (14자리)")],
+    member: Annotated[
+        str | None,
+        Field(description="ZIP 내 파일명 (생략 시 본문 '<접수번호>.xml')"),
+    ] = None,
+    offset: Annotated[int, Field(description="시작 위치 (문자 단위)", ge=0)] = 0,
+    max_chars: Annotated[
+        int, Field(description="최대 반환 문자 수", ge=1, le=_MAX_TEXT_CHARS)
+    ] = _DEFAULT_TEXT_CHARS,
+    client=Depends(get_client),
+) -> dict:
+    """공시 원문의 텍스트 일부를 태그를 제거해 반환합니다.
+
+    보관되지 않은 문서는 먼저 내려받아 보관합니다. 다음 구간은
+    next_offset을 offset으로 넘겨 이어서 읽으세요 (null이면 끝).
+    """
+    archived, _ = await _archived_document(client, rcept_no)
+    return await asyncio.to_thread(_read_text, archived, member, offset, max_chars)
+
+
+def _read_section(
+    archived: ArchivedDocument, title: str | None, offset: int, max_chars: int
+) -> dict:
+    sections = load_sections(archived)
+    if not title:
+        return {
+            "rcept_no": archived.rcept_no,
+            "sections": [
+                {"title": s.title, "level": s.level, "size": s.end - s.start}
+                for s in sections.index.sections
+            ],
+        }
+    matches = sections.find(title)
+    if not matches:
+        raise ToolError(
+            f"목차에 없는 제목: {title} (title 없이 호출하면 목차를 반환합니다)"
+        )
+    section = matches[0]
+    text = sections.read(section)
+    window = text[offset : offset + max_chars]
+    more = offset + max_chars < len(text)
+    return {
+        "rcept_no": archived.rcept_no,
+        "title": section.title,
+        "offset": offset,
+        "text": window,
+        "next_offset": offset + len(window) if more else None,
+        "other_matches": [s.title for s in matches[1:]],
+    }
+
+
+@mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
+async def document_section(
+    rcept_no: Annotated[str, Field(description="접수번호 (14자리)")],
+    title: Annotated[
+        str | None,
+        Field(
+            description=(
+                "읽을 목차 제목 (예: 'II. 사업의 내용', '감사의견'). "
+                "공백 무시, 부분 일치 허용. 생략 시 목차 반환"
+            )
+        ),
+    ] = None,
+    offset: Annotated[
+        int, Field(description="섹션 내 시작 위치 (문자 단위)", ge=0)
+    ] = 0,
+    max_chars: Annotated[
+        int, Field(description="최대 반환 문자 수", ge=1, le=_MAX_TEXT_CHARS)
+    ] = _DEFAULT_TEXT_CHARS,
+    client=Depends(get_client),
+) -> dict:
+    """공시 원문의 목차 또는 특정 섹션 본문을 반환합니다.
+
+    처음 읽을 때 본문 텍스트와 목차 색인을 만들어 보관소에 저장하므로,
+    이후 섹션 조회는 해당 섹션 크기만큼만 읽습니다.
+    """
+    archived, _ = await _archived_document(client, rcept_no)
+    return await asyncio.to_thread(_read_section, archived, title, offset, max_chars)
+
+
+def _search_documents(
+    query: str, rcept_nos: list[str] | None, limit: int
+) -> list[dict]:
+    archive, fulltext, index = get_archive(), get_fulltext(), get_index()
+    # catch up on documents archived before the full-text index existed
+    for rcept_no in sorted(archive.rcept_nos() - fulltext.indexed()):
+        if (archived := archive.get(rcept_no)) is not None:
+            fulltext.add(archived)
+    results = fulltext.search(query, archive, limit=limit, rcept_nos=rcept_nos)
+    for result in results:
+        if (filing := index.get(result["rcept_no"])) is not None:
+            result["corp_name"] = filing.corp_name
+            result["report_nm"] = filing.report_nm
+            result["rcept_dt"] = filing.rcept_dt
+    return results
+
+
+@mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
+async def search_documents(
+    query: Annotated[
+        str,
+        Field(description="검색어. 공백으로 구분한 모든 단어를 포함하는 구간 검색"),
+    ],
+    rcept_nos: Annotated[
+        list[str] | None, Field(description="검색할 접수번호 목록 (생략 시 전체)")
+    ] = None,
+    limit: Annotated[int, Field(description="최대 결과 수", ge=1, le=100)] = 20,
+) -> list[dict]:
+    """로컬에 보관된 공시 원문 전체에서 검색어를 찾아 구간 발췌를 반환합니다.
+
+    disclosure_document 등으로 내려받은 문서만 검색합니다. 한글은 두 글자
+    단위로 색인하므로 '유상증자', '횡령' 같은 단어가 복합어 안에서도 검색됩니다.
+    결과의 section을 disclosure_document_section의 title로 넘기면 본문을 읽을 수
+    있습니다.
+    """
+    return await asyncio.to_thread(_search_documents, query, rcept_nos, limit)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
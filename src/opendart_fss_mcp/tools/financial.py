@@ -1,18 +1,143 @@
 """재무정보 (DS003) - Financial Information tools."""
 
-from typing import Annotated
+import asyncio
+import zipfile
+from collections.abc import Callable, Sequence
+from typing import Annotated, Any, Literal
 
 from fastmcp import FastMCP
 from fastmcp.dependencies import Depends
+from fastmcp.exceptions import ToolError
+from fastmcp.tools.tool import ToolResult
+from opendart_fss.models.financial import FinancialAccount
 from pydantic import Field
 
-from opendart_fss_mcp.deps import call_api, get_client, to_dict
+from opendart_fss_mcp.amounts import parse_amount
+from opendart_fss_mcp.client_pool import ApiCall
+from opendart_fss_mcp.corp_code_cache import get_cache
+from opendart_fss_mcp.deps import (
+    call_api,
+    gather_calls,
+    get_client,
+    is_no_data,
+    to_result,
+)
+from opendart_fss_mcp.disclosure_index import get_index
+from opendart_fss_mcp.projection import FIELDS, FILTERS, FORMAT, LIMIT, to_columnar
+from opendart_fss_mcp.ratios import ratio_rows
+from opendart_fss_mcp.screening import (
+    build_dataset,
+    dataset_key,
+    get_screening_store,
+)
+from opendart_fss_mcp.statement_diff import diff_statements
+from opendart_fss_mcp.taxonomy_cache import get_taxonomy_cache
+from opendart_fss_mcp.xbrl_facts import FactTable, get_xbrl_store
 
 mcp = FastMCP(name="Financial")
 
 TOOL_ANNOTATIONS = {"readOnlyHint": True, "openWorldHint": True}
+SYNC_ANNOTATIONS = {
+    "readOnlyHint": False,
+    "idempotentHint": True,
+    "openWorldHint": True,
+}
+LOCAL_ANNOTATIONS = {"readOnlyHint": True, "openWorldHint": False}
 TAGS = {"financial"}
 
+# report codes in calendar order within a business year
+REPORT_PERIODS = {"11013": "Q1", "11012": "H1", "11014": "Q3", "11011": "FY"}
+ReportCode = Literal["11013", "11012", "11014", "11011"]
+FsDiv = Literal["CFS", "OFS"]
+_MAX_SERIES_YEARS = 10
+_MULTI_CORP_LIMIT = 20  # OpenDART cap on corp_code per multi-company request
+_MAX_RATIO_COMPANIES = 100  # one full-statement call per company
+# idx_cl_code: 수익성, 안정성, 성장성, 활동성
+INDICATOR_CLASSES = ("M210000", "M220000", "M230000", "M240000")
+_DEFAULT_SCREEN_ROWS = 50
+
+
+def split_corp_codes(corp_code: str) -> list[str]:
+    """Split a comma-separated corp_code list, dropping blanks and duplicates."""
+    return list(
+        dict.fromkeys(c for c in (p.strip() for p in corp_code.split(",")) if c)
+    )
+
+
+async def _multi_corp(corp_code: str, make_call: Callable[[str], ApiCall]) -> list[Any]:
+    """Issue *make_call* per chunk of at most 20 companies and merge the rows.
+
+    Chunks run concurrently; a chunk none of whose companies has data is
+    skipped rather than failing the call. Rows come back grouped in the
+    order the companies were given.
+    """
+    codes = split_corp_codes(corp_code)
+    if not codes:
+        raise ToolError("입력값 오류: corp_code가 비어 있습니다")
+    results = await gather_calls(
+        (
+            make_call(",".join(codes[i : i + _MULTI_CORP_LIMIT]))
+            for i in range(0, len(codes), _MULTI_CORP_LIMIT)
+        ),
+        return_exceptions=True,
+    )
+    rows: list[Any] = []
+    not_found: ToolError | None = None
+    for result in results:
+        if is_no_data(result):
+            not_found = not_found or result
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            rows.extend(result)
+    if not rows and not_found is not None:
+        raise not_found
+    order = {code: i for i, code in enumerate(codes)}
+    rows.sort(key=lambda row: order.get(row.corp_code, len(order)))
+    return rows
+
+
+def build_series(
+    periods: Sequence[tuple[str, str]],
+    results: Sequence[Any],
+    *,
+    fs_div: str,
+    accounts: Sequence[str] | None = None,
+) -> dict:
+    """Align per-period ``single_account`` rows into one value list per account.
+
+    *results* holds, for each ``(bsns_year, reprt_code)`` in *periods*, either
+    the rows or the exception that period failed with.
+    """
+    wanted = set(accounts) if accounts else None
+    series: dict[tuple, dict] = {}
+    errors: list[dict] = []
+    for i, ((year, code), result) in enumerate(zip(periods, results)):
+        if isinstance(result, BaseException):
+            errors.append({"bsns_year": year, "reprt_code": code, "error": str(result)})
+            continue
+        row: FinancialAccount
+        for row in result:
+            if row.fs_div not in (None, fs_div):
+                continue
+            if wanted is not None and row.account_nm not in wanted:
+                continue
+            key = (row.sj_div, row.account_nm)
+            entry = series.get(key)
+            if entry is None:
+                entry = series[key] = {
+                    "sj_div": row.sj_div,
+                    "account_nm": row.account_nm,
+                    "values": [None] * len(periods),
+                }
+            entry["values"][i] = parse_amount(row.thstrm_amount)
+    return {
+        "fs_div": fs_div,
+        "periods": [f"{year}{REPORT_PERIODS[code]}" for year, code in periods],
+        "series": list(series.values()),
+        "errors": errors,
+    }
+
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
 async def single_account(
@@ -27,8 +152,12 @@ async def single_account(
     fs_div: Annotated[
         str, Field(description="재무제표구분 (CFS:연결, OFS:개별)")
     ] = "CFS",
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """단일 기업의 주요 재무 계정을 조회합니다."""
     result = await call_api(
         client.financial.get_single_account(
@@ -38,12 +167,15 @@ async def single_account(
             fs_div=fs_div,
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
 async def multi_account(
-    corp_code: Annotated[str, Field(description="고유번호 (쉼표 구분, 최대 20개)")],
+    corp_code: Annotated[
+        str,
+        Field(description="고유번호 (쉼표 구분, 20개 초과 시 자동 분할 조회)"),
+    ],
     bsns_year: Annotated[str, Field(description="사업연도 (YYYY)")],
     reprt_code: Annotated[
         str,
@@ -54,18 +186,26 @@ async def multi_account(
     fs_div: Annotated[
         str, Field(description="재무제표구분 (CFS:연결, OFS:개별)")
     ] = "CFS",
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
-    """복수 기업의 주요 재무 계정을 조회합니다."""
-    result = await call_api(
-        client.financial.get_multi_account(
-            corp_code=corp_code,
+) -> ToolResult:
+    """복수 기업의 주요 재무 계정을 조회합니다.
+
+    20개를 넘는 기업은 20개씩 나누어 동시에 조회하고, 입력 순서대로 합칩니다.
+    """
+    result = await _multi_corp(
+        corp_code,
+        lambda codes: client.financial.get_multi_account(
+            corp_code=codes,
             bsns_year=bsns_year,
             reprt_code=reprt_code,
             fs_div=fs_div,
-        )
+        ),
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -81,8 +221,12 @@ async def full_statements(
     fs_div: Annotated[
         str, Field(description="재무제표구분 (CFS:연결, OFS:개별)")
     ] = "CFS",
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """전체 재무제표를 조회합니다."""
     result = await call_api(
         client.financial.get_full_statements(
@@ -92,7 +236,25 @@ async def full_statements(
             fs_div=fs_div,
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
+
+
+async def _fact_table(client, rcept_no: str, reprt_code: str) -> FactTable:
+    """Parsed facts of the filing's XBRL, downloading and parsing on first use."""
+    store = get_xbrl_store()
+    try:
+        table = await asyncio.to_thread(store.get, rcept_no)
+    except ValueError as e:
+        raise ToolError(str(e)) from e
+    if table is not None:
+        return table
+    data = await call_api(
+        client.financial.download_xbrl(rcept_no=rcept_no, reprt_code=reprt_code)
+    )
+    try:
+        return await asyncio.to_thread(store.put, rcept_no, data)
+    except (zipfile.BadZipFile, KeyError) as e:
+        raise ToolError(f"XBRL 파싱 실패: {e}") from e
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -105,12 +267,55 @@ async def xbrl_download(
         ),
     ],
     client=Depends(get_client),
-) -> str:
-    """XBRL 파일을 다운로드합니다."""
-    result = await call_api(
-        client.financial.download_xbrl(rcept_no=rcept_no, reprt_code=reprt_code)
-    )
-    return f"XBRL 파일 다운로드 완료 ({len(result)} bytes)"
+) -> dict:
+    """XBRL 파일을 다운로드하고 팩트 테이블로 파싱해 저장합니다.
+
+    팩트 수, 개념 수, 기간 목록을 반환합니다. 팩트는 financial_xbrl_facts로
+    조회합니다.
+    """
+    table = await _fact_table(client, rcept_no, reprt_code)
+    return table.summary()
+
+
+@mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
+async def xbrl_facts(
+    rcept_no: Annotated[str, Field(description="접수번호 (14자리)")],
+    reprt_code: Annotated[
+        str,
+        Field(
+            description="보고서코드 (11011:사업, 11012:반기, 11013:1분기, 11014:3분기)"
+        ),
+    ],
+    concepts: Annotated[
+        list[str] | None,
+        Field(
+            description=(
+                "개념명 목록, 부분 일치 (예: ['ifrs-full:Revenue', 'ProfitLoss'])"
+            )
+        ),
+    ] = None,
+    period: Annotated[
+        str | None,
+        Field(description="기간 부분 일치 (예: '2024', '2024-12-31')"),
+    ] = None,
+    dimensional: Annotated[
+        bool,
+        Field(description="차원(축/멤버)이 있는 컨텍스트의 팩트 포함 (별도, 부문 등)"),
+    ] = False,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
+    client=Depends(get_client),
+) -> ToolResult:
+    """XBRL 인스턴스 문서의 팩트(개념, 컨텍스트, 기간, 단위, 값)를 조회합니다.
+
+    처음 조회 시 다운로드해 파싱한 결과를 디스크에 저장하고, 이후에는 저장된
+    팩트 테이블에서 바로 조회합니다.
+    """
+    table = await _fact_table(client, rcept_no, reprt_code)
+    result = table.query(concepts=concepts, period=period, dimensional=dimensional)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -121,16 +326,56 @@ async def xbrl_taxonomy(
             description="재무제표구분 (BS:재무상태표, IS:손익계산서, CIS:포괄손익계산서, CF:현금흐름표, SCE:자본변동표)"
         ),
     ],
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
+    client=Depends(get_client),
+) -> ToolResult:
+    """XBRL 택소노미를 조회합니다.
+
+    다섯 재무제표구분의 택소노미를 한 번에 받아 로컬에 저장해 두고 조회합니다.
+    """
+    result = await get_taxonomy_cache().items(client, sj_div)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
+
+
+@mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
+async def xbrl_taxonomy_search(
+    query: Annotated[
+        str,
+        Field(
+            description=(
+                "계정ID 또는 한글/영문 레이블 (예: 'ifrs-full_Revenue', '매출액', "
+                "'Revenue')"
+            )
+        ),
+    ],
+    sj_div: Annotated[
+        str | None,
+        Field(description="재무제표구분 (BS, IS, CIS, CF, SCE). 생략 시 전체"),
+    ] = None,
+    max_results: Annotated[int, Field(description="최대 결과 수")] = 20,
+    fields: FIELDS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
-    """XBRL 택소노미를 조회합니다."""
-    result = await call_api(client.financial.get_xbrl_taxonomy(sj_div=sj_div))
-    return to_dict(result)
+) -> ToolResult:
+    """XBRL 택소노미에서 계정ID나 레이블로 계정을 검색합니다.
+
+    대소문자와 공백을 무시하고 일치, 접두사, 부분 일치 순으로 반환합니다.
+    """
+    result = await get_taxonomy_cache().search(
+        client, query, sj_div=sj_div, max_results=max_results
+    )
+    return to_result(result, fields=fields, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
 async def indicators(
-    corp_code: Annotated[str, Field(description="고유번호 (쉼표 구분, 최대 20개)")],
+    corp_code: Annotated[
+        str,
+        Field(description="고유번호 (쉼표 구분, 20개 초과 시 자동 분할 조회)"),
+    ],
     bsns_year: Annotated[str, Field(description="사업연도 (YYYY)")],
     reprt_code: Annotated[
         str,
@@ -139,18 +384,26 @@ async def indicators(
         ),
     ],
     idx_cl_code: Annotated[str | None, Field(description="지표분류코드")] = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
-    """복수 기업의 재무 지표를 조회합니다."""
-    result = await call_api(
-        client.financial.get_indicators(
-            corp_code=corp_code,
+) -> ToolResult:
+    """복수 기업의 재무 지표를 조회합니다.
+
+    20개를 넘는 기업은 20개씩 나누어 동시에 조회하고, 입력 순서대로 합칩니다.
+    """
+    result = await _multi_corp(
+        corp_code,
+        lambda codes: client.financial.get_indicators(
+            corp_code=codes,
             bsns_year=bsns_year,
             reprt_code=reprt_code,
             idx_cl_code=idx_cl_code,
-        )
+        ),
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -164,8 +417,12 @@ async def single_indicators(
         ),
     ],
     idx_cl_code: Annotated[str, Field(description="지표분류코드")],
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """단일 기업의 재무 지표를 조회합니다."""
     result = await call_api(
         client.financial.get_single_indicators(
@@ -175,4 +432,307 @@ async def single_indicators(
             idx_cl_code=idx_cl_code,
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
+
+
+@mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
+async def time_series(
+    corp_code: Annotated[str, Field(description="고유번호 (8자리)")],
+    bgn_year: Annotated[int, Field(description="시작 사업연도 (YYYY)")],
+    end_year: Annotated[int, Field(description="종료 사업연도 (YYYY)")],
+    reprt_codes: Annotated[
+        list[ReportCode] | None,
+        Field(
+            description=(
+                "보고서코드 목록 (11013:1분기, 11012:반기, 11014:3분기, 11011:사업). "
+                "생략 시 전체"
+            )
+        ),
+    ] = None,
+    accounts: Annotated[
+        list[str] | None,
+        Field(description="계정명 목록 (예: ['매출액', '영업이익']). 생략 시 전체"),
+    ] = None,
+    fs_div: Annotated[
+        str, Field(description="재무제표구분 (CFS:연결, OFS:개별)")
+    ] = "CFS",
+    client=Depends(get_client),
+) -> ToolResult:
+    """여러 기간의 주요 재무 계정을 계정별 시계열로 조회합니다.
+
+    기간별 조회를 동시에 실행하고, periods 순서에 맞춘 values 배열을 계정마다
+    반환합니다. 조회에 실패한 기간은 values가 null이고 errors에 표시됩니다.
+    """
+    if not 0 <= end_year - bgn_year < _MAX_SERIES_YEARS:
+        raise ToolError(
+            f"기간 오류: bgn_year <= end_year, 최대 {_MAX_SERIES_YEARS}년까지 조회"
+        )
+    codes = set(reprt_codes or REPORT_PERIODS)
+    periods = [
+        (str(year), code)
+        for year in range(bgn_year, end_year + 1)
+        for code in REPORT_PERIODS
+        if code in codes
+    ]
+    results = await gather_calls(
+        (
+            client.financial.get_single_account(
+                corp_code=corp_code, bsns_year=year, reprt_code=code, fs_div=fs_div
+            )
+            for year, code in periods
+        ),
+        return_exceptions=True,
+    )
+    return to_result(build_series(periods, results, fs_div=fs_div, accounts=accounts))
+
+
+@mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
+async def ratios(
+    corp_code: Annotated[
+        str,
+        Field(description=f"고유번호 (쉼표 구분, 최대 {_MAX_RATIO_COMPANIES}개)"),
+    ],
+    bsns_year: Annotated[str, Field(description="사업연도 (YYYY)")],
+    reprt_code: Annotated[
+        ReportCode,
+        Field(
+            description="보고서코드 (11011:사업, 11012:반기, 11013:1분기, 11014:3분기)"
+        ),
+    ] = "11011",
+    fs_div: Annotated[
+        str, Field(description="재무제표구분 (CFS:연결, OFS:개별)")
+    ] = "CFS",
+    client=Depends(get_client),
+) -> ToolResult:
+    """전체 재무제표로 주요 재무비율을 계산합니다.
+
+    ROE, ROA, 매출총이익률, 영업이익률, 순이익률, 부채비율, 자기자본비율,
+    영업현금흐름 마진, 성장률(매출액, 영업이익, 순이익)은 %이고, 유동비율과
+    총자산회전율은 배수입니다. 분기·반기 보고서는 누적 금액으로 계산합니다.
+    기업별 조회를 동시에 실행하며, 실패한 기업은 errors에 표시됩니다.
+    """
+    codes = split_corp_codes(corp_code)
+    if not 0 < len(codes) <= _MAX_RATIO_COMPANIES:
+        raise ToolError(
+            f"입력값 오류: corp_code는 1~{_MAX_RATIO_COMPANIES}개까지 입력하세요"
+        )
+    results = await gather_calls(
+        (
+            client.financial.get_full_statements(
+                corp_code=code,
+                bsns_year=bsns_year,
+                reprt_code=reprt_code,
+                fs_div=fs_div,
+            )
+            for code in codes
+        ),
+        return_exceptions=True,
+    )
+    found = [(c, r) for c, r in zip(codes, results) if not isinstance(r, BaseException)]
+    errors = [
+        {"corp_code": c, "error": str(r)}
+        for c, r in zip(codes, results)
+        if isinstance(r, BaseException)
+    ]
+    rows = ratio_rows([c for c, _ in found], [r for _, r in found])
+    return to_result({**to_columnar(rows), "errors": errors})
+
+
+def _dataset_key(bsns_year: str, reprt_code: str, fs_div: str) -> str:
+    try:
+        return dataset_key(bsns_year, reprt_code, fs_div)
+    except ValueError as e:
+        raise ToolError(str(e)) from e
+
+
+@mcp.tool(tags=TAGS, annotations=SYNC_ANNOTATIONS)
+async def screen_build(
+    bsns_year: Annotated[str, Field(description="사업연도 (YYYY)")],
+    reprt_code: Annotated[
+        ReportCode,
+        Field(
+            description="보고서코드 (11011:사업, 11012:반기, 11013:1분기, 11014:3분기)"
+        ),
+    ] = "11011",
+    fs_div: Annotated[
+        FsDiv, Field(description="재무제표구분 (CFS:연결, OFS:개별)")
+    ] = "CFS",
+    include_indicators: Annotated[
+        bool,
+        Field(description="재무지표(수익성·안정성·성장성·활동성)도 함께 수집"),
+    ] = False,
+    client=Depends(get_client),
+) -> dict:
+    """전체 상장회사의 재무 데이터를 일괄 수집해 스크리닝용 로컬 저장소를 만듭니다.
+
+    다중회사 주요계정을 20개씩 나누어 동시에 조회하고, 금액과 재무비율을
+    기간별 데이터셋으로 저장합니다. 시장구분(corp_cls)은 로컬 공시 색인
+    (disclosure_sync_index)에 있는 회사만 채워집니다. 수백 건의 API 호출이
+    필요하므로 기간별로 한 번만 실행하세요.
+    """
+    key = _dataset_key(bsns_year, reprt_code, fs_div)
+    companies = await get_cache().listed(client)
+    codes = ",".join(c.corp_code for c in companies)
+    accounts = await _multi_corp(
+        codes,
+        lambda chunk: client.financial.get_multi_account(
+            corp_code=chunk, bsns_year=bsns_year, reprt_code=reprt_code, fs_div=fs_div
+        ),
+    )
+    indicators: list[Any] = []
+    if include_indicators:
+        for idx_cl_code in INDICATOR_CLASSES:
+            try:
+                indicators.extend(
+                    await _multi_corp(
+                        codes,
+                        lambda chunk, cl=idx_cl_code: client.financial.get_indicators(
+                            corp_code=chunk,
+                            bsns_year=bsns_year,
+                            reprt_code=reprt_code,
+                            idx_cl_code=cl,
+                        ),
+                    )
+                )
+            except ToolError as e:
+                if not is_no_data(e):
+                    raise
+    corp_classes = await asyncio.to_thread(get_index().corp_classes)
+    dataset = await asyncio.to_thread(
+        build_dataset,
+        key,
+        companies,
+        accounts,
+        indicators,
+        fs_div=fs_div,
+        corp_classes=corp_classes,
+    )
+    if not len(dataset.corp_codes):
+        raise ToolError(
+            f"스크리닝 데이터 없음: {key} 기간에 주요계정을 공시한 회사가 없습니다"
+        )
+    await asyncio.to_thread(get_screening_store().put, dataset)
+    return dataset.summary()
+
+
+@mcp.tool(tags=TAGS, annotations=LOCAL_ANNOTATIONS)
+async def screen(
+    conditions: Annotated[
+        dict[str, str | list[str]],
+        Field(
+            description=(
+                "지표별 조건 (예: {'debt_ratio': '<50', 'operating_margin': '>15'}, "
+                "{'roe': ['>=10', '<30']}). 비율은 % 단위"
+            )
+        ),
+    ],
+    bsns_year: Annotated[str, Field(description="사업연도 (YYYY)")],
+    reprt_code: Annotated[
+        ReportCode,
+        Field(
+            description="보고서코드 (11011:사업, 11012:반기, 11013:1분기, 11014:3분기)"
+        ),
+    ] = "11011",
+    fs_div: Annotated[
+        FsDiv, Field(description="재무제표구분 (CFS:연결, OFS:개별)")
+    ] = "CFS",
+    corp_cls: Annotated[
+        Literal["Y", "K", "N", "E"] | None,
+        Field(description="시장구분 (Y:유가증권, K:코스닥, N:코넥스, E:기타)"),
+    ] = None,
+    sort_by: Annotated[str | None, Field(description="정렬 기준 지표")] = None,
+    descending: Annotated[bool, Field(description="내림차순 정렬")] = True,
+    limit: Annotated[
+        int, Field(description="최대 결과 수", ge=1)
+    ] = _DEFAULT_SCREEN_ROWS,
+    columns: Annotated[
+        list[str] | None,
+        Field(description="반환할 지표 목록. 생략 시 금액과 재무비율 전체"),
+    ] = None,
+    format: FORMAT = "rows",
+) -> ToolResult:
+    """로컬 스크리닝 저장소에서 조건에 맞는 기업을 찾아 순위를 매깁니다.
+
+    OpenDART를 호출하지 않으며, financial_screen_build로 구축한 기간만
+    조회할 수 있습니다. 사용 가능한 지표: revenue, operating_income,
+    net_income, total_assets, total_liabilities, total_equity, roe, roa,
+    operating_margin, net_margin, debt_ratio, equity_ratio, current_ratio,
+    asset_turnover, revenue_growth, operating_income_growth,
+    net_income_growth (재무지표를 수집한 경우 지표명도 사용 가능).
+    """
+    store = get_screening_store()
+    key = _dataset_key(bsns_year, reprt_code, fs_div)
+    dataset = await asyncio.to_thread(store.get, key)
+    if dataset is None:
+        built = ", ".join(store.keys()) or "없음"
+        raise ToolError(
+            f"스크리닝 데이터 없음: financial_screen_build로 {key} 데이터를 먼저 "
+            f"구축하세요 (구축된 데이터: {built})"
+        )
+    rows = dataset.screen(
+        conditions,
+        corp_cls=corp_cls,
+        sort_by=sort_by,
+        descending=descending,
+        limit=limit,
+        columns=columns,
+    )
+    return to_result(rows, format=format)
+
+
+@mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
+async def statement_diff(
+    corp_code: Annotated[str, Field(description="고유번호 (8자리)")],
+    bsns_year: Annotated[str, Field(description="비교 대상 사업연도 (YYYY)")],
+    reprt_code: Annotated[
+        ReportCode,
+        Field(
+            description="보고서코드 (11011:사업, 11012:반기, 11013:1분기, 11014:3분기)"
+        ),
+    ] = "11011",
+    base_year: Annotated[
+        str | None, Field(description="기준 사업연도 (YYYY). 생략 시 전년도")
+    ] = None,
+    base_reprt_code: Annotated[
+        ReportCode | None,
+        Field(description="기준 보고서코드. 생략 시 reprt_code와 동일"),
+    ] = None,
+    fs_div: Annotated[
+        str, Field(description="재무제표구분 (CFS:연결, OFS:개별)")
+    ] = "CFS",
+    sj_div: Annotated[
+        str | None,
+        Field(description="재무제표 종류 (BS, IS, CIS, CF, SCE). 생략 시 전체"),
+    ] = None,
+    min_change_pct: Annotated[
+        float, Field(description="이 비율(%) 미만으로 변한 계정은 제외", ge=0)
+    ] = 0.0,
+    format: FORMAT = "rows",
+    client=Depends(get_client),
+) -> ToolResult:
+    """두 기간의 전체 재무제표를 계정ID 기준으로 맞춰 변동된 계정만 반환합니다.
+
+    두 기간을 동시에 조회하고, 계정별 기준값(before), 비교값(after), 증감액,
+    증감률(%)과 상태(changed, added, removed)를 반환합니다. 변동 없는 계정은
+    개수만 unchanged로 표시합니다.
+    """
+    base = (base_year or str(int(bsns_year) - 1), base_reprt_code or reprt_code)
+    before, after = await gather_calls(
+        client.financial.get_full_statements(
+            corp_code=corp_code, bsns_year=year, reprt_code=code, fs_div=fs_div
+        )
+        for year, code in (base, (bsns_year, reprt_code))
+    )
+    if sj_div:
+        before = [row for row in before if row.sj_div == sj_div.upper()]
+        after = [row for row in after if row.sj_div == sj_div.upper()]
+    lines, unchanged = diff_statements(before, after, min_change_pct=min_change_pct)
+    return to_result(
+        {
+            "base": {"bsns_year": base[0], "reprt_code": base[1]},
+            "target": {"bsns_year": bsns_year, "reprt_code": reprt_code},
+            "fs_div": fs_div,
+            "unchanged": unchanged,
+            "changes": to_columnar(lines) if format == "columnar" else lines,
+        }
+    )
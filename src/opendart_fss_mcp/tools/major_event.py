@@ -4,9 +4,11 @@ from typing import Annotated
 
 from fastmcp import FastMCP
 from fastmcp.dependencies import Depends
+from fastmcp.tools.tool import ToolResult
 from pydantic import Field
 
-from opendart_fss_mcp.deps import call_api, get_client, to_dict
+from opendart_fss_mcp.deps import call_api, get_client, to_result
+from opendart_fss_mcp.projection import FIELDS, FILTERS, FORMAT, LIMIT
 
 mcp = FastMCP(name="MajorEvent")
 
@@ -23,15 +25,19 @@ async def paid_capital_increase(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """유상증자 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_paid_capital_increase(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -39,15 +45,19 @@ async def bonus_issue(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """무상증자 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_bonus_issue(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -55,15 +65,19 @@ async def capital_reduction(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """감자 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_capital_reduction(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -71,15 +85,19 @@ async def mixed_capital_increase(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """유무상증자 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_mixed_capital_increase(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -87,15 +105,19 @@ async def convertible_bond(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """전환사채 발행 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_convertible_bond(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -103,15 +125,19 @@ async def bond_with_warrant(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """신주인수권부사채 발행 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_bond_with_warrant(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -119,15 +145,19 @@ async def exchangeable_bond(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """교환사채 발행 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_exchangeable_bond(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -135,15 +165,19 @@ async def merger_decision(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """합병 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_merger_decision(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -151,15 +185,19 @@ async def split_decision(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """분할 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_split_decision(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -167,15 +205,19 @@ async def split_merger_decision(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """분할합병 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_split_merger_decision(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -183,15 +225,19 @@ async def stock_exchange_decision(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """주식의 포괄적 교환·이전 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_stock_exchange_decision(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -199,15 +245,19 @@ async def asset_transfer(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """영업양수도 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_asset_transfer(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -215,15 +265,19 @@ async def business_acquisition(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """영업양수 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_business_acquisition(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -231,15 +285,19 @@ async def business_disposal(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """영업양도 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_business_disposal(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -247,15 +305,19 @@ async def tangible_asset_acquisition(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """유형자산 양수 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_tangible_asset_acquisition(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -263,15 +325,19 @@ async def tangible_asset_disposal(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """유형자산 양도 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_tangible_asset_disposal(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -279,15 +345,19 @@ async def other_corp_stock_acquisition(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """타법인 주식 및 출자증권 양수 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_other_corp_stock_acquisition(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -295,15 +365,19 @@ async def other_corp_stock_disposal(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """타법인 주식 및 출자증권 양도 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_other_corp_stock_disposal(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -311,15 +385,19 @@ async def stock_related_bond_acquisition(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """주권 관련 사채권 양수 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_stock_related_bond_acquisition(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -327,15 +405,19 @@ async def stock_related_bond_disposal(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """주권 관련 사채권 양도 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_stock_related_bond_disposal(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -343,15 +425,19 @@ async def treasury_stock_acquisition(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """자기주식 취득 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_treasury_stock_acquisition(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -359,15 +445,19 @@ async def treasury_stock_disposal(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """자기주식 처분 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_treasury_stock_disposal(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -375,15 +465,19 @@ async def treasury_trust_contract(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """자기주식취득 신탁계약 체결 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_treasury_trust_contract(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -391,15 +485,19 @@ async def treasury_trust_termination(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """자기주식취득 신탁계약 해지 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_treasury_trust_termination(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -407,15 +505,19 @@ async def default_occurrence(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """채무불이행을 조회합니다."""
     result = await call_api(
         client.major_event.get_default_occurrence(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -423,15 +525,19 @@ async def business_suspension(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """영업정지를 조회합니다."""
     result = await call_api(
         client.major_event.get_business_suspension(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -439,15 +545,19 @@ async def rehabilitation_filing(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """회생절차 신청을 조회합니다."""
     result = await call_api(
         client.major_event.get_rehabilitation_filing(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -455,15 +565,19 @@ async def dissolution_reason(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """해산 사유를 조회합니다."""
     result = await call_api(
         client.major_event.get_dissolution_reason(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -471,15 +585,19 @@ async def creditor_management_start(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """채권자관리절차 개시를 조회합니다."""
     result = await call_api(
         client.major_event.get_creditor_management_start(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -487,15 +605,19 @@ async def creditor_management_stop(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """채권자관리절차 중단을 조회합니다."""
     result = await call_api(
         client.major_event.get_creditor_management_stop(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -503,15 +625,19 @@ async def write_off_contingent_capital(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """상각형 조건부자본증권 발행 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_write_off_contingent_capital(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -519,15 +645,19 @@ async def litigation(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """소송을 조회합니다."""
     result = await call_api(
         client.major_event.get_litigation(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -535,15 +665,19 @@ async def overseas_listing_decision(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """해외상장 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_overseas_listing_decision(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -551,15 +685,19 @@ async def overseas_delisting_decision(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """해외상장폐지 결정을 조회합니다."""
     result = await call_api(
         client.major_event.get_overseas_delisting_decision(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -567,15 +705,19 @@ async def overseas_listing(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """해외상장을 조회합니다."""
     result = await call_api(
         client.major_event.get_overseas_listing(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -583,12 +725,16 @@ async def overseas_delisting(
     corp_code: CORP_CODE,
     bgn_de: BGN_DE = None,
     end_de: END_DE = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """해외상장폐지를 조회합니다."""
     result = await call_api(
         client.major_event.get_overseas_delisting(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
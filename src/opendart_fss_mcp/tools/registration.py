@@ -4,9 +4,11 @@ from typing import Annotated
 
 from fastmcp import FastMCP
 from fastmcp.dependencies import Depends
+from fastmcp.tools.tool import ToolResult
 from pydantic import Field
 
-from opendart_fss_mcp.deps import call_api, get_client, to_dict
+from opendart_fss_mcp.deps import call_api, get_client, to_result
+from opendart_fss_mcp.projection import FIELDS, FILTERS, FORMAT, LIMIT
 
 mcp = FastMCP(name="Registration")
 
@@ -19,15 +21,19 @@ async def equity_securities(
     corp_code: Annotated[str, Field(description="고유번호 (8자리)")],
     bgn_de: Annotated[str | None, Field(description="시작일 (YYYYMMDD)")] = None,
     end_de: Annotated[str | None, Field(description="종료일 (YYYYMMDD)")] = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """지분증권 발행 신고서를 조회합니다."""
     result = await call_api(
         client.registration.get_equity_securities(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -35,15 +41,19 @@ async def debt_securities(
     corp_code: Annotated[str, Field(description="고유번호 (8자리)")],
     bgn_de: Annotated[str | None, Field(description="시작일 (YYYYMMDD)")] = None,
     end_de: Annotated[str | None, Field(description="종료일 (YYYYMMDD)")] = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """채무증권 발행 신고서를 조회합니다."""
     result = await call_api(
         client.registration.get_debt_securities(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -51,15 +61,19 @@ async def merger_registration(
     corp_code: Annotated[str, Field(description="고유번호 (8자리)")],
     bgn_de: Annotated[str | None, Field(description="시작일 (YYYYMMDD)")] = None,
     end_de: Annotated[str | None, Field(description="종료일 (YYYYMMDD)")] = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """합병 신고서를 조회합니다."""
     result = await call_api(
         client.registration.get_merger_registration(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -67,15 +81,19 @@ async def split_registration(
     corp_code: Annotated[str, Field(description="고유번호 (8자리)")],
     bgn_de: Annotated[str | None, Field(description="시작일 (YYYYMMDD)")] = None,
     end_de: Annotated[str | None, Field(description="종료일 (YYYYMMDD)")] = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """분할 신고서를 조회합니다."""
     result = await call_api(
         client.registration.get_split_registration(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -83,15 +101,19 @@ async def depositary_receipt(
     corp_code: Annotated[str, Field(description="고유번호 (8자리)")],
     bgn_de: Annotated[str | None, Field(description="시작일 (YYYYMMDD)")] = None,
     end_de: Annotated[str | None, Field(description="종료일 (YYYYMMDD)")] = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """예탁증권 신고서를 조회합니다."""
     result = await call_api(
         client.registration.get_depositary_receipt(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -99,12 +121,16 @@ async def stock_exchange_transfer(
     corp_code: Annotated[str, Field(description="고유번호 (8자리)")],
     bgn_de: Annotated[str | None, Field(description="시작일 (YYYYMMDD)")] = None,
     end_de: Annotated[str | None, Field(description="종료일 (YYYYMMDD)")] = None,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """주식교환이전 신고서를 조회합니다."""
     result = await call_api(
         client.registration.get_stock_exchange_transfer(
             corp_code=corp_code, bgn_de=bgn_de, end_de=end_de
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
@@ -1,12 +1,28 @@
 """정기보고서 (DS002) - Regular Report Key Information tools."""
 
-from typing import Annotated
+import asyncio
+from typing import Annotated, Literal, get_args
 
 from fastmcp import FastMCP
 from fastmcp.dependencies import Depends
+from fastmcp.exceptions import ToolError
+from fastmcp.tools.tool import ToolResult
 from pydantic import Field
 
-from opendart_fss_mcp.deps import call_api, get_client, to_dict
+from opendart_fss_mcp.deps import (
+    call_api,
+    gather_calls,
+    get_client,
+    is_no_data,
+    to_result,
+)
+from opendart_fss_mcp.dividend_history import (
+    HISTORY_FIELDS,
+    get_dividend_store,
+    is_closed,
+    normalize_year,
+)
+from opendart_fss_mcp.projection import FIELDS, FILTERS, FORMAT, LIMIT
 
 mcp = FastMCP(name="Report")
 
@@ -20,21 +36,68 @@ REPRT_CODE = Annotated[
     Field(description="보고서코드 (11011:사업, 11012:반기, 11013:1분기, 11014:3분기)"),
 ]
 
+# report tools whose SDK method is client.report.get_<section>
+ReportSection = Literal[
+    "stock_changes",
+    "dividends",
+    "treasury_stock",
+    "largest_shareholders",
+    "largest_shareholder_changes",
+    "minority_shareholders",
+    "executives",
+    "employees",
+    "individual_compensation",
+    "director_compensation",
+    "director_individual_compensation",
+    "unregistered_executive_compensation",
+    "director_compensation_approval",
+    "director_compensation_by_type",
+    "other_corp_investments",
+    "total_stock_quantity",
+    "debt_securities_issuance",
+    "commercial_paper_balance",
+    "short_term_bond_balance",
+    "corporate_bond_balance",
+    "hybrid_securities_balance",
+    "contingent_capital_balance",
+    "auditor_opinion",
+    "audit_service_contract",
+    "non_audit_service_contract",
+    "outside_directors",
+    "public_offering_fund_usage",
+    "private_placement_fund_usage",
+]
+REPORT_SECTIONS: tuple[str, ...] = get_args(ReportSection)
+DEFAULT_SNAPSHOT_SECTIONS: tuple[ReportSection, ...] = (
+    "largest_shareholders",
+    "executives",
+    "employees",
+    "dividends",
+    "treasury_stock",
+    "total_stock_quantity",
+    "auditor_opinion",
+)
+_MAX_HISTORY_YEARS = 20
+
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
 async def stock_changes(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """증자/감자 현황을 조회합니다."""
     result = await call_api(
         client.report.get_stock_changes(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -42,15 +105,19 @@ async def dividends(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """배당 정보를 조회합니다."""
     result = await call_api(
         client.report.get_dividends(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -58,15 +125,19 @@ async def treasury_stock(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """자기주식 현황을 조회합니다."""
     result = await call_api(
         client.report.get_treasury_stock(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -74,15 +145,19 @@ async def largest_shareholders(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """최대주주 현황을 조회합니다."""
     result = await call_api(
         client.report.get_largest_shareholders(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -90,15 +165,19 @@ async def largest_shareholder_changes(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """최대주주 변동 현황을 조회합니다."""
     result = await call_api(
         client.report.get_largest_shareholder_changes(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -106,15 +185,19 @@ async def minority_shareholders(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """소액주주 현황을 조회합니다."""
     result = await call_api(
         client.report.get_minority_shareholders(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -122,15 +205,19 @@ async def executives(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """임원 현황을 조회합니다."""
     result = await call_api(
         client.report.get_executives(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -138,15 +225,19 @@ async def employees(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """직원 현황을 조회합니다."""
     result = await call_api(
         client.report.get_employees(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -154,15 +245,19 @@ async def individual_compensation(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """개인별 보수를 조회합니다."""
     result = await call_api(
         client.report.get_individual_compensation(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -170,15 +265,19 @@ async def director_compensation(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """이사 보수를 조회합니다."""
     result = await call_api(
         client.report.get_director_compensation(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -186,15 +285,19 @@ async def director_individual_compensation(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """이사 개인별 보수를 조회합니다."""
     result = await call_api(
         client.report.get_director_individual_compensation(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -202,15 +305,19 @@ async def unregistered_executive_compensation(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """미등기 임원 보수를 조회합니다."""
     result = await call_api(
         client.report.get_unregistered_executive_compensation(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -218,15 +325,19 @@ async def director_compensation_approval(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """이사 보수 승인 현황을 조회합니다."""
     result = await call_api(
         client.report.get_director_compensation_approval(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -234,15 +345,19 @@ async def director_compensation_by_type(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """유형별 이사 보수를 조회합니다."""
     result = await call_api(
         client.report.get_director_compensation_by_type(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -250,15 +365,19 @@ async def other_corp_investments(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """타법인 출자 현황을 조회합니다."""
     result = await call_api(
         client.report.get_other_corp_investments(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -266,15 +385,19 @@ async def total_stock_quantity(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """주식 총수 현황을 조회합니다."""
     result = await call_api(
         client.report.get_total_stock_quantity(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -282,15 +405,19 @@ async def debt_securities_issuance(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """채무증권 발행실적을 조회합니다."""
     result = await call_api(
         client.report.get_debt_securities_issuance(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -298,15 +425,19 @@ async def commercial_paper_balance(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """기업어음 잔액을 조회합니다."""
     result = await call_api(
         client.report.get_commercial_paper_balance(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -314,15 +445,19 @@ async def short_term_bond_balance(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """단기사채 잔액을 조회합니다."""
     result = await call_api(
         client.report.get_short_term_bond_balance(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -330,15 +465,19 @@ async def corporate_bond_balance(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """회사채 잔액을 조회합니다."""
     result = await call_api(
         client.report.get_corporate_bond_balance(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -346,15 +485,19 @@ async def hybrid_securities_balance(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """조건부자본증권 잔액을 조회합니다."""
     result = await call_api(
         client.report.get_hybrid_securities_balance(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -362,15 +505,19 @@ async def contingent_capital_balance(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """신종자본증권 잔액을 조회합니다."""
     result = await call_api(
         client.report.get_contingent_capital_balance(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -378,15 +525,19 @@ async def auditor_opinion(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """감사 의견을 조회합니다."""
     result = await call_api(
         client.report.get_auditor_opinion(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -394,15 +545,19 @@ async def audit_service_contract(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """감사 용역 계약 현황을 조회합니다."""
     result = await call_api(
         client.report.get_audit_service_contract(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -410,15 +565,19 @@ async def non_audit_service_contract(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """비감사 용역 계약 현황을 조회합니다."""
     result = await call_api(
         client.report.get_non_audit_service_contract(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -426,15 +585,19 @@ async def outside_directors(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """사외이사 현황을 조회합니다."""
     result = await call_api(
         client.report.get_outside_directors(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -442,15 +605,19 @@ async def public_offering_fund_usage(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """공모자금 사용 현황을 조회합니다."""
     result = await call_api(
         client.report.get_public_offering_fund_usage(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
@@ -458,12 +625,133 @@ async def private_placement_fund_usage(
     corp_code: CORP_CODE,
     bsns_year: BSNS_YEAR,
     reprt_code: REPRT_CODE,
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """사모자금 사용 현황을 조회합니다."""
     result = await call_api(
         client.report.get_private_placement_fund_usage(
             corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
         )
     )
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
+
+
+@mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
+async def snapshot(
+    corp_code: CORP_CODE,
+    bsns_year: BSNS_YEAR,
+    reprt_code: REPRT_CODE = "11011",
+    sections: Annotated[
+        list[ReportSection] | None,
+        Field(
+            description=(
+                "조회할 항목 (정기보고서 도구 이름). 생략 시 최대주주, 임원, 직원, "
+                "배당, 자기주식, 주식총수, 감사의견"
+            )
+        ),
+    ] = None,
+    client=Depends(get_client),
+) -> ToolResult:
+    """정기보고서의 여러 항목을 동시에 조회해 하나의 문서로 반환합니다.
+
+    sections에 항목별 결과를 담고, 조회에 실패한 항목은 errors에 표시합니다.
+    데이터가 없는 항목은 빈 목록입니다.
+    """
+    wanted = list(dict.fromkeys(sections or DEFAULT_SNAPSHOT_SECTIONS))
+    results = await gather_calls(
+        (
+            getattr(client.report, f"get_{section}")(
+                corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
+            )
+            for section in wanted
+        ),
+        return_exceptions=True,
+    )
+    merged: dict[str, object] = {}
+    errors: dict[str, str] = {}
+    for section, result in zip(wanted, results):
+        if is_no_data(result):
+            merged[section] = []
+        elif isinstance(result, BaseException):
+            errors[section] = str(result)
+        else:
+            merged[section] = result
+    return to_result(
+        {
+            "corp_code": corp_code,
+            "bsns_year": bsns_year,
+            "reprt_code": reprt_code,
+            "sections": merged,
+            "errors": errors,
+        }
+    )
+
+
+@mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
+async def dividend_history(
+    corp_code: CORP_CODE,
+    bgn_year: Annotated[int, Field(description="시작 사업연도 (YYYY)")],
+    end_year: Annotated[int, Field(description="종료 사업연도 (YYYY)")],
+    reprt_code: REPRT_CODE = "11011",
+    client=Depends(get_client),
+) -> ToolResult:
+    """여러 사업연도의 배당 및 자기주식 현황을 숫자 시계열로 반환합니다.
+
+    연도별로 주당 현금배당금(보통주/우선주), 현금배당수익률, 현금배당성향,
+    현금배당금총액·당기순이익(백만원), 주당순이익과 보통주 자기주식
+    취득·처분·소각·기말 수량을 series에 담습니다. 지난 사업연도 결과는 저장해
+    다시 조회하지 않으며, 조회에 실패한 연도는 errors에 표시합니다.
+    """
+    if not 0 <= end_year - bgn_year < _MAX_HISTORY_YEARS:
+        raise ToolError(
+            f"기간 오류: bgn_year <= end_year, 최대 {_MAX_HISTORY_YEARS}년까지 조회"
+        )
+    years = [str(year) for year in range(bgn_year, end_year + 1)]
+    store = get_dividend_store()
+    try:
+        stored = await asyncio.to_thread(store.get, corp_code, reprt_code)
+    except ValueError as e:
+        raise ToolError(str(e)) from e
+    missing = [year for year in years if year not in stored]
+    results = await gather_calls(
+        (
+            method(corp_code=corp_code, bsns_year=year, reprt_code=reprt_code)
+            for year in missing
+            for method in (
+                client.report.get_dividends,
+                client.report.get_treasury_stock,
+            )
+        ),
+        return_exceptions=True,
+    )
+    records = dict(stored)
+    fresh: dict[str, dict] = {}
+    errors: dict[str, str] = {}
+    for i, year in enumerate(missing):
+        pair = [[] if is_no_data(r) else r for r in results[2 * i : 2 * i + 2]]
+        if failed := [str(r) for r in pair if isinstance(r, BaseException)]:
+            errors[year] = "; ".join(failed)
+            continue
+        dividends, treasury = pair
+        records[year] = normalize_year(dividends, treasury)
+        # a filed report of an ended year no longer changes
+        if dividends and is_closed(year):
+            fresh[year] = records[year]
+    if fresh:
+        await asyncio.to_thread(store.put, corp_code, reprt_code, fresh)
+    return to_result(
+        {
+            "corp_code": corp_code,
+            "reprt_code": reprt_code,
+            "years": years,
+            "series": {
+                name: [records.get(year, {}).get(name) for year in years]
+                for name in HISTORY_FIELDS
+            },
+            "errors": errors,
+        }
+    )
@@ -4,9 +4,11 @@ from typing import Annotated
 
 from fastmcp import FastMCP
 from fastmcp.dependencies import Depends
+from fastmcp.tools.tool import ToolResult
 from pydantic import Field
 
-from opendart_fss_mcp.deps import call_api, get_client, to_dict
+from opendart_fss_mcp.deps import call_api, get_client, to_result
+from opendart_fss_mcp.projection import FIELDS, FILTERS, FORMAT, LIMIT
 
 mcp = FastMCP(name="Shareholder")
 
@@ -17,18 +19,26 @@ TAGS = {"shareholder"}
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
 async def major_stock(
     corp_code: Annotated[str, Field(description="고유번호 (8자리)")],
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """대량보유 현황을 조회합니다."""
     result = await call_api(client.shareholder.get_major_stock(corp_code=corp_code))
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
 
 
 @mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
 async def executive_stock(
     corp_code: Annotated[str, Field(description="고유번호 (8자리)")],
+    fields: FIELDS = None,
+    limit: LIMIT = None,
+    filters: FILTERS = None,
+    format: FORMAT = "rows",
     client=Depends(get_client),
-) -> list[dict]:
+) -> ToolResult:
     """임원 및 주요주주 소유 현황을 조회합니다."""
     result = await call_api(client.shareholder.get_executive_stock(corp_code=corp_code))
-    return to_dict(result)
+    return to_result(result, fields=fields, limit=limit, filters=filters, format=format)
@@ -1,9 +1,16 @@
 """유틸리티 - Utility tools."""
 
 from datetime import datetime
+from typing import Annotated
 from zoneinfo import ZoneInfo
 
 from fastmcp import FastMCP
+from fastmcp.exceptions import ResourceError, ToolError
+from fastmcp.tools.tool import ToolResult
+from mcp.types import TextContent
+from pydantic import Field
+
+from opendart_fss_mcp.result_store import get_store
 
 mcp = FastMCP(name="Utility")
 
@@ -25,3 +32,20 @@ def get_current_date() -> dict:
         "time": now.strftime("%H:%M:%S"),
         "timezone": "Asia/Seoul (KST)",
     }
+
+
+@mcp.tool(tags=TAGS, annotations=TOOL_ANNOTATIONS)
+def result_page(
+    result_id: Annotated[str, Field(description="결과 ID (result_id)")],
+    page: Annotated[int, Field(description="페이지 번호 (1부터)", ge=1)] = 1,
+) -> ToolResult:
+    """서버에 저장된 대용량 결과의 한 페이지를 조회합니다.
+
+    결과가 커서 result_id와 함께 요약만 반환된 경우, 이 도구로 필요한 페이지만
+    읽으세요. opendart://results/{result_id}/{page} 리소스와 같은 내용입니다.
+    """
+    try:
+        text = get_store().page(result_id, page).decode()
+    except ResourceError as e:
+        raise ToolError(str(e)) from e
+    return ToolResult(content=[TextContent(type="text", text=text)])
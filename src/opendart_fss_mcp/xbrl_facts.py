@@ -0,0 +1,228 @@
+"""Fact tables parsed from XBRL instance documents, cached per ``rcept_no``."""
+
+from __future__ import annotations
+
+import io
+import zipfile
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import IO
+from xml.etree.ElementTree import iterparse
+
+import msgspec
+
+from opendart_fss_mcp.response_cache import ResponseCache
+from opendart_fss_mcp.storage import check_code, data_dir, write_atomic
+
+_XBRL_DIR = "xbrl"
+_XBRLI = "{http://www.xbrl.org/2003/instance}"
+_XBRLDI = "{http://xbrl.org/2006/xbrldi}"
+_MAX_TEXT_CHARS = 1_000  # longer non-numeric facts are text blocks (HTML notes)
+_LOADED_TABLES = 16
+
+
+class Fact(msgspec.Struct):
+    concept: str  # prefixed QName, e.g. "ifrs-full:Revenue"
+    context: str
+    period: str  # "YYYY-MM-DD" (instant) or "YYYY-MM-DD/YYYY-MM-DD"
+    unit: str | None
+    value: str
+    decimals: str | None = None
+    dimensions: list[str] = []  # "axis=member" of dimensional contexts
+
+
+class FactTable(msgspec.Struct):
+    rcept_no: str
+    instance: str  # ZIP member the facts were read from
+    facts: list[Fact]
+
+    def summary(self) -> dict:
+        periods = sorted({f.period for f in self.facts}, reverse=True)
+        return {
+            "rcept_no": self.rcept_no,
+            "instance": self.instance,
+            "facts": len(self.facts),
+            "concepts": len({f.concept for f in self.facts}),
+            "periods": periods,
+        }
+
+    def query(
+        self,
+        *,
+        concepts: Sequence[str] | None = None,
+        period: str | None = None,
+        dimensional: bool = False,
+    ) -> list[Fact]:
+        """Facts whose concept contains one of *concepts* (case-insensitive).
+
+        *period* matches any part of the period (``"2024"``, ``"2024-12-31"``).
+        Facts reported against dimensional contexts (e.g. separate rather
+        than consolidated figures, or a segment) are left out unless
+        *dimensional* is set.
+        """
+        wanted = [c.lower() for c in concepts or ()]
+        return [
+            fact
+            for fact in self.facts
+            if (dimensional or not fact.dimensions)
+            and (period is None or period in fact.period)
+            and (not wanted or any(w in fact.concept.lower() for w in wanted))
+        ]
+
+
+def _qname(tag: str, prefixes: dict[str, str]) -> str:
+    if not tag.startswith("{"):
+        return tag
+    uri, _, local = tag[1:].partition("}")
+    prefix = prefixes.get(uri)
+    return f"{prefix}:{local}" if prefix else local
+
+
+def _period(context) -> str:
+    period = context.find(f"{_XBRLI}period")
+    if period is None:
+        return ""
+    instant = period.findtext(f"{_XBRLI}instant")
+    if instant:
+        return instant.strip()
+    start = (period.findtext(f"{_XBRLI}startDate") or "").strip()
+    end = (period.findtext(f"{_XBRLI}endDate") or "").strip()
+    return f"{start}/{end}" if start or end else "forever"
+
+
+def _measure(text: str) -> str:
+    prefix, _, local = text.strip().rpartition(":")
+    return local if prefix == "iso4217" else text.strip()  # "KRW", "xbrli:shares"
+
+
+def _unit(unit) -> str:
+    def measures(parent) -> str:
+        return "*".join(_measure(m.text or "") for m in parent.iter(f"{_XBRLI}measure"))
+
+    divide = unit.find(f"{_XBRLI}divide")
+    if divide is None:
+        return measures(unit)
+    numerator = divide.find(f"{_XBRLI}unitNumerator")
+    denominator = divide.find(f"{_XBRLI}unitDenominator")
+    return f"{measures(numerator)}/{measures(denominator)}"
+
+
+def parse_instance(source: IO[bytes]) -> list[Fact]:
+    """Stream an XBRL instance document into a flat fact list.
+
+    Contexts and units are resolved after the whole document is read, since
+    the specification does not require them to precede the facts. Elements
+    are cleared as soon as they are consumed so memory stays proportional to
+    the fact table, not the XML tree.
+    """
+    prefixes: dict[str, str] = {}
+    contexts: dict[str, tuple[str, list[str]]] = {}
+    units: dict[str, str] = {}
+    raw: list[tuple[str, str, str | None, str, str | None]] = []
+    depth = 0
+    for event, item in iterparse(source, events=("start-ns", "start", "end")):
+        if event == "start-ns":
+            prefix, uri = item
+            prefixes.setdefault(uri, prefix)
+            continue
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        if depth != 1:
+            continue  # only children of the root are contexts, units or facts
+        if item.tag == f"{_XBRLI}context":
+            dimensions = sorted(
+                f"{m.get('dimension')}={(m.text or '').strip()}"
+                for m in item.iter(f"{_XBRLDI}explicitMember")
+            )
+            contexts[item.get("id", "")] = (_period(item), dimensions)
+        elif item.tag == f"{_XBRLI}unit":
+            units[item.get("id", "")] = _unit(item)
+        elif (context_ref := item.get("contextRef")) is not None:
+            value = (item.text or "").strip()
+            unit_ref = item.get("unitRef")
+            if value and (unit_ref is not None or len(value) <= _MAX_TEXT_CHARS):
+                raw.append(
+                    (
+                        _qname(item.tag, prefixes),
+                        context_ref,
+                        unit_ref,
+                        value,
+                        item.get("decimals"),
+                    )
+                )
+        item.clear()
+
+    facts = []
+    for concept, context_ref, unit_ref, value, decimals in raw:
+        period, dimensions = contexts.get(context_ref, ("", []))
+        unit = units.get(unit_ref, unit_ref) if unit_ref is not None else None
+        facts.append(
+            Fact(concept, context_ref, period, unit, value, decimals, dimensions)
+        )
+    return facts
+
+
+def instance_member(names: Iterable[str]) -> str:
+    """Name of the instance document among the files of an XBRL ZIP."""
+    candidates = [n for n in names if n.lower().endswith((".xbrl", ".xml"))]
+    for name in candidates:
+        if name.lower().endswith(".xbrl"):
+            return name
+    if not candidates:
+        raise KeyError("no XBRL instance document in archive")
+    return candidates[0]
+
+
+def parse_zip(rcept_no: str, data: bytes) -> FactTable:
+    """Parse the instance document of a downloaded XBRL ZIP."""
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        member = instance_member(zf.namelist())
+        with zf.open(member) as f:
+            facts = parse_instance(f)
+    return FactTable(rcept_no=rcept_no, instance=member, facts=facts)
+
+
+class XbrlFactStore:
+    """Fact tables stored as ``<rcept_no>.facts.json``, parsed once per filing.
+
+    Filed XBRL is immutable, so a stored table never goes stale; recently
+    used tables are also kept in memory.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._loaded = ResponseCache(_LOADED_TABLES)
+
+    def _path(self, rcept_no: str) -> Path:
+        return self.root / f"{check_code(rcept_no, 14, 'rcept_no')}.facts.json"
+
+    def get(self, rcept_no: str) -> FactTable | None:
+        table = self._loaded.get(rcept_no)
+        if table is None:
+            path = self._path(rcept_no)
+            if not path.exists():
+                return None
+            table = msgspec.json.decode(path.read_bytes(), type=FactTable)
+            self._loaded.set(rcept_no, table)
+        return table
+
+    def put(self, rcept_no: str, data: bytes) -> FactTable:
+        """Parse the XBRL ZIP *data* and store its fact table."""
+        table = parse_zip(rcept_no, data)
+        write_atomic(self._path(rcept_no), [msgspec.json.encode(table)])
+        self._loaded.set(rcept_no, table)
+        return table
+
+
+_store: XbrlFactStore | None = None
+
+
+def get_xbrl_store() -> XbrlFactStore:
+    """Return the shared fact store kept in the data directory."""
+    global _store
+    if _store is None:
+        _store = XbrlFactStore(data_dir() / _XBRL_DIR)
+    return _store
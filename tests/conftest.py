@@ -0,0 +1,41 @@
+"""Shared fixtures: isolated deps state and pooled clients over SDK doubles."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from opendart_fss_mcp import deps
+from opendart_fss_mcp.circuit_breaker import CircuitBreaker
+from opendart_fss_mcp.client_pool import ClientPool, PooledClient
+from opendart_fss_mcp.concurrency import AdaptiveLimiter
+from opendart_fss_mcp.hedging import Hedger
+from opendart_fss_mcp.response_cache import ResponseCache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_deps(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give every test its own breaker, result caches, hedger and limiter."""
+    monkeypatch.setattr(deps, "_client", None)
+    monkeypatch.setattr(deps, "_breaker", CircuitBreaker())
+    monkeypatch.setattr(deps, "_stale", ResponseCache(deps._STALE_CACHE_SIZE))
+    monkeypatch.setattr(
+        deps,
+        "_not_found",
+        ResponseCache(deps._NEGATIVE_CACHE_SIZE, ttl=deps._NEGATIVE_CACHE_TTL_SECONDS),
+    )
+    monkeypatch.setattr(deps, "_hedger", Hedger())
+    monkeypatch.setattr(deps, "_limiter", AdaptiveLimiter())
+
+
+@pytest.fixture
+def make_client() -> Callable[..., PooledClient]:
+    """Build a PooledClient whose keys all route to the SDK double *sdk*."""
+
+    def make(sdk: Any, *keys: str) -> PooledClient:
+        pool = ClientPool(list(keys or ("key",)), client_factory=lambda _: sdk)
+        return PooledClient(pool)
+
+    return make
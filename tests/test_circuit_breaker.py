@@ -0,0 +1,132 @@
+"""Tests for circuit_breaker module and its use in deps.call_api."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+from fastmcp.exceptions import ToolError
+from opendart_fss.exceptions import NotFoundError, ServerError
+
+from opendart_fss_mcp import deps
+from opendart_fss_mcp.circuit_breaker import BreakerState, CircuitBreaker
+from opendart_fss_mcp.client_pool import PooledClient
+
+
+def _trip(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.min_calls):
+        breaker.record_failure()
+
+
+def test_opens_after_error_rate_exceeded() -> None:
+    breaker = CircuitBreaker(error_rate=0.5, min_calls=4)
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == BreakerState.CLOSED
+    breaker.record_failure()
+    assert breaker.state == BreakerState.OPEN
+    assert not breaker.allow()
+
+
+def test_needs_min_calls_before_opening() -> None:
+    breaker = CircuitBreaker(error_rate=0.5, min_calls=10)
+    for _ in range(9):
+        breaker.record_failure()
+    assert breaker.state == BreakerState.CLOSED
+
+
+def test_half_open_allows_single_probe() -> None:
+    breaker = CircuitBreaker(min_calls=2, cooldown=0.0)
+    _trip(breaker)
+    assert breaker.state == BreakerState.HALF_OPEN
+    breaker.cooldown = 60.0
+    assert breaker.allow()
+    assert not breaker.allow()
+
+
+def test_half_open_probe_success_closes() -> None:
+    breaker = CircuitBreaker(min_calls=2, cooldown=0.0)
+    _trip(breaker)
+    probe = breaker.allow()
+    assert probe is not None
+    breaker.record_success(probe)
+    assert breaker.state == BreakerState.CLOSED
+
+
+def test_half_open_ignores_calls_started_before_trip() -> None:
+    breaker = CircuitBreaker(min_calls=2, cooldown=0.0)
+    slow = breaker.allow()
+    _trip(breaker)
+    probe = breaker.allow()
+    breaker.cooldown = 60.0
+    breaker.record_success(slow)
+    assert breaker.state == BreakerState.HALF_OPEN
+    breaker.record_failure(slow)
+    assert breaker.state == BreakerState.HALF_OPEN
+    assert breaker.allow() is None  # the probe is still in flight
+    breaker.record_success(probe)
+    assert breaker.state == BreakerState.CLOSED
+
+
+def test_half_open_probe_failure_reopens() -> None:
+    breaker = CircuitBreaker(min_calls=2, cooldown=0.0)
+    _trip(breaker)
+    probe = breaker.allow()
+    breaker.cooldown = 60.0
+    breaker.record_failure(probe)
+    assert breaker.state == BreakerState.OPEN
+
+
+# -- call_api integration ------------------------------------------------------
+
+
+@pytest.fixture
+def client(
+    monkeypatch: pytest.MonkeyPatch, make_client
+) -> tuple[PooledClient, AsyncMock]:
+    sdk = AsyncMock()
+    monkeypatch.setattr(deps, "_breaker", CircuitBreaker(min_calls=2, cooldown=60))
+    return make_client(sdk), sdk
+
+
+@pytest.mark.asyncio
+async def test_call_api_fails_fast_when_open(client) -> None:
+    pooled, sdk = client
+    sdk.disclosure.get_company.side_effect = ServerError("800")
+    for _ in range(2):
+        with pytest.raises(ToolError, match="서버 오류"):
+            await deps.call_api(pooled.disclosure.get_company(corp_code="1"))
+    assert deps.get_breaker().state == BreakerState.OPEN
+    with pytest.raises(ToolError, match="일시 차단"):
+        await deps.call_api(pooled.disclosure.get_company(corp_code="1"))
+    assert sdk.disclosure.get_company.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_call_api_serves_stale_when_open(client) -> None:
+    pooled, sdk = client
+    sdk.disclosure.get_company.return_value = {"corp_name": "삼성전자"}
+    await deps.call_api(pooled.disclosure.get_company(corp_code="1"))
+    _trip(deps.get_breaker())
+    result = await deps.call_api(pooled.disclosure.get_company(corp_code="1"))
+    assert result == {"corp_name": "삼성전자"}
+    assert sdk.disclosure.get_company.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_not_found_does_not_count_as_outage(client) -> None:
+    pooled, sdk = client
+    sdk.disclosure.get_company.side_effect = NotFoundError("013")
+    for _ in range(5):
+        with pytest.raises(ToolError, match="데이터 없음"):
+            await deps.call_api(pooled.disclosure.get_company(corp_code="1"))
+    assert deps.get_breaker().state == BreakerState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_long_lists_are_not_kept_for_stale_serving(client) -> None:
+    pooled, sdk = client
+    sdk.disclosure.search.return_value = list(range(deps._STALE_MAX_ROWS + 1))
+    await deps.call_api(pooled.disclosure.search(bgn_de="20240101"))
+    assert len(deps._stale) == 0
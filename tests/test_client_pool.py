@@ -0,0 +1,180 @@
+"""Tests for client_pool module."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+from opendart_fss.exceptions import (
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    ValidationError,
+)
+
+from opendart_fss_mcp.client_pool import ClientPool, PooledClient, parse_api_keys
+
+
+def _pool(*keys: str, daily_quota: int = 100) -> tuple[ClientPool, dict]:
+    clients: dict[str, AsyncMock] = {}
+
+    def factory(key: str) -> AsyncMock:
+        client = AsyncMock()
+        client.disclosure.get_company.return_value = key
+        clients[key] = client
+        return client
+
+    pool = ClientPool(list(keys), daily_quota=daily_quota, client_factory=factory)
+    return pool, clients
+
+
+def test_parse_api_keys() -> None:
+    assert parse_api_keys("a, b,,c a") == ["a", "b", "c"]
+    assert parse_api_keys(None) == []
+
+
+def test_empty_pool_raises() -> None:
+    with pytest.raises(ValueError):
+        ClientPool([])
+
+
+@pytest.mark.asyncio
+async def test_routes_to_key_with_most_remaining_quota() -> None:
+    pool, _ = _pool("key-a", "key-b")
+    pool.slots[0].used = 50
+    client = PooledClient(pool)
+    assert await client.disclosure.get_company(corp_code="00126380") == "key-b"
+
+
+@pytest.mark.asyncio
+async def test_calls_are_spread_across_keys() -> None:
+    pool, clients = _pool("key-a", "key-b")
+    client = PooledClient(pool)
+    for _ in range(4):
+        await client.disclosure.get_company(corp_code="00126380")
+    assert clients["key-a"].disclosure.get_company.await_count == 2
+    assert clients["key-b"].disclosure.get_company.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failover_on_rate_limit() -> None:
+    pool, clients = _pool("key-a", "key-b")
+    pool.slots[1].used = 10  # key-a is tried first
+    clients["key-a"].disclosure.get_company.side_effect = RateLimitError("020")
+    client = PooledClient(pool)
+    assert await client.disclosure.get_company(corp_code="00126380") == "key-b"
+    # the blocked key is skipped afterwards
+    assert await client.disclosure.get_company(corp_code="00126380") == "key-b"
+    assert clients["key-a"].disclosure.get_company.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_request_limit_status_fails_over() -> None:
+    # the SDK raises OpenDART's "020 요청 제한을 초과하였습니다" as ValidationError
+    pool, clients = _pool("key-a", "key-b")
+    pool.slots[1].used = 10
+    clients["key-a"].disclosure.get_company.side_effect = ValidationError("020")
+    client = PooledClient(pool)
+    assert await client.disclosure.get_company(corp_code="00126380") == "key-b"
+    assert pool.slots[0].blocked_until > 0
+
+
+@pytest.mark.asyncio
+async def test_no_data_status_does_not_block_key() -> None:
+    # "013 조회된 데이타가 없습니다" arrives from the SDK as RateLimitError
+    pool, clients = _pool("key-a", "key-b")
+    pool.slots[1].used = 10
+    clients["key-a"].disclosure.get_company.side_effect = RateLimitError("013")
+    client = PooledClient(pool)
+    with pytest.raises(NotFoundError):
+        await client.disclosure.get_company(corp_code="00126380")
+    assert pool.slots[0].blocked_until == 0.0
+    assert clients["key-b"].disclosure.get_company.await_count == 0
+
+
+@pytest.mark.asyncio
+async def test_failover_on_authentication_error() -> None:
+    pool, clients = _pool("key-a", "key-b")
+    pool.slots[1].used = 10
+    clients["key-a"].disclosure.get_company.side_effect = AuthenticationError("010")
+    client = PooledClient(pool)
+    assert await client.disclosure.get_company(corp_code="00126380") == "key-b"
+    assert pool.slots[0].disabled
+
+
+@pytest.mark.asyncio
+async def test_all_keys_failing_raises_last_error() -> None:
+    pool, clients = _pool("key-a", "key-b")
+    for c in clients.values():
+        c.disclosure.get_company.side_effect = RateLimitError("015")
+    client = PooledClient(pool)
+    with pytest.raises(RateLimitError):
+        await client.disclosure.get_company(corp_code="00126380")
+    with pytest.raises(RateLimitError):
+        await client.disclosure.get_company(corp_code="00126380")
+
+
+@pytest.mark.asyncio
+async def test_exhausted_quota_is_not_used() -> None:
+    pool, _ = _pool("key-a", "key-b", daily_quota=1)
+    client = PooledClient(pool)
+    await client.disclosure.get_company(corp_code="00126380")
+    await client.disclosure.get_company(corp_code="00126380")
+    with pytest.raises(RateLimitError):
+        await client.disclosure.get_company(corp_code="00126380")
+    assert pool.remaining_quota() == 0
+
+
+@pytest.mark.asyncio
+async def test_stats_masks_keys() -> None:
+    pool, clients = _pool("aaaa-secret", "bbbb-secret")
+    clients["aaaa-secret"].disclosure.get_company.side_effect = AuthenticationError(
+        "010"
+    )
+    pool.slots[1].used = 5
+    await PooledClient(pool).disclosure.get_company(corp_code="00126380")
+    assert [(s["key"], s["used"], s["disabled"]) for s in pool.stats()] == [
+        ("aaaa…", 1, True),
+        ("bbbb…", 6, False),
+    ]
+
+
+_NO_FILE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    "<result><status>014</status><message>파일이 존재하지 않습니다.</message></result>"
+).encode()
+_LIMITED = _NO_FILE.replace(b"014", b"020")
+_EMPTY_ZIP = b"PK\x05\x06" + bytes(18)
+
+
+@pytest.mark.asyncio
+async def test_status_reply_instead_of_zip_is_raised() -> None:
+    pool, clients = _pool("key-a")
+    clients["key-a"].disclosure.download_document.return_value = _NO_FILE
+    with pytest.raises(NotFoundError, match="파일이 존재하지 않습니다"):
+        await PooledClient(pool).disclosure.download_document(rcept_no="1")
+    assert pool.slots[0].blocked_until == 0.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_download_fails_over() -> None:
+    pool, clients = _pool("key-a", "key-b")
+    pool.slots[1].used = 10
+    clients["key-a"].disclosure.download_document.return_value = _LIMITED
+    clients["key-b"].disclosure.download_document.return_value = b"PK\x05\x06" + bytes(
+        18
+    )
+    data = await PooledClient(pool).disclosure.download_document(rcept_no="1")
+    assert data.startswith(b"PK")
+    assert pool.slots[0].blocked_until > 0
+
+
+@pytest.mark.asyncio
+async def test_unrecognized_download_reply_is_a_server_error() -> None:
+    pool, clients = _pool("key-a")
+    clients[
+        "key-a"
+    ].disclosure.download_document.return_value = "<html>점검</html>".encode()
+    with pytest.raises(ServerError):
+        await PooledClient(pool).disclosure.download_document(rcept_no="1")
@@ -0,0 +1,83 @@
+"""Tests for concurrency module."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from opendart_fss.exceptions import NotFoundError, ServerError
+
+from opendart_fss_mcp.concurrency import AdaptiveLimiter
+
+
+async def _ok(delay: float = 0.0) -> str:
+    await asyncio.sleep(delay)
+    return "ok"
+
+
+async def _raise(exc: Exception) -> None:
+    raise exc
+
+
+@pytest.mark.asyncio
+async def test_limit_bounds_in_flight_calls() -> None:
+    limiter = AdaptiveLimiter(initial=2, max_limit=2)
+    peak = 0
+
+    async def probe() -> None:
+        nonlocal peak
+        peak = max(peak, limiter.in_flight)
+        await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(limiter.run(probe) for _ in range(10)))
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_while_latency_is_flat() -> None:
+    limiter = AdaptiveLimiter(initial=2)
+    for _ in range(20):
+        await asyncio.gather(limiter.run(_ok), limiter.run(_ok))
+    assert limiter.limit > 2
+
+
+@pytest.mark.asyncio
+async def test_limit_halves_on_server_error() -> None:
+    limiter = AdaptiveLimiter(initial=16)
+    with pytest.raises(ServerError):
+        await limiter.run(lambda: _raise(ServerError("800")))
+    assert limiter.limit == 8
+
+
+@pytest.mark.asyncio
+async def test_limit_halves_on_timeout() -> None:
+    limiter = AdaptiveLimiter(initial=16)
+    with pytest.raises(httpx.ReadTimeout):
+        await limiter.run(lambda: _raise(httpx.ReadTimeout("timeout")))
+    assert limiter.limit == 8
+
+
+@pytest.mark.asyncio
+async def test_burst_of_failures_decreases_once() -> None:
+    limiter = AdaptiveLimiter(initial=16)
+    for _ in range(3):
+        with pytest.raises(ServerError):
+            await limiter.run(lambda: _raise(ServerError("800")))
+    assert limiter.limit == 8
+
+
+@pytest.mark.asyncio
+async def test_api_errors_do_not_shrink_limit() -> None:
+    limiter = AdaptiveLimiter(initial=16)
+    with pytest.raises(NotFoundError):
+        await limiter.run(lambda: _raise(NotFoundError("013")))
+    assert limiter.limit == 16
+
+
+@pytest.mark.asyncio
+async def test_never_below_min_limit() -> None:
+    limiter = AdaptiveLimiter(initial=1, min_limit=1)
+    limiter._decrease()
+    assert limiter.limit == 1
@@ -180,6 +180,12 @@ async def test_summary(cache: CorpCodeCache) -> None:
     assert summary["unlisted_count"] == 2
 
 
+@pytest.mark.asyncio
+async def test_listed(cache: CorpCodeCache) -> None:
+    listed = await cache.listed(_mock_client())
+    assert [e.corp_code for e in listed] == [c[0] for c in COMPANIES if c[2]]
+
+
 @pytest.mark.asyncio
 async def test_cache_reuses_data(cache: CorpCodeCache) -> None:
     """Second search should not trigger another download."""
@@ -0,0 +1,99 @@
+"""Tests for deps: to_result encoding, inline budget, result handles, is_no_data."""
+
+from __future__ import annotations
+
+import json
+
+import msgspec
+from fastmcp.exceptions import ToolError
+from opendart_fss.exceptions import NotFoundError, ServerError
+from opendart_fss.models.financial import FinancialAccount
+
+from opendart_fss_mcp import deps
+from opendart_fss_mcp.result_store import envelope_size, get_store
+
+ROWS = [
+    FinancialAccount(rcept_no="1", account_nm=f"계정{i:03d}", ord=f"{i:03d}")
+    for i in range(450)
+]
+
+
+def _decode(result) -> object:
+    return json.loads(result.content[0].text)
+
+
+def _raw_page(uri: str) -> bytes:
+    result_id, page = uri.removeprefix("opendart://results/").split("/")
+    return get_store().page(result_id, int(page))
+
+
+def _page(uri: str) -> dict:
+    return msgspec.json.decode(_raw_page(uri))
+
+
+def test_non_list_results_are_encoded_as_is(monkeypatch) -> None:
+    monkeypatch.setattr(deps, "_inline_max_bytes", 10)
+    assert _decode(deps.to_result({"a": [1, 2, 3]})) == {"a": [1, 2, 3]}
+
+
+def test_small_results_are_inlined(monkeypatch) -> None:
+    monkeypatch.setattr(deps, "_inline_max_bytes", 1000)
+    rows = _decode(deps.to_result(ROWS, limit=2))
+    assert [r["account_nm"] for r in rows] == ["계정000", "계정001"]
+
+
+def test_result_at_the_limit_is_inlined(monkeypatch) -> None:
+    size = len(msgspec.json.encode(ROWS[:3]))
+    monkeypatch.setattr(deps, "_inline_max_bytes", size)
+    assert len(_decode(deps.to_result(ROWS, limit=3))) == 3
+    monkeypatch.setattr(deps, "_inline_max_bytes", size - 1)
+    assert "result_id" in _decode(deps.to_result(ROWS, limit=3))
+
+
+def test_single_oversized_row_is_inlined(monkeypatch) -> None:
+    monkeypatch.setattr(deps, "_inline_max_bytes", 10)
+    assert len(_decode(deps.to_result(ROWS, limit=1))) == 1
+
+
+def test_pages_are_sized_to_the_inline_budget(monkeypatch) -> None:
+    budget = 2000
+    monkeypatch.setattr(deps, "_inline_max_bytes", budget)
+    summary = _decode(deps.to_result(ROWS))
+    assert summary["total_rows"] == 450
+    data = len(msgspec.json.encode(ROWS))
+    header = 2 + envelope_size(450)
+    assert summary["page_size"] == 450 * (budget - header) // (data - 2)
+    assert summary["page_count"] == -(-450 // summary["page_size"])
+
+    uri, seen = summary["first_page"], []
+    while uri:
+        raw = _raw_page(uri)
+        assert len(raw) <= budget
+        page = msgspec.json.decode(raw)
+        seen.extend(row["ord"] for row in page["data"])
+        uri = page["next"]
+    assert seen == [f"{i:03d}" for i in range(450)]
+
+
+def test_columnar_pages_fit_the_inline_budget(monkeypatch) -> None:
+    budget = 1000
+    monkeypatch.setattr(deps, "_inline_max_bytes", budget)
+    summary = _decode(deps.to_result(ROWS, fields=["ord"], format="columnar"))
+    raw = _raw_page(summary["first_page"])
+    assert len(raw) <= budget
+    page = msgspec.json.decode(raw)
+    assert page["data"]["columns"] == ["ord"]
+    assert len(page["data"]["rows"]) == summary["page_size"]
+
+
+def test_is_no_data() -> None:
+    def wrapped(cause: Exception) -> ToolError:
+        try:
+            raise ToolError("조회 실패") from cause
+        except ToolError as e:
+            return e
+
+    assert deps.is_no_data(wrapped(NotFoundError("013", "조회된 데이타가 없습니다.")))
+    assert not deps.is_no_data(wrapped(ServerError("800", "시스템 점검")))
+    assert not deps.is_no_data(NotFoundError("013"))
+    assert not deps.is_no_data([])
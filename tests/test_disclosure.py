@@ -0,0 +1,116 @@
+"""Tests for the auto-paginating disclosure search."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from fastmcp.exceptions import ToolError
+from opendart_fss.exceptions import ServerError
+from opendart_fss.models.disclosure import Disclosure, DisclosureListResponse
+
+from opendart_fss_mcp import document_archive, document_search
+from opendart_fss_mcp.deps import gather_calls
+from opendart_fss_mcp.document_archive import DocumentArchive
+from opendart_fss_mcp.document_search import FullTextIndex
+from opendart_fss_mcp.tools.disclosure import document, search_all_pages
+
+TOTAL_ROWS = 450
+
+
+def _sdk(fail_page: int | None = None) -> tuple[AsyncMock, list[int]]:
+    """SDK double serving TOTAL_ROWS disclosures, 100 per page."""
+    sdk = AsyncMock()
+    requested: list[int] = []
+    in_flight = 0
+    peak = 0
+
+    async def get(endpoint, response_type, *, params):
+        nonlocal in_flight, peak
+        page_no = params["page_no"]
+        requested.append(page_no)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if page_no == fail_page:
+            raise ServerError("800")
+        start = (page_no - 1) * params["page_count"]
+        stop = min(start + params["page_count"], TOTAL_ROWS)
+        return DisclosureListResponse(
+            status="000",
+            message="정상",
+            page_no=page_no,
+            total_count=TOTAL_ROWS,
+            total_page=5,
+            items=[
+                Disclosure(corp_code="00126380", corp_name="삼성전자", rcept_no=str(i))
+                for i in range(start, stop)
+            ],
+        )
+
+    sdk.disclosure._get.side_effect = get
+    sdk.peak = lambda: peak
+    return sdk, requested
+
+
+@pytest.mark.asyncio
+async def test_all_pages_are_merged_in_order(make_client) -> None:
+    sdk, requested = _sdk()
+    client = make_client(sdk)
+    rows = await search_all_pages(client, {"bgn_de": "20240101"}, max_rows=1000)
+    assert [row.rcept_no for row in rows] == [str(i) for i in range(TOTAL_ROWS)]
+    assert sorted(requested) == [1, 2, 3, 4, 5]
+    assert sdk.peak() > 1  # pages after the first are fetched concurrently
+
+
+@pytest.mark.asyncio
+async def test_max_rows_limits_pages_fetched(make_client) -> None:
+    sdk, requested = _sdk()
+    client = make_client(sdk)
+    rows = await search_all_pages(client, {"bgn_de": "20240101"}, max_rows=150)
+    assert len(rows) == 150
+    assert sorted(requested) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_failed_page_fails_the_search(make_client) -> None:
+    sdk, _ = _sdk(fail_page=3)
+    client = make_client(sdk)
+    with pytest.raises(ToolError, match="서버 오류"):
+        await search_all_pages(client, {"bgn_de": "20240101"}, max_rows=1000)
+
+
+@pytest.mark.asyncio
+async def test_gather_calls_bounds_concurrency(make_client) -> None:
+    sdk, _ = _sdk()
+    client = make_client(sdk)
+    calls = [
+        client.disclosure._get(
+            "/api/list.json",
+            DisclosureListResponse,
+            params={"bgn_de": "20240101", "page_no": n, "page_count": 100},
+        )
+        for n in range(1, 6)
+    ]
+    pages = await gather_calls(calls, concurrency=2)
+    assert [page.page_no for page in pages] == [1, 2, 3, 4, 5]
+    assert sdk.peak() == 2
+
+
+@pytest.mark.asyncio
+async def test_error_reply_is_not_archived(tmp_path, monkeypatch, make_client) -> None:
+    archive = DocumentArchive(tmp_path / "documents")
+    fulltext = FullTextIndex(tmp_path / "fulltext.sqlite3")
+    monkeypatch.setattr(document_archive, "_archive", archive)
+    monkeypatch.setattr(document_search, "_fulltext", fulltext)
+    sdk = AsyncMock()
+    sdk.disclosure.download_document.return_value = (
+        "<result><status>014</status>"
+        "<message>파일이 존재하지 않습니다.</message></result>"
+    ).encode()
+    with pytest.raises(ToolError, match="데이터 없음"):
+        await document.fn(rcept_no="20240101000001", client=make_client(sdk))
+    assert archive.get("20240101000001") is None
+    assert fulltext.indexed() == set()
@@ -0,0 +1,167 @@
+"""Tests for disclosure_index module and the index sync in tools/disclosure."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from unittest.mock import AsyncMock
+
+import pytest
+from fastmcp.exceptions import ToolError
+from opendart_fss.exceptions import NotFoundError
+from opendart_fss.models.disclosure import Disclosure, DisclosureListResponse
+
+from opendart_fss_mcp import disclosure_index
+from opendart_fss_mcp.disclosure_index import DisclosureIndex
+from opendart_fss_mcp.tools.disclosure import (
+    _search_local,
+    search,
+    sync_index,
+    sync_window,
+)
+
+_PARAMS = {
+    "corp_code": None,
+    "bgn_de": "20240101",
+    "end_de": "20240110",
+    "last_reprt_at": None,
+    "pblntf_ty": None,
+    "pblntf_detail_ty": None,
+    "corp_cls": None,
+    "sort": None,
+    "sort_mth": None,
+}
+
+
+def _filing(rcept_no: str, rcept_dt: str, **kwargs) -> Disclosure:
+    return Disclosure(
+        corp_code=kwargs.pop("corp_code", "00126380"),
+        corp_name=kwargs.pop("corp_name", "삼성전자"),
+        rcept_no=rcept_no,
+        rcept_dt=rcept_dt,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def index(tmp_path) -> Iterator[DisclosureIndex]:
+    index = DisclosureIndex(tmp_path / "disclosures.sqlite3")
+    yield index
+    index.close()
+
+
+def test_coverage_requires_every_day(index: DisclosureIndex) -> None:
+    index.mark_synced("20240101", "20240105")
+    assert index.covers("20240102", "20240105")
+    assert not index.covers("20240104", "20240106")
+    assert index.last_synced_day() == "20240105"
+
+
+def test_search_filters_and_orders(index: DisclosureIndex) -> None:
+    index.add(
+        "A",
+        [
+            _filing("20240102000001", "20240102", corp_cls="Y"),
+            _filing("20240103000001", "20240103", corp_cls="K", corp_code="00164779"),
+        ],
+    )
+    index.add("B", [_filing("20240104000001", "20240104", corp_cls="Y")])
+
+    rows = index.search(bgn_de="20240101", end_de="20240131")
+    assert [r.rcept_no for r in rows] == [
+        "20240104000001",
+        "20240103000001",
+        "20240102000001",
+    ]
+    assert [
+        r.rcept_no
+        for r in index.search(bgn_de="20240101", end_de="20240131", pblntf_ty="A")
+    ] == ["20240103000001", "20240102000001"]
+    assert [
+        r.rcept_no
+        for r in index.search(
+            bgn_de="20240101", end_de="20240131", corp_cls="Y", sort_mth="asc"
+        )
+    ] == ["20240102000001", "20240104000001"]
+    paged = index.search(bgn_de="20240101", end_de="20240131", offset=1, limit=1)
+    assert [r.rcept_no for r in paged] == ["20240103000001"]
+
+
+def test_corp_classes_from_latest_filing(index: DisclosureIndex) -> None:
+    index.add("A", [_filing("1", "20240101", corp_cls="K")])
+    index.add("A", [_filing("2", "20240301", corp_cls="Y")])
+    index.add("A", [_filing("3", "20240201", corp_code="00999001", corp_cls="")])
+    assert index.corp_classes() == {"00126380": "Y"}
+
+
+def test_local_search_only_for_synced_windows(index: DisclosureIndex) -> None:
+    index.add("A", [_filing("20240102000001", "20240102")])
+    index.mark_synced("20240101", "20240131")
+    assert len(_search_local(index, _PARAMS, offset=0, limit=10)) == 1
+    assert (
+        _search_local(index, {**_PARAMS, "end_de": "20240201"}, offset=0, limit=10)
+        is None
+    )
+    assert (
+        _search_local(
+            index, {**_PARAMS, "pblntf_detail_ty": "A001"}, offset=0, limit=10
+        )
+        is None
+    )
+
+
+@pytest.mark.parametrize(
+    ("bgn_de", "end_de"), [("2024-01-01", "2024-01-10"), ("20240101", "20240231")]
+)
+def test_malformed_dates_are_left_to_opendart(
+    index: DisclosureIndex, bgn_de: str, end_de: str
+) -> None:
+    index.mark_synced("20240101", "20240131")
+    params = {**_PARAMS, "bgn_de": bgn_de, "end_de": end_de}
+    assert _search_local(index, params, offset=0, limit=10) is None
+
+
+@pytest.mark.asyncio
+async def test_search_with_malformed_dates_calls_opendart(
+    index: DisclosureIndex, monkeypatch, make_client
+) -> None:
+    monkeypatch.setattr(disclosure_index, "_index", index)
+    sdk = AsyncMock()
+    sdk.disclosure.search.return_value = [_filing("20240102000001", "20240102")]
+    await search.fn(bgn_de="2024-01-01", end_de="2024-01-31", client=make_client(sdk))
+    assert sdk.disclosure.search.await_args.kwargs["bgn_de"] == "2024-01-01"
+
+
+@pytest.mark.asyncio
+async def test_sync_index_rejects_malformed_dates(
+    index: DisclosureIndex, monkeypatch, make_client
+) -> None:
+    monkeypatch.setattr(disclosure_index, "_index", index)
+    sdk = AsyncMock()
+    with pytest.raises(ToolError, match="bgn_de"):
+        await sync_index.fn(bgn_de="2024-01-01", client=make_client(sdk))
+    sdk.disclosure._get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sync_window_records_types_and_days(
+    index: DisclosureIndex, make_client
+) -> None:
+    sdk = AsyncMock()
+
+    async def get(endpoint, response_type, *, params):
+        if params["pblntf_ty"] != "B":
+            raise NotFoundError("013", "조회된 데이타가 없습니다.")
+        return DisclosureListResponse(
+            status="000",
+            message="정상",
+            total_page=1,
+            items=[_filing("20230302000001", "20230302")],
+        )
+
+    sdk.disclosure._get.side_effect = get
+    client = make_client(sdk)
+
+    assert await sync_window(client, index, "20230301", "20230303") == 1
+    assert index.covers("20230301", "20230303")
+    rows = index.search(bgn_de="20230301", end_de="20230303", pblntf_ty="B")
+    assert [r.rcept_no for r in rows] == ["20230302000001"]
@@ -0,0 +1,67 @@
+"""Tests for document_archive module."""
+
+from __future__ import annotations
+
+import io
+import zipfile
+from collections.abc import Iterator
+
+import pytest
+
+from opendart_fss_mcp.document_archive import DocumentArchive
+
+
+def _zip(**members: str) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, text in members.items():
+            zf.writestr(name, text)
+    return buf.getvalue()
+
+
+@pytest.fixture
+def archive(tmp_path) -> Iterator[DocumentArchive]:
+    archive = DocumentArchive(tmp_path / "documents")
+    yield archive
+    archive.close()
+
+
+def test_put_then_get(archive: DocumentArchive) -> None:
+    data = _zip(**{"20240312000736.xml": "<DOCUMENT>본문</DOCUMENT>"})
+    stored = archive.put("20240312000736", data)
+    assert stored.path.read_bytes() == data
+    assert stored.path.name == f"{stored.sha256}.zip"
+
+    found = archive.get("20240312000736")
+    assert found is not None
+    assert found.sha256 == stored.sha256
+    assert found.metadata()["members"] == [
+        {
+            "name": "20240312000736.xml",
+            "size": len("<DOCUMENT>본문</DOCUMENT>".encode()),
+        }
+    ]
+    assert archive.get("20240312000999") is None
+
+
+def test_identical_content_is_stored_once(archive: DocumentArchive) -> None:
+    data = _zip(**{"a.xml": "<A/>"})
+    first = archive.put("20240101000001", data)
+    second = archive.put("20240101000002", data)
+    assert first.path == second.path
+    assert len(list((archive.root / "objects").rglob("*.zip"))) == 1
+
+
+def test_index_survives_reopen(tmp_path) -> None:
+    archive = DocumentArchive(tmp_path / "documents")
+    archive.put("20240101000001", _zip(**{"a.xml": "<A/>"}))
+    archive.close()
+    reopened = DocumentArchive(tmp_path / "documents")
+    assert reopened.get("20240101000001") is not None
+    reopened.close()
+
+
+def test_missing_object_is_a_miss(archive: DocumentArchive) -> None:
+    stored = archive.put("20240101000001", _zip(**{"a.xml": "<A/>"}))
+    stored.path.unlink()
+    assert archive.get("20240101000001") is None
@@ -0,0 +1,85 @@
+"""Tests for document_reader module."""
+
+from __future__ import annotations
+
+import zipfile
+
+import pytest
+
+from opendart_fss_mcp.document_reader import DocumentReader, strip_markup
+
+BODY = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    "<DOCUMENT>\n"
+    '  <TITLE ATOC="Y">II. 사업의 내용</TITLE>\n'
+    "  <P>당사는   반도체 &amp; 디스플레이\n   사업을 영위합니다.</P>\n"
+    "  <TABLE><TR><TD>매출액</TD><TD>1,000</TD></TR></TABLE>\n"
+    "</DOCUMENT>\n"
+)
+
+
+@pytest.fixture
+def zip_path(tmp_path):
+    path = tmp_path / "doc.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("20240312000736.xml", BODY)
+        zf.writestr("20240312000736_00760.xml", "<P>첨부</P>" * 5000)
+        zf.writestr(
+            "legacy.xml",
+            '<?xml version="1.0" encoding="euc-kr"?><P>감사의견</P>'.encode("euc-kr"),
+        )
+    return path
+
+
+def test_members_and_main_member(zip_path) -> None:
+    with DocumentReader(zip_path) as reader:
+        names = [m["name"] for m in reader.members()]
+        assert names == [
+            "20240312000736.xml",
+            "20240312000736_00760.xml",
+            "legacy.xml",
+        ]
+        assert reader.main_member("20240312000736") == "20240312000736.xml"
+        assert reader.main_member("20991231000000") == "20240312000736.xml"
+
+
+def test_text_is_stripped_and_unescaped(zip_path) -> None:
+    with DocumentReader(zip_path) as reader:
+        text = "".join(reader.iter_text("20240312000736.xml"))
+    assert "<" not in text
+    assert "II. 사업의 내용" in text
+    assert "당사는 반도체 & 디스플레이 사업을 영위합니다." in text
+    assert "매출액\t1,000" in text
+
+
+def test_declared_encoding_is_used(zip_path) -> None:
+    with DocumentReader(zip_path) as reader:
+        assert "감사의견" in "".join(reader.iter_text("legacy.xml"))
+
+
+def test_windows_cover_the_text_without_gaps(zip_path) -> None:
+    member = "20240312000736_00760.xml"
+    with DocumentReader(zip_path) as reader:
+        full = "".join(reader.iter_text(member))
+        pieces, offset = [], 0
+        while offset is not None:
+            window = reader.read_text(member, offset=offset, max_chars=3000)
+            pieces.append(window["text"])
+            offset = window["next_offset"]
+    assert "".join(pieces) == full
+    assert len(pieces) == -(-len(full) // 3000)
+
+
+def test_unknown_member_raises(zip_path) -> None:
+    with DocumentReader(zip_path) as reader, pytest.raises(KeyError):
+        reader.read_text("missing.xml", max_chars=10)
+
+
+def test_markup_split_across_chunks() -> None:
+    chunks = [
+        b"<P>\xea\xb0",
+        b"\x90\xec\x82\xac &am",
+        b"p; \xeb\xb3\xb4\xea\xb3\xa0</",
+        b"P>",
+    ]
+    assert "".join(strip_markup(iter(chunks))).strip() == "감사 & 보고"
@@ -0,0 +1,77 @@
+"""Tests for document_search module."""
+
+from __future__ import annotations
+
+import io
+import zipfile
+from collections.abc import Iterator
+
+import pytest
+
+from opendart_fss_mcp.document_archive import DocumentArchive
+from opendart_fss_mcp.document_search import FullTextIndex
+
+
+def _filing(*sections: tuple[str, str]) -> bytes:
+    body = "".join(
+        f"<SECTION-1><TITLE>{title}</TITLE><P>{text}</P></SECTION-1>"
+        for title, text in sections
+    )
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("body.xml", f'<?xml version="1.0" encoding="utf-8"?>{body}')
+    return buf.getvalue()
+
+
+@pytest.fixture
+def stores(tmp_path) -> Iterator[tuple[DocumentArchive, FullTextIndex]]:
+    archive = DocumentArchive(tmp_path / "documents")
+    fulltext = FullTextIndex(tmp_path / "fulltext.sqlite3")
+    archive.put(
+        "20240101000001",
+        _filing(
+            ("1. 증권발행개요", "제3자배정유상증자를 결정하였습니다."),
+            ("2. 자금조달의 목적", "운영자금 및 시설자금"),
+        ),
+    )
+    archive.put(
+        "20240101000002",
+        _filing(("1. 소송 등의 제기", "전 대표이사의 횡령 혐의 고소")),
+    )
+    for rcept_no in sorted(archive.rcept_nos()):
+        fulltext.add(archive.get(rcept_no))
+    yield archive, fulltext
+    fulltext.close()
+    archive.close()
+
+
+def test_bigrams_match_inside_compound_words(stores) -> None:
+    archive, fulltext = stores
+    results = fulltext.search("유상증자", archive, limit=10)
+    assert [(r["rcept_no"], r["section"]) for r in results] == [
+        ("20240101000001", "1. 증권발행개요")
+    ]
+    assert "유상증자" in results[0]["snippet"]
+
+
+def test_all_terms_must_match(stores) -> None:
+    archive, fulltext = stores
+    assert fulltext.search("횡령 고소", archive, limit=10)[0]["rcept_no"] == (
+        "20240101000002"
+    )
+    assert fulltext.search("횡령 유상증자", archive, limit=10) == []
+
+
+def test_section_titles_are_searchable(stores) -> None:
+    archive, fulltext = stores
+    results = fulltext.search("자금조달", archive, limit=10)
+    assert [r["section"] for r in results] == ["2. 자금조달의 목적"]
+
+
+def test_rcept_no_filter_and_reindexing(stores) -> None:
+    archive, fulltext = stores
+    assert (
+        fulltext.search("횡령", archive, limit=10, rcept_nos=["20240101000001"]) == []
+    )
+    assert fulltext.add(archive.get("20240101000002")) == 0  # already indexed
+    assert fulltext.indexed() == {"20240101000001", "20240101000002"}
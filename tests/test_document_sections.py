@@ -0,0 +1,71 @@
+"""Tests for document_sections module."""
+
+from __future__ import annotations
+
+import io
+import zipfile
+from collections.abc import Iterator
+
+import pytest
+
+from opendart_fss_mcp.document_archive import ArchivedDocument, DocumentArchive
+from opendart_fss_mcp.document_sections import load_sections
+
+RCEPT_NO = "20240312000736"
+BODY = """<?xml version="1.0" encoding="utf-8"?>
+<DOCUMENT>
+<COVER><TITLE>사업보고서</TITLE><P>표지</P></COVER>
+<BODY>
+<SECTION-1><TITLE ATOC="Y">I. 회사의 개요</TITLE>
+  <SECTION-2><TITLE ATOC="Y">1. 회사의 개요</TITLE><P>설립일 1969년</P></SECTION-2>
+  <SECTION-2><TITLE ATOC="Y">2. 회사의 연혁</TITLE><P>연혁 본문</P></SECTION-2>
+</SECTION-1>
+<SECTION-1><TITLE ATOC="Y">II. 사업의 내용</TITLE><P>반도체 사업</P></SECTION-1>
+</BODY>
+</DOCUMENT>
+"""
+
+
+@pytest.fixture
+def archived(tmp_path) -> Iterator[ArchivedDocument]:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(f"{RCEPT_NO}.xml", BODY)
+    archive = DocumentArchive(tmp_path / "documents")
+    yield archive.put(RCEPT_NO, buf.getvalue())
+    archive.close()
+
+
+def test_index_lists_sections_with_levels(archived: ArchivedDocument) -> None:
+    sections = load_sections(archived).index.sections
+    assert [(s.title, s.level) for s in sections] == [
+        ("사업보고서", 0),
+        ("I. 회사의 개요", 1),
+        ("1. 회사의 개요", 2),
+        ("2. 회사의 연혁", 2),
+        ("II. 사업의 내용", 1),
+    ]
+
+
+def test_sections_read_their_own_text(archived: ArchivedDocument) -> None:
+    sections = load_sections(archived)
+    (overview,) = sections.find("I. 회사의 개요")
+    text = sections.read(overview)
+    assert text.startswith("I. 회사의 개요")
+    assert "설립일 1969년" in text and "연혁 본문" in text
+    assert "반도체 사업" not in text
+
+    (history,) = sections.find("회사의연혁")  # spaces are ignored
+    assert sections.read(history).strip() == "2. 회사의 연혁\n\n연혁 본문"
+
+
+def test_index_is_persisted_beside_the_archive(archived: ArchivedDocument) -> None:
+    load_sections(archived)
+    text_path = archived.path.with_suffix(".txt")
+    index_path = archived.path.with_suffix(".sections.json")
+    assert text_path.exists() and index_path.exists()
+
+    archived.path.unlink()  # later reads no longer need the ZIP
+    reloaded = load_sections(archived)
+    (business,) = reloaded.find("사업의 내용")
+    assert "반도체 사업" in reloaded.read(business)
@@ -0,0 +1,143 @@
+"""Tests for export module and the export CLI command."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from opendart_fss.exceptions import NotFoundError, ServerError
+from opendart_fss.models.financial import FinancialAccount
+from typer.testing import CliRunner
+
+from opendart_fss_mcp.cli import app
+from opendart_fss_mcp.export import ExportFormat, ExportSummary, export_statements
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def _sdk(fail: set[str]) -> AsyncMock:
+    sdk = AsyncMock()
+
+    async def get_full_statements(*, corp_code, bsns_year, reprt_code, fs_div):
+        if corp_code in fail:
+            raise ServerError("800", "시스템 점검")
+        if corp_code == "003":
+            raise NotFoundError("013", "조회된 데이타가 없습니다.")
+        return [
+            FinancialAccount(
+                rcept_no="1",
+                corp_code=corp_code,
+                bsns_year=bsns_year,
+                account_nm="자산총계",
+                thstrm_amount="1,000",
+            )
+        ]
+
+    sdk.financial.get_full_statements.side_effect = get_full_statements
+    return sdk
+
+
+@pytest.mark.asyncio
+async def test_export_resumes_after_failed_batch(tmp_path, make_client) -> None:
+    codes = ["001", "002", "003", "004"]
+    client = make_client(_sdk(fail={"004"}))
+    first = await export_statements(client, codes, ["2024"], tmp_path, batch_size=2)
+    assert (first.batches, first.rows) == (1, 2)
+    assert first.empty == ["003/2024"]
+    assert len(first.failed) == 1
+    assert not (tmp_path / "2024" / "part-00001.parquet").exists()
+
+    sdk = _sdk(fail=set())
+    client = make_client(sdk)
+    second = await export_statements(client, codes, ["2024"], tmp_path, batch_size=2)
+    assert (second.skipped, second.batches, second.failed) == (1, 1, [])
+    retried = {
+        c.kwargs["corp_code"] for c in sdk.financial.get_full_statements.await_args_list
+    }
+    assert "004" in retried and retried <= {"003", "004"}  # only batch 1
+
+    table = pq.read_table(tmp_path / "2024")
+    assert sorted(table.column("corp_code").to_pylist()) == ["001", "002", "004"]
+    assert table.schema.field("thstrm_amount").type == pa.float64()
+    assert table.column("thstrm_amount").to_pylist() == [1000.0] * 3
+
+
+@pytest.mark.asyncio
+async def test_export_arrow_format(tmp_path, make_client) -> None:
+    client = make_client(_sdk(fail=set()))
+    await export_statements(
+        client, ["001"], ["2023", "2024"], tmp_path, format=ExportFormat.ARROW
+    )
+    from pyarrow import feather
+
+    table = feather.read_table(tmp_path / "2023" / "part-00000.arrow")
+    assert table.column("bsns_year").to_pylist() == ["2023"]
+
+
+@pytest.mark.asyncio
+async def test_resume_keeps_the_company_list_of_the_first_run(
+    tmp_path, make_client
+) -> None:
+    def listing(*codes):
+        cache = AsyncMock()
+        cache.listed.return_value = [SimpleNamespace(corp_code=c) for c in codes]
+        return patch("opendart_fss_mcp.export.get_cache", return_value=cache)
+
+    with listing("001", "002", "003", "004"):
+        client = make_client(_sdk(fail={"004"}))
+        first = await export_statements(client, None, ["2024"], tmp_path, batch_size=2)
+    assert len(first.failed) == 1
+
+    sdk = _sdk(fail=set())
+    with listing("000", "001", "002", "003", "004") as get_cache:
+        second = await export_statements(
+            make_client(sdk), None, ["2024"], tmp_path, batch_size=2
+        )
+    get_cache.assert_not_called()
+    assert (second.skipped, second.batches) == (1, 1)
+    retried = {
+        c.kwargs["corp_code"] for c in sdk.financial.get_full_statements.await_args_list
+    }
+    assert "004" in retried and retried <= {"003", "004"}  # not "000"
+
+
+@pytest.mark.asyncio
+async def test_changed_arguments_replace_earlier_parts(tmp_path, make_client) -> None:
+    client = make_client(_sdk(fail=set()))
+    codes = ["001", "002", "004"]
+    await export_statements(client, codes, ["2024"], tmp_path, batch_size=2)
+    assert len(list((tmp_path / "2024").iterdir())) == 2
+
+    summary = await export_statements(client, codes, ["2024"], tmp_path, batch_size=3)
+    assert summary.skipped == 0
+    assert [p.name for p in (tmp_path / "2024").iterdir()] == ["part-00000.parquet"]
+    assert pq.read_table(tmp_path / "2024").num_rows == 3
+
+
+def test_cli_export_does_not_start_the_server(tmp_path) -> None:
+    with (
+        patch("opendart_fss_mcp.export.export_statements") as export,
+        patch("opendart_fss_mcp.server.mcp.run") as run,
+    ):
+        export.return_value = ExportSummary()
+        result = CliRunner().invoke(
+            app,
+            [
+                "--api-key",
+                "key",
+                "export",
+                str(tmp_path),
+                "--bgn-year",
+                "2023",
+                "--end-year",
+                "2024",
+                "--corp-codes",
+                "001,002",
+            ],
+        )
+    assert result.exit_code == 0, result.output
+    run.assert_not_called()
+    args = export.await_args.args
+    assert args[1:3] == (["001", "002"], ["2023", "2024"])
@@ -0,0 +1,128 @@
+"""Tests for the multi-period financial time series."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from opendart_fss.exceptions import NotFoundError
+from opendart_fss.models.financial import FinancialAccount
+
+from opendart_fss_mcp.amounts import parse_amount
+from opendart_fss_mcp.tools.financial import (
+    build_series,
+    multi_account,
+    split_corp_codes,
+    time_series,
+)
+
+
+def _row(account_nm: str, amount: str, *, fs_div: str = "CFS") -> FinancialAccount:
+    return FinancialAccount(
+        rcept_no="1",
+        fs_div=fs_div,
+        sj_div="IS",
+        account_nm=account_nm,
+        thstrm_amount=amount,
+    )
+
+
+def test_parse_amount() -> None:
+    assert parse_amount("1,234,567") == 1234567
+    assert parse_amount("-1,000") == -1000
+    assert parse_amount("(500)") == -500
+    assert parse_amount("3.5") == 3.5
+    assert parse_amount("-") is None
+    assert parse_amount(None) is None
+
+
+def test_series_are_aligned_to_periods() -> None:
+    periods = [("2023", "11011"), ("2024", "11013"), ("2024", "11011")]
+    results = [
+        [_row("매출액", "100"), _row("매출액", "90", fs_div="OFS")],
+        ValueError("데이터 없음"),
+        [_row("매출액", "130"), _row("영업이익", "20")],
+    ]
+    out = build_series(periods, results, fs_div="CFS")
+    assert out["periods"] == ["2023FY", "2024Q1", "2024FY"]
+    assert out["series"] == [
+        {"sj_div": "IS", "account_nm": "매출액", "values": [100, None, 130]},
+        {"sj_div": "IS", "account_nm": "영업이익", "values": [None, None, 20]},
+    ]
+    assert out["errors"] == [
+        {"bsns_year": "2024", "reprt_code": "11013", "error": "데이터 없음"}
+    ]
+
+
+def test_series_account_filter() -> None:
+    out = build_series(
+        [("2024", "11011")],
+        [[_row("매출액", "1"), _row("영업이익", "2")]],
+        fs_div="CFS",
+        accounts=["영업이익"],
+    )
+    assert [s["account_nm"] for s in out["series"]] == ["영업이익"]
+
+
+@pytest.mark.asyncio
+async def test_time_series_reports_failed_periods(make_client) -> None:
+    sdk = AsyncMock()
+
+    async def get_single_account(*, corp_code, bsns_year, reprt_code, fs_div):
+        if bsns_year == "2021":
+            raise NotFoundError("013", "조회된 데이타가 없습니다.")
+        return [_row("매출액", bsns_year)]
+
+    sdk.financial.get_single_account.side_effect = get_single_account
+    client = make_client(sdk)
+
+    result = await time_series.fn(
+        corp_code="00999001",
+        bgn_year=2021,
+        end_year=2023,
+        reprt_codes=["11011"],
+        accounts=None,
+        fs_div="CFS",
+        client=client,
+    )
+    out = json.loads(result.content[0].text)
+    assert out["periods"] == ["2021FY", "2022FY", "2023FY"]
+    assert out["series"][0]["values"] == [None, 2022, 2023]
+    assert [e["bsns_year"] for e in out["errors"]] == ["2021"]
+    assert sdk.financial.get_single_account.await_count == 3
+
+
+def test_split_corp_codes() -> None:
+    assert split_corp_codes(" 001, 002,,001 ,003") == ["001", "002", "003"]
+
+
+@pytest.mark.asyncio
+async def test_multi_account_chunks_beyond_twenty_companies(make_client) -> None:
+    sdk = AsyncMock()
+    codes = [f"{i:08d}" for i in range(45)]
+
+    async def get_multi_account(*, corp_code, bsns_year, reprt_code, fs_div):
+        chunk = corp_code.split(",")
+        if chunk[0] == codes[40]:
+            raise NotFoundError("013", "조회된 데이타가 없습니다.")
+        return [
+            FinancialAccount(rcept_no="1", corp_code=code, account_nm="매출액")
+            for code in reversed(chunk)
+        ]
+
+    sdk.financial.get_multi_account.side_effect = get_multi_account
+    client = make_client(sdk)
+
+    result = await multi_account.fn(
+        corp_code=",".join(codes),
+        bsns_year="2024",
+        reprt_code="11011",
+        client=client,
+    )
+    out = json.loads(result.content[0].text)
+    assert [row["corp_code"] for row in out] == codes[:40]
+    sent = [
+        c.kwargs["corp_code"] for c in sdk.financial.get_multi_account.await_args_list
+    ]
+    assert sorted(len(s.split(",")) for s in sent) == [5, 20, 20]
@@ -0,0 +1,120 @@
+"""Tests for hedging module."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from opendart_fss.exceptions import NotFoundError, ServerError
+
+from opendart_fss_mcp.hedging import Hedger, LatencyTracker
+
+
+def _is_transient(e: BaseException) -> bool:
+    return isinstance(e, ServerError)
+
+
+def _sdk(delays: list[float], results: list) -> AsyncMock:
+    """SDK double: the n-th get_company call sleeps delays[n], yields results[n]."""
+    sdk = AsyncMock()
+    calls = iter(zip(delays, results))
+
+    async def get_company(**kwargs):
+        delay, result = next(calls)
+        await asyncio.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    sdk.disclosure.get_company.side_effect = get_company
+    return sdk
+
+
+def _warm_hedger(**kwargs) -> Hedger:
+    hedger = Hedger(enabled=True, **kwargs)
+    for _ in range(50):
+        hedger.latency.record("disclosure.get_company", 0.01)
+    hedger._tokens = 5.0
+    return hedger
+
+
+def test_latency_percentile() -> None:
+    tracker = LatencyTracker()
+    assert tracker.percentile("x", 95) is None
+    for i in range(1, 101):
+        tracker.record("x", i / 100)
+    assert tracker.percentile("x", 95) == pytest.approx(0.95)
+    assert tracker.percentile("x", 50) == pytest.approx(0.50)
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged(make_client) -> None:
+    sdk = _sdk([1.0, 0.0], ["slow", "fast"])
+    client = make_client(sdk, "key-a", "key-b")
+    hedger = _warm_hedger()
+    result = await hedger.run(
+        client.disclosure.get_company(corp_code="1"), is_transient=_is_transient
+    )
+    assert result == "fast"
+    assert sdk.disclosure.get_company.await_count == 2
+    assert hedger.hedges_won == 1
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged(make_client) -> None:
+    sdk = _sdk([0.0], ["fast"])
+    client = make_client(sdk, "key-a", "key-b")
+    hedger = _warm_hedger()
+    result = await hedger.run(
+        client.disclosure.get_company(corp_code="1"), is_transient=_is_transient
+    )
+    assert result == "fast"
+    assert hedger.hedges_sent == 0
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_without_budget(make_client) -> None:
+    sdk = _sdk([0.2], ["slow"])
+    client = make_client(sdk, "key-a", "key-b")
+    hedger = _warm_hedger()
+    hedger._tokens = 0.0
+    result = await hedger.run(
+        client.disclosure.get_company(corp_code="1"), is_transient=_is_transient
+    )
+    assert result == "slow"
+    assert sdk.disclosure.get_company.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_disabled_hedger_never_hedges(make_client) -> None:
+    sdk = _sdk([0.2], ["slow"])
+    client = make_client(sdk, "key-a", "key-b")
+    hedger = _warm_hedger()
+    hedger.enabled = False
+    await hedger.run(
+        client.disclosure.get_company(corp_code="1"), is_transient=_is_transient
+    )
+    assert sdk.disclosure.get_company.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_transient_failure_defers_to_hedge(make_client) -> None:
+    sdk = _sdk([0.1, 0.2], [ServerError("800"), "ok"])
+    client = make_client(sdk, "key-a", "key-b")
+    hedger = _warm_hedger()
+    result = await hedger.run(
+        client.disclosure.get_company(corp_code="1"), is_transient=_is_transient
+    )
+    assert result == "ok"
+
+
+@pytest.mark.asyncio
+async def test_definitive_failure_is_raised_immediately(make_client) -> None:
+    sdk = _sdk([0.1, 1.0], [NotFoundError("013"), "late"])
+    client = make_client(sdk, "key-a", "key-b")
+    hedger = _warm_hedger()
+    with pytest.raises(NotFoundError):
+        await hedger.run(
+            client.disclosure.get_company(corp_code="1"), is_transient=_is_transient
+        )
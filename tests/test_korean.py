@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from opendart_fss_mcp.korean import (
+    bigram_terms,
+    bigram_tokens,
     extract_chosung,
     has_chosung,
     is_pure_chosung,
     normalize_mixed_query,
 )
 
-
 # -- extract_chosung -----------------------------------------------------------
 
 
@@ -80,3 +81,24 @@ def test_normalize_mixed_query_pure_chosung() -> None:
 
 def test_normalize_mixed_query_no_chosung() -> None:
     assert normalize_mixed_query("Samsung") == "samsung"
+
+
+# -- bigram_terms --------------------------------------------------------------
+
+
+def test_bigram_terms_hangul_and_words() -> None:
+    assert bigram_terms("유상증자 목적 R&D") == [
+        ["유상", "상증", "증자"],
+        ["목적"],
+        ["r"],
+        ["d"],
+    ]
+
+
+def test_bigram_terms_single_syllable() -> None:
+    assert bigram_terms("제 3자") == [["제"], ["3"], ["자"]]
+
+
+def test_bigram_tokens_joined() -> None:
+    assert bigram_tokens("횡령 배임") == "횡령 배임"
+    assert bigram_tokens("제3자배정") == "제 3 자배 배정"
@@ -0,0 +1,63 @@
+"""Tests for negative caching of NotFoundError results in deps.call_api."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+from fastmcp.exceptions import ToolError
+from opendart_fss.exceptions import RateLimitError
+
+from opendart_fss_mcp import deps
+from opendart_fss_mcp.client_pool import PooledClient
+from opendart_fss_mcp.response_cache import ResponseCache
+
+
+@pytest.fixture
+def client(make_client) -> tuple[PooledClient, AsyncMock]:
+    sdk = AsyncMock()
+    # the SDK raises "013 조회된 데이타가 없습니다" as RateLimitError
+    sdk.report.get_dividends.side_effect = RateLimitError(
+        "013", "조회된 데이타가 없습니다."
+    )
+    return make_client(sdk), sdk
+
+
+@pytest.mark.asyncio
+async def test_not_found_is_replayed_without_upstream_call(client) -> None:
+    pooled, sdk = client
+    for _ in range(3):
+        with pytest.raises(ToolError, match="조회된 데이타가 없습니다"):
+            await deps.call_api(
+                pooled.report.get_dividends(
+                    corp_code="00126380", bsns_year="2024", reprt_code="11011"
+                )
+            )
+    sdk.report.get_dividends.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_different_arguments_are_cached_separately(client) -> None:
+    pooled, sdk = client
+    for year in ("2023", "2024"):
+        with pytest.raises(ToolError):
+            await deps.call_api(
+                pooled.report.get_dividends(
+                    corp_code="00126380", bsns_year=year, reprt_code="11011"
+                )
+            )
+    assert sdk.report.get_dividends.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_disables_negative_cache(client, monkeypatch) -> None:
+    pooled, sdk = client
+    monkeypatch.setattr(deps, "_not_found", ResponseCache(16, ttl=0))
+    for _ in range(2):
+        with pytest.raises(ToolError):
+            await deps.call_api(
+                pooled.report.get_dividends(
+                    corp_code="00126380", bsns_year="2024", reprt_code="11011"
+                )
+            )
+    assert sdk.report.get_dividends.await_count == 2
@@ -0,0 +1,104 @@
+"""Tests for projection module."""
+
+from __future__ import annotations
+
+import pytest
+from fastmcp.exceptions import ToolError
+from opendart_fss.models.financial import FinancialAccount
+
+from opendart_fss_mcp.projection import shape_rows, to_columnar
+from opendart_fss_mcp.xbrl_facts import Fact
+
+ROWS = [
+    FinancialAccount(rcept_no="1", sj_div="BS", account_nm="자산총계", ord="1"),
+    FinancialAccount(rcept_no="1", sj_div="BS", account_nm="부채총계", ord="2"),
+    FinancialAccount(rcept_no="1", sj_div="IS", account_nm="매출액", ord="3"),
+    FinancialAccount(rcept_no="1", sj_div="CIS", account_nm="총포괄손익", ord="4"),
+]
+
+
+def test_no_options_returns_structs_untouched() -> None:
+    assert shape_rows(ROWS) is ROWS
+
+
+def test_fields_projection() -> None:
+    rows = shape_rows(ROWS, fields=["account_nm", "sj_div"])
+    assert rows[0] == {"account_nm": "자산총계", "sj_div": "BS"}
+    assert list(rows[0]) == ["account_nm", "sj_div"]
+
+
+def test_limit() -> None:
+    assert len(shape_rows(ROWS, limit=2)) == 2
+
+
+def test_filter_exact_match() -> None:
+    rows = shape_rows(ROWS, filters={"sj_div": "IS"})
+    assert [r.account_nm for r in rows] == ["매출액"]
+
+
+def test_filter_any_of() -> None:
+    rows = shape_rows(ROWS, filters={"sj_div": ["IS", "CIS"]})
+    assert [r.account_nm for r in rows] == ["매출액", "총포괄손익"]
+
+
+def test_filter_list_field_by_element() -> None:
+    facts = [
+        Fact("ifrs-full:Revenue", "c1", "2024-01-01/2024-12-31", "KRW", "10"),
+        Fact(
+            "ifrs-full:Revenue",
+            "c2",
+            "2024-01-01/2024-12-31",
+            "KRW",
+            "4",
+            dimensions=["ifrs-full:SegmentsAxis=entity:MemorySegmentMember"],
+        ),
+    ]
+    rows = shape_rows(
+        facts,
+        filters={"dimensions": "ifrs-full:SegmentsAxis=entity:MemorySegmentMember"},
+    )
+    assert [r.context for r in rows] == ["c2"]
+
+
+def test_filter_then_limit_then_project() -> None:
+    rows = shape_rows(ROWS, filters={"sj_div": "BS"}, limit=1, fields=["account_nm"])
+    assert rows == [{"account_nm": "자산총계"}]
+
+
+def test_unknown_field_raises() -> None:
+    with pytest.raises(ToolError, match="알 수 없는 필드: nope"):
+        shape_rows(ROWS, fields=["nope"])
+    with pytest.raises(ToolError, match="알 수 없는 필드"):
+        shape_rows(ROWS, filters={"nope": "x"})
+
+
+def test_empty_rows() -> None:
+    assert shape_rows([], fields=["nope"]) == []
+
+
+# -- Columnar format -----------------------------------------------------------
+
+
+def test_columnar_hoists_constant_columns() -> None:
+    table = to_columnar(ROWS)
+    assert table["constants"]["rcept_no"] == "1"
+    assert table["constants"]["corp_code"] is None
+    assert table["columns"] == ["sj_div", "account_nm", "ord"]
+    assert table["rows"][2] == ("IS", "매출액", "3")
+
+
+def test_columnar_from_projected_dicts() -> None:
+    rows = shape_rows(ROWS, fields=["sj_div", "account_nm"])
+    table = to_columnar(rows)
+    assert table["columns"] == ["sj_div", "account_nm"]
+    assert len(table["rows"]) == len(ROWS)
+
+
+def test_columnar_single_row_keeps_all_columns() -> None:
+    table = to_columnar(ROWS[:1])
+    assert table["constants"] == {}
+    assert "rcept_no" in table["columns"]
+
+
+def test_columnar_empty() -> None:
+    assert to_columnar([]) == {"columns": [], "constants": {}, "rows": []}
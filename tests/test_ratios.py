@@ -0,0 +1,97 @@
+"""Tests for ratios module."""
+
+from __future__ import annotations
+
+import math
+
+from opendart_fss.models.financial import FinancialAccount
+
+from opendart_fss_mcp.ratios import RATIOS, pivot, ratio_rows
+
+
+def _row(
+    sj_div: str,
+    account_id: str,
+    account_nm: str,
+    current: str,
+    prior: str | None = None,
+    **extra: str,
+) -> FinancialAccount:
+    return FinancialAccount(
+        rcept_no="1",
+        sj_div=sj_div,
+        account_id=account_id,
+        account_nm=account_nm,
+        thstrm_amount=current,
+        frmtrm_amount=prior,
+        **extra,
+    )
+
+
+ANNUAL = [
+    _row("BS", "ifrs-full_Assets", "자산총계", "1,000", "800"),
+    _row("BS", "ifrs-full_CurrentAssets", "유동자산", "400", "300"),
+    _row("BS", "ifrs-full_Liabilities", "부채총계", "400", "300"),
+    _row("BS", "ifrs-full_CurrentLiabilities", "유동부채", "200", "200"),
+    _row("BS", "ifrs-full_Equity", "자본총계", "600", "500"),
+    _row("IS", "ifrs-full_Revenue", "매출액", "2,000", "1,600"),
+    _row("IS", "ifrs-full_GrossProfit", "매출총이익", "800", "600"),
+    _row("IS", "dart_OperatingIncomeLoss", "영업이익", "300", "-100"),
+    _row("IS", "ifrs-full_ProfitLoss", "당기순이익", "110", "100"),
+    _row(
+        "CF",
+        "ifrs-full_CashFlowsFromUsedInOperatingActivities",
+        "영업활동현금흐름",
+        "500",
+    ),
+]
+
+
+def test_ratios_for_an_annual_report() -> None:
+    (row,) = ratio_rows(["00126380"], [ANNUAL])
+    assert row["corp_code"] == "00126380"
+    assert row["roe"] == 20.0  # 110 / avg(600, 500)
+    assert row["roa"] == 12.22  # 110 / avg(1000, 800)
+    assert row["operating_margin"] == 15.0
+    assert row["gross_margin"] == 40.0
+    assert row["debt_ratio"] == 66.67
+    assert row["equity_ratio"] == 60.0
+    assert row["current_ratio"] == 2.0
+    assert row["asset_turnover"] == 2.22
+    assert row["operating_cash_flow_margin"] == 25.0
+    assert row["revenue_growth"] == 25.0
+    assert row["net_income_growth"] == 10.0
+    assert row["operating_income_growth"] is None  # negative base
+
+
+def test_names_are_used_when_account_ids_are_nonstandard() -> None:
+    rows = [
+        _row("CIS", "-표준계정코드 미사용-", "수익(매출액)", "100"),
+        _row("CIS", "-표준계정코드 미사용-", "영업이익(손실)", "10"),
+    ]
+    (row,) = ratio_rows(["1"], [rows])
+    assert row["operating_margin"] == 10.0
+    assert row["roe"] is None
+
+
+def test_quarterly_flows_use_cumulative_amounts() -> None:
+    rows = [
+        _row(
+            "IS",
+            "ifrs-full_Revenue",
+            "매출액",
+            "300",
+            thstrm_add_amount="900",
+            frmtrm_add_amount="600",
+        )
+    ]
+    values = pivot([rows])
+    assert values.shape == (1, 10, 2)
+    assert list(values[0, 0]) == [900, 600]
+
+
+def test_companies_are_computed_together() -> None:
+    rows = ratio_rows(["a", "b"], [ANNUAL, []])
+    assert [r["corp_code"] for r in rows] == ["a", "b"]
+    assert all(rows[1][name] is None for name in RATIOS)
+    assert not math.isnan(rows[0]["roe"])
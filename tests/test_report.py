@@ -0,0 +1,163 @@
+"""Tests for the report snapshot and dividend history tools."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from fastmcp.exceptions import ToolError
+from opendart_fss import OpenDartClient
+from opendart_fss.exceptions import NotFoundError, ServerError
+from opendart_fss.models.report import DividendInfo, TreasuryStock
+
+from opendart_fss_mcp import dividend_history
+from opendart_fss_mcp.dividend_history import DividendStore, normalize_year
+from opendart_fss_mcp.tools.report import REPORT_SECTIONS, snapshot
+from opendart_fss_mcp.tools.report import dividend_history as history_tool
+
+
+def test_every_section_has_an_sdk_method() -> None:
+    report = OpenDartClient("key").report
+    assert all(hasattr(report, f"get_{section}") for section in REPORT_SECTIONS)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_merges_sections_and_reports_errors(make_client) -> None:
+    sdk = AsyncMock()
+    sdk.report.get_employees.return_value = []
+    sdk.report.get_dividends.side_effect = NotFoundError("013", "데이터 없음")
+    sdk.report.get_auditor_opinion.side_effect = ServerError("800", "시스템 점검")
+    client = make_client(sdk)
+
+    result = await snapshot.fn(
+        corp_code="00999002",
+        bsns_year="2024",
+        reprt_code="11011",
+        sections=["employees", "dividends", "auditor_opinion", "employees"],
+        client=client,
+    )
+    out = json.loads(result.content[0].text)
+    assert out["sections"] == {"employees": [], "dividends": []}
+    assert list(out["errors"]) == ["auditor_opinion"]
+    assert sdk.report.get_employees.await_count == 1
+    sdk.report.get_employees.assert_awaited_with(
+        corp_code="00999002", bsns_year="2024", reprt_code="11011"
+    )
+
+
+def _dividends(year: str) -> list[DividendInfo]:
+    dps = str(int(year) - 2000) + "00"
+    return [
+        DividendInfo(rcept_no="1", se="(연결)당기순이익(백만원)", thstrm="15,487,100"),
+        DividendInfo(rcept_no="1", se="(별도)당기순이익(백만원)", thstrm="25,397,099"),
+        DividendInfo(rcept_no="1", se="현금배당금총액(백만원)", thstrm="9,809,438"),
+        DividendInfo(rcept_no="1", se="(연결)현금배당성향(%)", thstrm="63.3"),
+        DividendInfo(
+            rcept_no="1", se="현금배당수익률(%)", stock_knd="보통주", thstrm="2.5"
+        ),
+        DividendInfo(
+            rcept_no="1", se="현금배당수익률(%)", stock_knd="우선주", thstrm="3.1"
+        ),
+        DividendInfo(
+            rcept_no="1", se="주당 현금배당금(원)", stock_knd="보통주", thstrm=dps
+        ),
+        DividendInfo(
+            rcept_no="1", se="주당 현금배당금(원)", stock_knd="우선주", thstrm="1,445"
+        ),
+    ]
+
+
+TREASURY = [
+    TreasuryStock(
+        rcept_no="1", acqs_mth1="배당가능이익범위 이내 취득", stock_knd="보통주"
+    ),
+    TreasuryStock(
+        rcept_no="1",
+        acqs_mth1="총계",
+        stock_knd="보통주",
+        change_qy_acqs="1,000",
+        change_qy_dsps="-",
+        change_qy_incnr="500",
+        trmend_qy="2,500",
+    ),
+    TreasuryStock(rcept_no="1", acqs_mth1="총계", stock_knd="우선주", trmend_qy="99"),
+]
+
+
+def test_normalize_year() -> None:
+    record = normalize_year(_dividends("2023"), TREASURY)
+    assert record["dps_common"] == 2300
+    assert record["dps_preferred"] == 1445
+    assert (record["yield_common"], record["yield_preferred"]) == (2.5, 3.1)
+    assert record["payout_ratio"] == 63.3
+    assert record["net_income"] == 15487100  # consolidated first
+    assert record["eps"] is None
+    assert record["treasury_acquired"] == 1000
+    assert record["treasury_disposed"] is None
+    assert record["treasury_shares"] == 2500
+
+
+@pytest.mark.asyncio
+async def test_dividend_history_reuses_closed_years(
+    tmp_path, monkeypatch, make_client
+) -> None:
+    monkeypatch.setattr(dividend_history, "_store", DividendStore(tmp_path))
+    sdk = AsyncMock()
+
+    async def get_dividends(*, corp_code, bsns_year, reprt_code):
+        if bsns_year == "2021":
+            raise ServerError("800", "시스템 점검")
+        return _dividends(bsns_year)
+
+    sdk.report.get_dividends.side_effect = get_dividends
+    sdk.report.get_treasury_stock.side_effect = NotFoundError("013", "데이터 없음")
+    client = make_client(sdk)
+
+    async def run() -> dict:
+        result = await history_tool.fn(
+            corp_code="00999003",
+            bgn_year=2021,
+            end_year=2023,
+            reprt_code="11011",
+            client=client,
+        )
+        return json.loads(result.content[0].text)
+
+    out = await run()
+    assert out["years"] == ["2021", "2022", "2023"]
+    assert out["series"]["dps_common"] == [None, 2200, 2300]
+    assert out["series"]["treasury_shares"] == [None, None, None]
+    assert list(out["errors"]) == ["2021"]
+
+    sdk.report.get_dividends.reset_mock()
+    again = await run()
+    assert again["series"] == out["series"]
+    requested = {
+        c.kwargs["bsns_year"] for c in sdk.report.get_dividends.await_args_list
+    }
+    assert requested == {"2021"}  # 2022 and 2023 came from the store
+    assert DividendStore(tmp_path).get("00999003", "11011").keys() == {"2022", "2023"}
+
+
+@pytest.mark.parametrize("corp_code", ["../../../etc/x", "0099900", "abcdefgh"])
+def test_store_rejects_malformed_corp_code(tmp_path, corp_code) -> None:
+    with pytest.raises(ValueError, match="8자리"):
+        DividendStore(tmp_path).get(corp_code, "11011")
+
+
+@pytest.mark.asyncio
+async def test_dividend_history_rejects_malformed_corp_code(
+    tmp_path, monkeypatch, make_client
+) -> None:
+    monkeypatch.setattr(dividend_history, "_store", DividendStore(tmp_path))
+    sdk = AsyncMock()
+    with pytest.raises(ToolError, match="corp_code"):
+        await history_tool.fn(
+            corp_code="../00999003",
+            bgn_year=2022,
+            end_year=2023,
+            reprt_code="11011",
+            client=make_client(sdk),
+        )
+    sdk.report.get_dividends.assert_not_called()
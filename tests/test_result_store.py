@@ -0,0 +1,50 @@
+"""Tests for result_store module."""
+
+from __future__ import annotations
+
+import msgspec
+import pytest
+from fastmcp.exceptions import ResourceError
+from opendart_fss.models.financial import FinancialAccount
+
+from opendart_fss_mcp.result_store import ResultStore
+
+ROWS = [
+    FinancialAccount(rcept_no="1", account_nm=f"계정{i}", ord=str(i))
+    for i in range(450)
+]
+
+
+def test_pages_cover_all_rows() -> None:
+    store = ResultStore()
+    stored = store.put(ROWS, page_size=200)
+    assert stored.page_count == 3
+    pages = [msgspec.json.decode(store.page(stored.result_id, p)) for p in (1, 2, 3)]
+    assert [len(p["data"]) for p in pages] == [200, 200, 50]
+    assert pages[0]["next"] == f"opendart://results/{stored.result_id}/2"
+    assert pages[2]["next"] is None
+    assert pages[2]["data"][-1]["account_nm"] == "계정449"
+
+
+def test_columnar_pages() -> None:
+    store = ResultStore()
+    stored = store.put(ROWS, format="columnar", page_size=100)
+    page = msgspec.json.decode(store.page(stored.result_id, 1))
+    assert page["data"]["columns"] == ["account_nm", "ord"]
+    assert len(page["data"]["rows"]) == 100
+
+
+def test_unknown_handle_and_page_raise() -> None:
+    store = ResultStore()
+    with pytest.raises(ResourceError):
+        store.page("missing", 1)
+    stored = store.put(ROWS)
+    with pytest.raises(ResourceError):
+        store.page(stored.result_id, 99)
+
+
+def test_expired_result_is_gone() -> None:
+    store = ResultStore(ttl=-1)
+    stored = store.put(ROWS)
+    with pytest.raises(ResourceError):
+        store.page(stored.result_id, 1)
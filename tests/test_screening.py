@@ -0,0 +1,161 @@
+"""Tests for screening module."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastmcp.exceptions import ToolError
+from opendart_fss.models.financial import FinancialAccount, FinancialIndicator
+
+from opendart_fss_mcp import disclosure_index, screening
+from opendart_fss_mcp.disclosure_index import DisclosureIndex
+from opendart_fss_mcp.screening import ScreeningStore, build_dataset, dataset_key
+from opendart_fss_mcp.tools.financial import screen_build
+
+
+@dataclass
+class _Company:
+    corp_code: str
+    corp_name: str
+    stock_code: str | None
+
+
+COMPANIES = [
+    _Company("001", "가나전자", "000010"),
+    _Company("002", "다라화학", "000020"),
+    _Company("003", "마바건설", "000030"),
+    _Company("004", "자료없음", "000040"),
+]
+
+
+def _accounts(corp_code: str, revenue: str, op: str, liabilities: str, equity: str):
+    def row(sj_div: str, name: str, amount: str, fs_div: str = "CFS"):
+        return FinancialAccount(
+            rcept_no="1",
+            corp_code=corp_code,
+            fs_div=fs_div,
+            sj_div=sj_div,
+            account_nm=name,
+            thstrm_amount=amount,
+        )
+
+    return [
+        row("IS", "매출액", revenue),
+        row("IS", "영업이익", op),
+        row("BS", "부채총계", liabilities),
+        row("BS", "자본총계", equity),
+        row("IS", "매출액", "1", fs_div="OFS"),  # other fs_div is ignored
+    ]
+
+
+ACCOUNTS = [
+    *_accounts("001", "1,000", "200", "300", "1,000"),  # margin 20, debt 30
+    *_accounts("002", "1,000", "100", "400", "1,000"),  # margin 10, debt 40
+    *_accounts("003", "1,000", "300", "2,000", "1,000"),  # margin 30, debt 200
+]
+INDICATORS = [
+    FinancialIndicator(rcept_no="1", corp_code="001", idx_nm="ROE", idx_val="12.5"),
+    FinancialIndicator(rcept_no="1", corp_code="003", idx_nm="ROE", idx_val="-"),
+]
+
+
+@pytest.fixture
+def dataset():
+    return build_dataset(
+        "2024_11011_CFS",
+        COMPANIES,
+        ACCOUNTS,
+        INDICATORS,
+        fs_div="CFS",
+        corp_classes={"001": "Y", "003": "K"},
+    )
+
+
+def test_companies_without_data_are_dropped(dataset) -> None:
+    assert dataset.corp_codes.tolist() == ["001", "002", "003"]
+    assert dataset.columns[-1] == "ROE"
+    assert dataset.summary()["with_market"] == 2
+
+
+def test_conditions_filter_and_rank(dataset) -> None:
+    rows = dataset.screen(
+        {"debt_ratio": "<50", "operating_margin": ">5"}, sort_by="operating_margin"
+    )
+    assert [r["corp_code"] for r in rows] == ["001", "002"]
+    assert rows[0]["operating_margin"] == 20.0
+    assert rows[0]["revenue"] == 1000.0
+
+    ranges = dataset.screen({"operating_margin": [">=10", "<30"]}, sort_by="debt_ratio")
+    assert [r["corp_code"] for r in ranges] == ["002", "001"]
+
+
+def test_market_filter_and_indicator_columns(dataset) -> None:
+    rows = dataset.screen({}, corp_cls="Y", columns=["ROE"])
+    assert rows == [
+        {
+            "corp_code": "001",
+            "corp_name": "가나전자",
+            "stock_code": "000010",
+            "corp_cls": "Y",
+            "ROE": 12.5,
+        }
+    ]
+    # a missing value fails every condition
+    assert [r["corp_code"] for r in dataset.screen({"ROE": ">-100"})] == ["001"]
+
+
+def test_invalid_conditions(dataset) -> None:
+    with pytest.raises(ToolError, match="알 수 없는 지표"):
+        dataset.screen({"per": "<10"})
+    with pytest.raises(ToolError, match="조건 형식 오류"):
+        dataset.screen({"roe": "about 10"})
+
+
+def test_store_round_trip(tmp_path, dataset) -> None:
+    ScreeningStore(tmp_path).put(dataset)
+    store = ScreeningStore(tmp_path)
+    assert store.keys() == ["2024_11011_CFS"]
+    loaded = store.get("2024_11011_CFS")
+    assert loaded is not None
+    assert loaded.columns == dataset.columns
+    assert loaded.screen({"debt_ratio": ">100"})[0]["corp_name"] == "마바건설"
+    assert store.get("2023_11011_CFS") is None
+
+
+@pytest.mark.parametrize(
+    ("bsns_year", "fs_div"),
+    [("../../2024", "CFS"), ("2024", "cfs"), ("2024", "x/../y")],
+)
+def test_dataset_key_rejects_malformed_parts(bsns_year, fs_div) -> None:
+    with pytest.raises(ValueError, match="bsns_year|fs_div"):
+        dataset_key(bsns_year, "11011", fs_div)
+
+
+def test_store_rejects_foreign_keys(tmp_path) -> None:
+    with pytest.raises(ValueError, match="데이터셋 키"):
+        ScreeningStore(tmp_path / "screening").get("../2024_11011_CFS")
+
+
+@pytest.mark.asyncio
+async def test_build_without_rows_is_not_stored(
+    tmp_path, monkeypatch, make_client
+) -> None:
+    store = ScreeningStore(tmp_path / "screening")
+    monkeypatch.setattr(screening, "_store", store)
+    monkeypatch.setattr(
+        disclosure_index, "_index", DisclosureIndex(tmp_path / "index.sqlite3")
+    )
+    cache = AsyncMock()
+    cache.listed.return_value = COMPANIES
+    sdk = AsyncMock()
+    sdk.financial.get_multi_account.return_value = [
+        row for row in ACCOUNTS if row.fs_div == "OFS"
+    ]
+    with (
+        patch("opendart_fss_mcp.tools.financial.get_cache", return_value=cache),
+        pytest.raises(ToolError, match="스크리닝 데이터 없음"),
+    ):
+        await screen_build.fn(bsns_year="2024", fs_div="CFS", client=make_client(sdk))
+    assert store.keys() == []
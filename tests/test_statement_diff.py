@@ -0,0 +1,64 @@
+"""Tests for statement_diff module."""
+
+from __future__ import annotations
+
+from opendart_fss.models.financial import FinancialAccount
+
+from opendart_fss_mcp.statement_diff import diff_statements
+
+
+def _row(
+    account_id: str, account_nm: str, amount: str, sj_div: str = "BS"
+) -> FinancialAccount:
+    return FinancialAccount(
+        rcept_no="1",
+        sj_div=sj_div,
+        account_id=account_id,
+        account_nm=account_nm,
+        account_detail="-",
+        thstrm_amount=amount,
+    )
+
+
+BEFORE = [
+    _row("ifrs-full_Assets", "자산총계", "1,000"),
+    _row("ifrs-full_Equity", "자본총계", "500"),
+    _row("-표준계정코드 미사용-", "기타 유동자산", "20"),
+    _row("ifrs-full_Goodwill", "영업권", "30"),
+]
+AFTER = [
+    _row("ifrs-full_Assets", "자산 총계", "1,100"),  # renamed, same ID
+    _row("ifrs-full_Equity", "자본총계", "500"),
+    _row("-표준계정코드 미사용-", "기타유동자산", "10"),
+    _row("ifrs-full_Inventories", "재고자산", "40"),
+]
+
+
+def test_lines_are_aligned_by_account_id() -> None:
+    lines, unchanged = diff_statements(BEFORE, AFTER)
+    assert unchanged == 1
+    assert [(x["account_nm"], x["status"]) for x in lines] == [
+        ("자산 총계", "changed"),
+        ("기타유동자산", "changed"),
+        ("재고자산", "added"),
+        ("영업권", "removed"),
+    ]
+    assets = lines[0]
+    assert (assets["before"], assets["after"], assets["change"]) == (1000, 1100, 100)
+    assert assets["change_pct"] == 10.0
+    assert lines[1]["change_pct"] == -50.0
+    assert lines[2]["before"] is None and lines[2]["change"] is None
+
+
+def test_small_changes_can_be_ignored() -> None:
+    lines, unchanged = diff_statements(BEFORE, AFTER, min_change_pct=20)
+    assert [x["account_nm"] for x in lines] == ["기타유동자산", "재고자산", "영업권"]
+    assert unchanged == 2
+
+
+def test_repeated_lines_are_matched_in_order() -> None:
+    before = [_row("x", "기타", "1", "SCE"), _row("x", "기타", "2", "SCE")]
+    after = [_row("x", "기타", "1", "SCE"), _row("x", "기타", "3", "SCE")]
+    lines, unchanged = diff_statements(before, after)
+    assert unchanged == 1
+    assert [(x["before"], x["after"]) for x in lines] == [(2, 3)]
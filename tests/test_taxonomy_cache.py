@@ -0,0 +1,83 @@
+"""Tests for taxonomy_cache module."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+from opendart_fss.models.financial import XbrlTaxonomy
+
+from opendart_fss_mcp.taxonomy_cache import SJ_DIVS, TaxonomyCache
+
+TAXONOMY = {
+    "BS": [
+        XbrlTaxonomy(
+            sj_div="BS",
+            account_id="ifrs-full_Assets",
+            label_kor="자산총계",
+            label_eng="Total assets",
+        ),
+    ],
+    "IS": [
+        XbrlTaxonomy(
+            sj_div="IS",
+            account_id="ifrs-full_Revenue",
+            label_kor="수익(매출액)",
+            label_eng="Revenue",
+        ),
+        XbrlTaxonomy(
+            sj_div="IS",
+            account_id="ifrs-full_RevenueFromRenderingOfServices",
+            label_kor="용역의 제공으로 인한 수익",
+            label_eng="Revenue from rendering of services",
+        ),
+    ],
+}
+
+
+def _sdk() -> AsyncMock:
+    sdk = AsyncMock()
+
+    async def get_xbrl_taxonomy(*, sj_div):
+        return TAXONOMY.get(sj_div, [])
+
+    sdk.financial.get_xbrl_taxonomy.side_effect = get_xbrl_taxonomy
+    return sdk
+
+
+@pytest.mark.asyncio
+async def test_all_statement_types_loaded_once_and_persisted(
+    tmp_path, make_client
+) -> None:
+    sdk = _sdk()
+    client = make_client(sdk)
+    cache = TaxonomyCache(tmp_path / "taxonomy.json")
+    assert [i.account_id for i in await cache.items(client, "is")] == [
+        "ifrs-full_Revenue",
+        "ifrs-full_RevenueFromRenderingOfServices",
+    ]
+    await cache.items(client, "BS")
+    assert sdk.financial.get_xbrl_taxonomy.await_count == len(SJ_DIVS)
+
+    restarted = TaxonomyCache(tmp_path / "taxonomy.json")
+    assert len(await restarted.items(client, "BS")) == 1
+    assert sdk.financial.get_xbrl_taxonomy.await_count == len(SJ_DIVS)
+
+
+@pytest.mark.asyncio
+async def test_search_by_id_and_labels(tmp_path, make_client) -> None:
+    client = make_client(_sdk())
+    cache = TaxonomyCache(tmp_path / "taxonomy.json")
+
+    by_id = await cache.lookup(client, "ifrs-full_Assets")
+    assert [i.label_kor for i in by_id] == ["자산총계"]
+
+    hits = await cache.search(client, "revenue")
+    assert [i.account_id for i in hits] == [
+        "ifrs-full_Revenue",  # exact English label first
+        "ifrs-full_RevenueFromRenderingOfServices",
+    ]
+    assert [i.account_id for i in await cache.search(client, "자산 총계")] == [
+        "ifrs-full_Assets"
+    ]
+    assert await cache.search(client, "매출액", sj_div="BS") == []
@@ -0,0 +1,107 @@
+"""Tests for xbrl_facts module."""
+
+from __future__ import annotations
+
+import io
+import zipfile
+
+import pytest
+
+from opendart_fss_mcp.xbrl_facts import XbrlFactStore, parse_instance
+
+RCEPT_NO = "20240312000736"
+INSTANCE = """<?xml version="1.0" encoding="utf-8"?>
+<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance"
+    xmlns:xbrldi="http://xbrl.org/2006/xbrldi"
+    xmlns:iso4217="http://www.xbrl.org/2003/iso4217"
+    xmlns:ifrs-full="http://xbrl.ifrs.org/taxonomy/2021-03-24/ifrs-full"
+    xmlns:dart="http://dart.fss.or.kr/xbrl/dart">
+  <ifrs-full:Revenue contextRef="CFY2023" unitRef="KRW" decimals="-6">300</ifrs-full:Revenue>
+  <xbrli:context id="CFY2023">
+    <xbrli:entity><xbrli:identifier scheme="x">00126380</xbrli:identifier></xbrli:entity>
+    <xbrli:period><xbrli:startDate>2023-01-01</xbrli:startDate><xbrli:endDate>2023-12-31</xbrli:endDate></xbrli:period>
+  </xbrli:context>
+  <xbrli:context id="CFY2023_Separate">
+    <xbrli:entity><xbrli:identifier scheme="x">00126380</xbrli:identifier>
+      <xbrli:segment><xbrldi:explicitMember dimension="ifrs-full:ConsolidatedAndSeparateFinancialStatementsAxis">ifrs-full:SeparateMember</xbrldi:explicitMember></xbrli:segment>
+    </xbrli:entity>
+    <xbrli:period><xbrli:startDate>2023-01-01</xbrli:startDate><xbrli:endDate>2023-12-31</xbrli:endDate></xbrli:period>
+  </xbrli:context>
+  <xbrli:context id="BPFY2023">
+    <xbrli:entity><xbrli:identifier scheme="x">00126380</xbrli:identifier></xbrli:entity>
+    <xbrli:period><xbrli:instant>2023-12-31</xbrli:instant></xbrli:period>
+  </xbrli:context>
+  <xbrli:unit id="KRW"><xbrli:measure>iso4217:KRW</xbrli:measure></xbrli:unit>
+  <xbrli:unit id="KRWPerShare"><xbrli:divide>
+    <xbrli:unitNumerator><xbrli:measure>iso4217:KRW</xbrli:measure></xbrli:unitNumerator>
+    <xbrli:unitDenominator><xbrli:measure>xbrli:shares</xbrli:measure></xbrli:unitDenominator>
+  </xbrli:divide></xbrli:unit>
+  <ifrs-full:Revenue contextRef="CFY2023_Separate" unitRef="KRW" decimals="-6">200</ifrs-full:Revenue>
+  <ifrs-full:Assets contextRef="BPFY2023" unitRef="KRW" decimals="-6">900</ifrs-full:Assets>
+  <ifrs-full:BasicEarningsLossPerShare contextRef="CFY2023" unitRef="KRWPerShare">2131</ifrs-full:BasicEarningsLossPerShare>
+  <dart:EntityName contextRef="CFY2023">삼성전자</dart:EntityName>
+  <dart:NotesTextBlock contextRef="CFY2023">{notes}</dart:NotesTextBlock>
+</xbrli:xbrl>
+""".replace("{notes}", "주석" * 1000)
+
+
+def _zip() -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("entity00126380_2023-12-31_lab-ko.xml", "<labels/>")
+        zf.writestr("entity00126380_2023-12-31.xbrl", INSTANCE)
+    return buf.getvalue()
+
+
+def test_facts_resolve_contexts_and_units() -> None:
+    facts = parse_instance(io.BytesIO(INSTANCE.encode()))
+    by_key = {(f.concept, f.context): f for f in facts}
+    revenue = by_key["ifrs-full:Revenue", "CFY2023"]
+    assert (revenue.period, revenue.unit, revenue.value, revenue.decimals) == (
+        "2023-01-01/2023-12-31",
+        "KRW",
+        "300",
+        "-6",
+    )
+    assert revenue.dimensions == []
+    assert by_key["ifrs-full:Revenue", "CFY2023_Separate"].dimensions == [
+        (
+            "ifrs-full:ConsolidatedAndSeparateFinancialStatementsAxis"
+            "=ifrs-full:SeparateMember"
+        )
+    ]
+    assert by_key["ifrs-full:Assets", "BPFY2023"].period == "2023-12-31"
+    eps = by_key["ifrs-full:BasicEarningsLossPerShare", "CFY2023"]
+    assert eps.unit == "KRW/xbrli:shares"
+    assert by_key["dart:EntityName", "CFY2023"].unit is None
+    assert not any(f.concept == "dart:NotesTextBlock" for f in facts)
+
+
+def test_store_parses_once_and_queries(tmp_path) -> None:
+    store = XbrlFactStore(tmp_path)
+    assert store.get(RCEPT_NO) is None
+    table = store.put(RCEPT_NO, _zip())
+    assert table.instance == "entity00126380_2023-12-31.xbrl"
+    assert table.summary()["periods"] == ["2023-12-31", "2023-01-01/2023-12-31"]
+
+    reloaded = XbrlFactStore(tmp_path).get(RCEPT_NO)  # read back from disk
+    assert reloaded is not None
+    revenue = reloaded.query(concepts=["revenue"])
+    assert [f.value for f in revenue] == ["300"]
+    both = reloaded.query(concepts=["revenue"], dimensional=True)
+    assert sorted(f.value for f in both) == ["200", "300"]
+    assert [f.concept for f in reloaded.query(period="2023-12-31")] == [
+        "ifrs-full:Revenue",
+        "ifrs-full:Assets",
+        "ifrs-full:BasicEarningsLossPerShare",
+        "dart:EntityName",
+    ]
+
+
+@pytest.mark.parametrize(
+    "rcept_no", ["../../etc/passwd", "2024031200073", "abcdefghijklmn"]
+)
+def test_store_rejects_malformed_rcept_no(tmp_path, rcept_no) -> None:
+    store = XbrlFactStore(tmp_path / "xbrl")
+    with pytest.raises(ValueError, match="14자리"):
+        store.get(rcept_no)